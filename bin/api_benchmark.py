@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+"""
+Translation benchmark for APIs with many routes.
+
+Translates a template with a single function that has one event per route of an explicit API, configured with a default
+authorizer and CORS, and prints the median translation time. The cost of wiring an API should grow linearly
+with its number of routes; compare the timings of a few route counts to check it.
+
+Usage:
+    python bin/api_benchmark.py [--api http|rest] [--routes N] [--runs N]
+"""
+import argparse
+import copy
+import os
+import sys
+import timeit
+
+my_path = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, my_path + "/..")
+
+# The translator needs a region. It is not used to call any service.
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+from samtranslator.parser.parser import Parser
+from samtranslator.translator.translator import Translator
+
+MANAGED_POLICY_MAP = {"AWSLambdaBasicExecutionRole": "arn:aws:iam::aws:policy/AWSLambdaBasicExecutionRole"}
+
+
+def make_http_api_template(routes):
+    """
+    :param int routes: Number of routes of the API
+    :return dict: SAM template with an HttpApi that has a JWT default authorizer, CORS and the given number of routes
+    """
+    events = {}
+    for index in range(routes):
+        events["Route{}".format(index)] = {
+            "Type": "HttpApi",
+            "Properties": {"ApiId": {"Ref": "MyApi"}, "Path": "/route{}".format(index), "Method": "GET"},
+        }
+    return {
+        "Transform": "AWS::Serverless-2016-10-31",
+        "Resources": {
+            "MyApi": {
+                "Type": "AWS::Serverless::HttpApi",
+                "Properties": {
+                    "Auth": {
+                        "Authorizers": {
+                            "JwtAuthorizer": {
+                                "IdentitySource": "$request.header.Authorization",
+                                "JwtConfiguration": {
+                                    "audience": ["audience"],
+                                    "issuer": "https://issuer.example.com",
+                                },
+                            }
+                        },
+                        "DefaultAuthorizer": "JwtAuthorizer",
+                    },
+                    "CorsConfiguration": {"AllowOrigins": ["https://example.com"], "AllowMethods": ["GET"]},
+                },
+            },
+            "MyFunction": {
+                "Type": "AWS::Serverless::Function",
+                "Properties": {
+                    "CodeUri": "s3://bucket/key",
+                    "Handler": "index.handler",
+                    "Runtime": "python3.8",
+                    "Events": events,
+                },
+            },
+        },
+    }
+
+
+def make_rest_api_template(routes):
+    """
+    :param int routes: Number of routes of the API
+    :return dict: SAM template with an Api that has a Lambda default authorizer, CORS, models, gateway responses and
+        the given number of routes
+    """
+    events = {}
+    for index in range(routes):
+        events["Route{}".format(index)] = {
+            "Type": "Api",
+            "Properties": {"RestApiId": {"Ref": "MyApi"}, "Path": "/route{}".format(index), "Method": "GET"},
+        }
+    return {
+        "Transform": "AWS::Serverless-2016-10-31",
+        "Resources": {
+            "MyApi": {
+                "Type": "AWS::Serverless::Api",
+                "Properties": {
+                    "StageName": "Prod",
+                    "Auth": {
+                        "Authorizers": {
+                            "LambdaAuthorizer": {"FunctionArn": {"Fn::GetAtt": ["MyAuthorizerFunction", "Arn"]}}
+                        },
+                        "DefaultAuthorizer": "LambdaAuthorizer",
+                        "ApiKeyRequired": True,
+                    },
+                    "Cors": "'https://example.com'",
+                    "GatewayResponses": {"DEFAULT_4XX": {"StatusCode": 400}},
+                    "Models": {"User": {"type": "object", "properties": {"name": {"type": "string"}}}},
+                },
+            },
+            "MyAuthorizerFunction": {
+                "Type": "AWS::Serverless::Function",
+                "Properties": {"CodeUri": "s3://bucket/key", "Handler": "index.authorize", "Runtime": "python3.8"},
+            },
+            "MyFunction": {
+                "Type": "AWS::Serverless::Function",
+                "Properties": {
+                    "CodeUri": "s3://bucket/key",
+                    "Handler": "index.handler",
+                    "Runtime": "python3.8",
+                    "Events": events,
+                },
+            },
+        },
+    }
+
+
+TEMPLATES = {"http": make_http_api_template, "rest": make_rest_api_template}
+
+
+def measure(template, runs):
+    """
+    :param dict template: SAM template to translate
+    :param int runs: Number of translations to time
+    :return float: Median translation time in milliseconds
+    """
+    translator = Translator(MANAGED_POLICY_MAP, Parser())
+    timings = []
+    for _ in range(runs):
+        sam_template = copy.deepcopy(template)
+        timings.append(timeit.timeit(lambda: translator.translate(sam_template, {}), number=1) * 1000)
+    return sorted(timings)[len(timings) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--api", choices=sorted(TEMPLATES), default="http", help="Type of API to translate")
+    parser.add_argument("--routes", type=int, default=500, help="Number of routes of the API")
+    parser.add_argument("--runs", type=int, default=5, help="Number of translations to time")
+    args = parser.parse_args()
+
+    median_ms = measure(TEMPLATES[args.api](args.routes), args.runs)
+    print("{} API with {} routes: median {:.1f} ms over {} runs".format(args.api, args.routes, median_ms, args.runs))
+
+
+if __name__ == "__main__":
+    main()
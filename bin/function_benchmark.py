@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+"""
+Micro-benchmarks of SamFunction.to_cloudformation.
+
+Translates a single function, with the arguments the translator passes, for 0, 5 and 50 events of mixed types
+(SQS, Kinesis, DynamoDB, SNS, Schedule, CloudWatchEvent, S3 and Api), without an alias, with an AutoPublishAlias, and
+with an AutoPublishAlias and a DeploymentPreference. Prints the median time of a call and the memory it allocates.
+
+Usage:
+    python bin/function_benchmark.py [--events N...] [--runs N]
+"""
+import argparse
+import copy
+import os
+import sys
+import timeit
+import tracemalloc
+
+my_path = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, my_path + "/..")
+
+# The translator needs a region. It is not used to call any service.
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+from samtranslator.intrinsics.resolver import IntrinsicsResolver
+from samtranslator.model.api.definition_collection import ApiDefinitionCollection
+from samtranslator.model.conditions import ConditionInterner
+from samtranslator.model.preferences.deployment_preference_collection import DeploymentPreferenceCollection
+from samtranslator.model.s3_utils.notification_collection import S3NotificationCollection
+from samtranslator.model.sam_resources import SamFunction
+from samtranslator.swagger.swagger import SwaggerEditor
+
+MANAGED_POLICY_MAP = {"AWSLambdaBasicExecutionRole": "arn:aws:iam::aws:policy/AWSLambdaBasicExecutionRole"}
+
+EVENTS = [
+    ("SQS", {"Queue": "arn:aws:sqs:us-east-1:123456789012:queue"}),
+    ("Kinesis", {"Stream": "arn:aws:kinesis:us-east-1:123456789012:stream/stream", "StartingPosition": "LATEST"}),
+    (
+        "DynamoDB",
+        {"Stream": "arn:aws:dynamodb:us-east-1:123456789012:table/table/stream/1", "StartingPosition": "LATEST"},
+    ),
+    ("SNS", {"Topic": "arn:aws:sns:us-east-1:123456789012:topic"}),
+    ("Schedule", {"Schedule": "rate(5 minutes)"}),
+    ("CloudWatchEvent", {"Pattern": {"source": ["aws.ec2"]}}),
+    ("S3", {"Bucket": {"Ref": "Bucket"}, "Events": "s3:ObjectCreated:*"}),
+    ("Api", {"RestApiId": {"Ref": "Api"}, "Method": "get"}),
+]
+
+VARIANTS = [
+    ("plain", {}),
+    ("alias", {"AutoPublishAlias": "live"}),
+    ("alias+deployment", {"AutoPublishAlias": "live", "DeploymentPreference": {"Type": "Linear10PercentEvery1Minute"}}),
+]
+
+
+def make_resources(events, properties):
+    """
+    :param int events: Number of events of the function, of the types of EVENTS in turn
+    :param dict properties: Additional properties of the function
+    :return dict: Resources of a template with the function, as `Function`, and the bucket and API of its events
+    """
+    function_events = {}
+    for index in range(events):
+        event_type, event_properties = EVENTS[index % len(EVENTS)]
+        event_properties = copy.deepcopy(event_properties)
+        if event_type == "Api":
+            event_properties["Path"] = "/route{}".format(index)
+        function_events["Event{}".format(index)] = {"Type": event_type, "Properties": event_properties}
+    function_properties = {
+        "CodeUri": "s3://bucket/function.zip",
+        "Handler": "index.handler",
+        "Runtime": "python3.8",
+        "Policies": [
+            "AWSLambdaBasicExecutionRole",
+            {"Statement": [{"Effect": "Allow", "Action": "sqs:SendMessage", "Resource": "*"}]},
+        ],
+        "Environment": {"Variables": {"STAGE": "prod"}},
+        "Events": function_events,
+    }
+    function_properties.update(properties)
+    return {
+        "Function": {"Type": "AWS::Serverless::Function", "Properties": function_properties},
+        "Bucket": {"Type": "AWS::S3::Bucket"},
+        "Api": {
+            "Type": "AWS::Serverless::Api",
+            "Properties": {"StageName": "Prod", "DefinitionBody": SwaggerEditor.gen_skeleton()},
+        },
+    }
+
+
+def translate(resources):
+    """
+    Translates the function of the resources like the translator does
+
+    :return list: CloudFormation resources of the function
+    """
+    function = SamFunction.from_dict("Function", resources["Function"])
+    kwargs = function.resources_to_link(resources)
+    kwargs["managed_policy_map"] = MANAGED_POLICY_MAP
+    kwargs["intrinsics_resolver"] = IntrinsicsResolver({})
+    kwargs["mappings_resolver"] = IntrinsicsResolver({})
+    kwargs["deployment_preference_collection"] = DeploymentPreferenceCollection()
+    kwargs["condition_interner"] = ConditionInterner({})
+    kwargs["s3_notification_collection"] = S3NotificationCollection()
+    kwargs["api_definition_collection"] = ApiDefinitionCollection()
+    return function.to_cloudformation(**kwargs)
+
+
+def measure(events, properties, runs):
+    """
+    :return tuple: Median time of a translation in microseconds, and memory it allocates in KiB
+    """
+    resources = make_resources(events, properties)
+    # Translations modify the resources they link to, like the bucket of S3 events, so each run gets a copy
+    copies = [copy.deepcopy(resources) for _ in range(runs + 1)]
+    translate(copies.pop())
+
+    timings = []
+    for run in range(runs):
+        timings.append(timeit.timeit(lambda: translate(copies[run]), number=1) * 1000000)
+
+    tracemalloc.start()
+    translate(copy.deepcopy(resources))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return sorted(timings)[len(timings) // 2], peak / 1024.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, nargs="+", default=[0, 5, 50], help="Numbers of events to measure")
+    parser.add_argument("--runs", type=int, default=200, help="Number of translations to time per case")
+    args = parser.parse_args()
+
+    print("{:>6}  {:<18}  {:>12}  {:>12}".format("events", "variant", "median us", "peak KiB"))
+    for events in args.events:
+        for name, properties in VARIANTS:
+            median_us, peak_kib = measure(events, properties, args.runs)
+            print("{:>6}  {:<18}  {:>12.1f}  {:>12.1f}".format(events, name, median_us, peak_kib))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+"""
+Import time benchmark for the translator.
+
+Measures how long a cold `import samtranslator.translator.transform` takes using `python -X importtime` and fails when
+the median over several runs exceeds the budget, or when a module that should only be loaded lazily is imported.
+Requires Python 3.7+ for `-X importtime`.
+
+Usage:
+    python bin/import_time.py [--runs N] [--budget-ms MS]
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+MODULE = "samtranslator.translator.transform"
+
+# Cumulative import time budget of MODULE, in milliseconds. Raise it only together with the change that needs it.
+IMPORT_TIME_BUDGET_MS = 250
+
+my_path = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, my_path + "/..")
+
+# Modules that must not be imported by MODULE. They are loaded on first use instead.
+from tests.translator.test_import_time import LAZY_MODULES
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)$")
+
+
+def measure_import(module=MODULE):
+    """
+    Imports the module in a fresh interpreter with `-X importtime`
+
+    :param string module: Name of the module to import
+    :return: Tuple of the cumulative import time of the module in milliseconds and the set of modules it imported
+    """
+    output = subprocess.check_output(
+        [sys.executable, "-X", "importtime", "-c", "import " + module],
+        stderr=subprocess.STDOUT,
+        cwd=os.path.join(my_path, ".."),
+    )
+    cumulative_ms = None
+    imported = set()
+    for line in output.decode("utf-8").splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        imported.add(match.group(4))
+        if match.group(4) == module:
+            cumulative_ms = int(match.group(2)) / 1000.0
+    return cumulative_ms, imported
+
+
+def eagerly_imported(imported):
+    """
+    :param set imported: Names of imported modules
+    :return list: Modules of LAZY_MODULES, or their submodules, found in `imported`
+    """
+    return sorted(name for name in imported for lazy in LAZY_MODULES if name == lazy or name.startswith(lazy + "."))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters to measure")
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_TIME_BUDGET_MS, help="Budget in milliseconds")
+    args = parser.parse_args()
+
+    timings = []
+    imported = set()
+    for _ in range(args.runs):
+        cumulative_ms, imported = measure_import()
+        timings.append(cumulative_ms)
+    median_ms = sorted(timings)[len(timings) // 2]
+
+    print(
+        "import {}: median {:.1f} ms over {} runs (budget {:.0f} ms)".format(
+            MODULE, median_ms, args.runs, args.budget_ms
+        )
+    )
+
+    failed = False
+    if median_ms > args.budget_ms:
+        print("Import time is over budget")
+        failed = True
+    eager = eagerly_imported(imported)
+    if eager:
+        print("Modules that should be imported lazily were imported: {}".format(", ".join(eager)))
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""
+Translation benchmark for templates with many functions.
+
+Translates a template of functions that each have an alias, a role with policies, and SQS and schedule events, and
+prints the median translation time, the number of CloudFormation resource objects generated along with the memory
+they take, and the peak memory allocated by a translation.
+
+Usage:
+    python bin/large_template_benchmark.py [--functions N] [--runs N]
+"""
+import argparse
+import copy
+import os
+import sys
+import timeit
+import tracemalloc
+
+my_path = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, my_path + "/..")
+
+# The translator needs a region. It is not used to call any service.
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+from samtranslator.parser.parser import Parser
+from samtranslator.translator.translator import Translator
+
+MANAGED_POLICY_MAP = {"AWSLambdaBasicExecutionRole": "arn:aws:iam::aws:policy/AWSLambdaBasicExecutionRole"}
+
+
+def make_template(functions):
+    """
+    :param int functions: Number of functions of the template
+    :return dict: SAM template with the given number of functions
+    """
+    resources = {}
+    for index in range(functions):
+        resources["Function{}".format(index)] = {
+            "Type": "AWS::Serverless::Function",
+            "Properties": {
+                "CodeUri": "s3://bucket/function{}.zip".format(index),
+                "Handler": "index.handler",
+                "Runtime": "python3.8",
+                "AutoPublishAlias": "live",
+                "Policies": ["AWSLambdaBasicExecutionRole", {"SQSPollerPolicy": {"QueueName": "queue"}}],
+                "Environment": {"Variables": {"INDEX": str(index)}},
+                "Events": {
+                    "Queue": {"Type": "SQS", "Properties": {"Queue": "arn:aws:sqs:us-east-1:123456789012:queue"}},
+                    "Timer": {"Type": "Schedule", "Properties": {"Schedule": "rate(5 minutes)"}},
+                },
+            },
+        }
+    return {"Transform": "AWS::Serverless-2016-10-31", "Resources": resources}
+
+
+def measure_time(template, runs):
+    """
+    :return float: Median translation time in milliseconds
+    """
+    translator = Translator(MANAGED_POLICY_MAP, Parser())
+    timings = []
+    for _ in range(runs):
+        sam_template = copy.deepcopy(template)
+        timings.append(timeit.timeit(lambda: translator.translate(sam_template, {}), number=1) * 1000)
+    return sorted(timings)[len(timings) // 2]
+
+
+def measure_memory(template):
+    """
+    :return tuple: Number of generated resource objects, bytes they take, and peak bytes allocated by the translation
+    """
+    resources = []
+    translator = Translator(MANAGED_POLICY_MAP, Parser())
+    add_resource = translator._add_resource
+
+    def keep_resource(template, resource):
+        resources.append(resource)
+        add_resource(template, resource)
+
+    translator._add_resource = keep_resource
+    sam_template = copy.deepcopy(template)
+
+    tracemalloc.start()
+    translator.translate(sam_template, {})
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Only the objects themselves, not the property values they share with the translated template
+    resource_bytes = sum(
+        sys.getsizeof(resource) + (sys.getsizeof(resource.__dict__) if hasattr(resource, "__dict__") else 0)
+        for resource in resources
+    )
+    return len(resources), resource_bytes, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--functions", type=int, default=1000, help="Number of functions of the template")
+    parser.add_argument("--runs", type=int, default=5, help="Number of translations to time")
+    args = parser.parse_args()
+
+    template = make_template(args.functions)
+    median_ms = measure_time(template, args.runs)
+    count, resource_bytes, peak = measure_memory(template)
+    print("{} functions: median {:.1f} ms over {} runs".format(args.functions, median_ms, args.runs))
+    print("{} resource objects, {:.1f} KiB".format(count, resource_bytes / 1024.0))
+    print("peak allocated {:.1f} MiB".format(peak / 1024.0 / 1024.0))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,9 @@
 Known limitations: cannot transform CodeUri pointing at local directory.
 
 Usage:
-  sam-translate.py --template-file=sam-template.yaml [--verbose] [--output-template=<o>]
-  sam-translate.py package --template-file=sam-template.yaml --s3-bucket=my-bucket [--verbose] [--output-template=<o>]
-  sam-translate.py deploy --template-file=sam-template.yaml --s3-bucket=my-bucket --capabilities=CAPABILITY_NAMED_IAM --stack-name=my-stack [--verbose] [--output-template=<o>]
+  sam-translate.py --template-file=sam-template.yaml [--verbose] [--output-template=<o>] [--minimize] [--size-report]
+  sam-translate.py package --template-file=sam-template.yaml --s3-bucket=my-bucket [--verbose] [--output-template=<o>] [--minimize] [--size-report]
+  sam-translate.py deploy --template-file=sam-template.yaml --s3-bucket=my-bucket --capabilities=CAPABILITY_NAMED_IAM --stack-name=my-stack [--verbose] [--output-template=<o>] [--minimize] [--size-report]
 
 Options:
   --template-file=<i>       Location of SAM template to transform [default: template.yaml].
@@ -16,9 +16,10 @@ Options:
   --capabilities=<c>        Capabilities
   --stack-name=<n>          Unique name for your CloudFormation Stack
   --verbose                 Enables verbose logging
+  --minimize                Makes the CloudFormation template smaller without changing what is deployed
+  --size-report             Prints the size of the CloudFormation template per resource type and per SAM resource
 
 """
-import json
 import logging
 import os
 import platform
@@ -31,8 +32,11 @@ from docopt import docopt
 my_path = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, my_path + "/..")
 
+from samtranslator.parser.parser import Parser
 from samtranslator.public.translator import ManagedPolicyLoader
-from samtranslator.translator.transform import transform
+from samtranslator.translator.output import write_json
+from samtranslator.translator.output_size import analyze_template_size
+from samtranslator.translator.translator import Translator
 from samtranslator.yaml_helper import yaml_parse
 from samtranslator.model.exceptions import InvalidDocumentException
 from samtranslator.feature_toggle.feature_toggle import FeatureToggleLocalConfigProvider, FeatureToggle
@@ -101,13 +105,17 @@ def transform_template(input_file_path, output_file_path):
                 os.path.join(my_path, "..", "tests", "feature_toggle", "input", "feature_toggle_config.json")
             )
         )
-        cloud_formation_template = transform(sam_template, {}, ManagedPolicyLoader(iam_client), feature_toggle)
-        cloud_formation_template_prettified = json.dumps(cloud_formation_template, indent=2)
+        translator = Translator(
+            ManagedPolicyLoader(iam_client).load(), Parser(), minimize_output=cli_options.get("--minimize")
+        )
+        cloud_formation_template = translator.translate(sam_template, {}, feature_toggle=feature_toggle)
 
         with open(output_file_path, "w") as f:
-            f.write(cloud_formation_template_prettified)
+            write_json(cloud_formation_template, f)
 
         print("Wrote transformed CloudFormation template to: " + output_file_path)
+        if cli_options.get("--size-report"):
+            print(analyze_template_size(cloud_formation_template, translator.resource_sources).format())
     except InvalidDocumentException as e:
         errorMessage = reduce(lambda message, error: message + " " + error.message, e.causes, e.message)
         LOG.error(errorMessage)
@@ -0,0 +1,335 @@
+#!/usr/bin/env python
+"""
+Differential translation harness.
+
+Translates every template of tests/translator/input, in every partition, along with synthetic templates, with a
+reference and a candidate configuration of the translator, and compares the outputs. Changes meant to make translation
+faster must not change its output: a different logical id can make CloudFormation replace a resource.
+
+Each template is classified as:
+    identical       same output, or the same errors
+    hash-only       same output once the hashes in the logical ids of versions and deployments are ignored. Reported
+                    separately since those hashes are what make CloudFormation publish new versions and deployments
+    order-only      same output once lists are sorted
+    different       different output
+    error-mismatch  one configuration failed, or both failed with different errors
+
+The summary lists the differences, and the total and per-template translation times of both configurations. The exit
+code is 1 if any template is not identical, so that the harness can gate changes.
+
+Configurations are names of CONFIGURATIONS, or `module:function` for a function that takes the managed policy map and
+returns a translator. Templates are translated in parallel, one process per core; use --processes 1 for precise timings.
+
+Usage:
+    python bin/translation_diff.py [--reference NAME] [--candidate NAME] [--runs N] [--processes N] [--synthetic N...]
+        [--filter SUBSTRING] [--json FILE]
+"""
+import argparse
+import copy
+import glob
+import importlib
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+import traceback
+
+my_path = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, my_path + "/..")
+sys.path.insert(0, my_path)
+
+from mock import patch
+
+from samtranslator.model.exceptions import InvalidDocumentException
+from samtranslator.parser.parser import Parser
+from samtranslator.translator.cache import TranslationCache
+from samtranslator.translator.translator import Translator
+from samtranslator.yaml_helper import yaml_parse
+
+from tests.plugins.application.test_serverless_app_plugin import mock_get_region
+from tests.translator.helpers import get_template_parameter_values
+from tests.translator.test_translator import deep_sort_lists, mock_sar_service_call
+
+import api_benchmark
+import large_template_benchmark
+
+INPUT_FOLDER = os.path.join(my_path, "..", "tests", "translator", "input")
+
+PARTITIONS = [("aws", "ap-southeast-1"), ("aws-cn", "cn-north-1"), ("aws-us-gov", "us-gov-west-1")]
+
+# Resources whose logical ids end with a hash of their content
+HASHED_RESOURCE_TYPES = ("AWS::ApiGateway::Deployment", "AWS::Lambda::Version", "AWS::Lambda::LayerVersion")
+HASH_SUFFIX_REGEX = re.compile(r"^(.+?)([0-9a-f]{10,40})$")
+# Full hash in the description of deployments
+DEPLOYMENT_DESCRIPTION_REGEX = re.compile(r"(RestApi deployment id: )[0-9a-f]{40}")
+
+IDENTICAL = "identical"
+HASH_ONLY = "hash-only"
+ORDER_ONLY = "order-only"
+DIFFERENT = "different"
+ERROR_MISMATCH = "error-mismatch"
+CATEGORIES = [IDENTICAL, HASH_ONLY, ORDER_ONLY, DIFFERENT, ERROR_MISMATCH]
+
+# Number of differences listed per template
+MAX_DIFFERENCES = 5
+
+
+def make_translator(managed_policy_map):
+    return Translator(managed_policy_map, Parser())
+
+
+def make_cached_translator(managed_policy_map):
+    # Translations after the first one of each template are served from the cache
+    return Translator(managed_policy_map, Parser(), cache=TranslationCache())
+
+
+CONFIGURATIONS = {"reference": make_translator, "cache": make_cached_translator}
+
+
+def get_configuration(name):
+    if name in CONFIGURATIONS:
+        return CONFIGURATIONS[name]
+    module_name, _, function_name = name.partition(":")
+    if not function_name:
+        raise ValueError("Unknown configuration '{}'. Use one of {} or module:function".format(name, CONFIGURATIONS))
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def get_cases(synthetic_sizes, name_filter):
+    """
+    :return list: (name, partition, region, template path or None, synthetic template kind and size or None)
+    """
+    cases = []
+    for path in sorted(glob.glob(os.path.join(INPUT_FOLDER, "*.yaml"))):
+        name = os.path.splitext(os.path.basename(path))[0]
+        for partition, region in PARTITIONS:
+            cases.append(("{} [{}]".format(name, partition), partition, region, path, None))
+    for size in synthetic_sizes:
+        for kind in ("functions", "http", "rest"):
+            cases.append(("synthetic-{}-{} [aws]".format(kind, size), "aws", "us-east-1", None, (kind, size)))
+    return [case for case in cases if name_filter in case[0]]
+
+
+def load_template(path, synthetic):
+    if path:
+        with open(path, "r") as f:
+            # Like the end-to-end tests, parse through JSON to only have plain types
+            return json.loads(json.dumps(yaml_parse(f)))
+    kind, size = synthetic
+    if kind == "functions":
+        return large_template_benchmark.make_template(size)
+    return api_benchmark.TEMPLATES[kind](size)
+
+
+def get_managed_policy_map(partition):
+    return {
+        "AWSLambdaBasicExecutionRole": "arn:{}:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole".format(
+            partition
+        ),
+        "AmazonDynamoDBFullAccess": "arn:{}:iam::aws:policy/AmazonDynamoDBFullAccess".format(partition),
+        "AmazonDynamoDBReadOnlyAccess": "arn:{}:iam::aws:policy/AmazonDynamoDBReadOnlyAccess".format(partition),
+        "AWSLambdaRole": "arn:{}:iam::aws:policy/service-role/AWSLambdaRole".format(partition),
+    }
+
+
+def translate(configuration, template, partition, region, runs):
+    """
+    :return tuple: Outputs of the runs (a template, or the sorted error messages), and median time in milliseconds
+    """
+    translator = configuration(get_managed_policy_map(partition))
+    outputs = []
+    timings = []
+    with patch("boto3.session.Session.region_name", region), patch(
+        "samtranslator.plugins.application.serverless_app_plugin.ServerlessAppPlugin._sar_service_call",
+        mock_sar_service_call,
+    ), patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region):
+        for _ in range(runs):
+            sam_template = copy.deepcopy(template)
+            start = time.time()
+            try:
+                output = translator.translate(sam_template, get_template_parameter_values())
+            except InvalidDocumentException as e:
+                output = {"Errors": sorted(cause.message for cause in e.causes)}
+            except Exception as e:
+                output = {"Errors": ["{}: {}".format(type(e).__name__, e)]}
+            timings.append((time.time() - start) * 1000)
+            outputs.append(output)
+    return outputs, sorted(timings)[len(timings) // 2]
+
+
+def normalize_hashes(template):
+    """
+    :return dict: Copy of the template where the hashes that end the logical ids of versions and deployments, and the
+        hashes in the descriptions of deployments, are replaced with a placeholder
+    """
+    resources = template.get("Resources", {})
+    renames = {}
+    for logical_id, resource in resources.items():
+        if isinstance(resource, dict) and resource.get("Type") in HASHED_RESOURCE_TYPES:
+            match = HASH_SUFFIX_REGEX.match(logical_id)
+            if match:
+                renames[logical_id] = match.group(1) + "<hash>"
+    text = DEPLOYMENT_DESCRIPTION_REGEX.sub(r"\1<hash>", json.dumps(template, sort_keys=True))
+    for logical_id in sorted(renames, key=len, reverse=True):
+        text = text.replace(logical_id, renames[logical_id])
+    return json.loads(text)
+
+
+def get_differences(expected, actual, path=""):
+    """
+    :return list: Paths where the values differ, with the expected and actual values
+    """
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        differences = []
+        for key in sorted(set(expected) | set(actual), key=str):
+            if key not in actual:
+                differences.append("{}/{}: removed".format(path, key))
+            elif key not in expected:
+                differences.append("{}/{}: added".format(path, key))
+            else:
+                differences.extend(get_differences(expected[key], actual[key], "{}/{}".format(path, key)))
+        return differences
+    if isinstance(expected, list) and isinstance(actual, list) and len(expected) == len(actual):
+        differences = []
+        for index, (expected_item, actual_item) in enumerate(zip(expected, actual)):
+            differences.extend(get_differences(expected_item, actual_item, "{}/{}".format(path, index)))
+        return differences
+    if expected != actual:
+        return ["{}: {} != {}".format(path or "/", _shorten(expected), _shorten(actual))]
+    return []
+
+
+def classify(expected, actual):
+    """
+    :return tuple: Category of the difference between the outputs, and the differences
+    """
+    if expected == actual:
+        return IDENTICAL, []
+    if "Errors" in expected or "Errors" in actual:
+        return ERROR_MISMATCH, get_differences(expected, actual)
+    differences = get_differences(expected, actual)
+    if normalize_hashes(expected) == normalize_hashes(actual):
+        return HASH_ONLY, differences
+    if deep_sort_lists(expected) == deep_sort_lists(actual):
+        return ORDER_ONLY, differences
+    return DIFFERENT, differences
+
+
+def run_case(arguments):
+    (name, partition, region, path, synthetic), reference_name, candidate_name, runs = arguments
+    try:
+        template = load_template(path, synthetic)
+        reference_outputs, reference_ms = translate(get_configuration(reference_name), template, partition, region, 1)
+        candidate_outputs, candidate_ms = translate(
+            get_configuration(candidate_name), template, partition, region, runs
+        )
+        if runs > 1:
+            _, reference_ms = translate(get_configuration(reference_name), template, partition, region, runs)
+    except Exception:
+        return {"Name": name, "Category": ERROR_MISMATCH, "Differences": [traceback.format_exc()]}
+
+    # Every run of the candidate must give the reference output, from the first translation to the cached ones
+    category, differences = IDENTICAL, []
+    for output in candidate_outputs:
+        category, differences = classify(reference_outputs[0], output)
+        if category != IDENTICAL:
+            break
+    return {
+        "Name": name,
+        "Category": category,
+        "Differences": differences[:MAX_DIFFERENCES],
+        "ReferenceMs": reference_ms,
+        "CandidateMs": candidate_ms,
+    }
+
+
+def summarize(results, reference_name, candidate_name, top):
+    counts = dict((category, 0) for category in CATEGORIES)
+    for result in results:
+        counts[result["Category"]] += 1
+    timed = [result for result in results if "ReferenceMs" in result]
+    reference_ms = sum(result["ReferenceMs"] for result in timed)
+    candidate_ms = sum(result["CandidateMs"] for result in timed)
+
+    lines = ["Reference: {}, candidate: {}, {} templates".format(reference_name, candidate_name, len(results))]
+    lines.append("  ".join("{}: {}".format(category, counts[category]) for category in CATEGORIES))
+    lines.append(
+        "Total time: reference {:.0f} ms, candidate {:.0f} ms ({:+.1%})".format(
+            reference_ms, candidate_ms, (candidate_ms - reference_ms) / reference_ms if reference_ms else 0
+        )
+    )
+    lines.append("Largest time deltas (reference ms, candidate ms, delta):")
+    for result in sorted(timed, key=lambda result: -abs(result["CandidateMs"] - result["ReferenceMs"]))[:top]:
+        lines.append(
+            "  {:>10.1f} {:>10.1f} {:>+10.1f}  {}".format(
+                result["ReferenceMs"],
+                result["CandidateMs"],
+                result["CandidateMs"] - result["ReferenceMs"],
+                result["Name"],
+            )
+        )
+    for category in CATEGORIES[1:]:
+        for result in results:
+            if result["Category"] == category:
+                lines.append("{}: {}".format(category.upper(), result["Name"]))
+                lines.extend("    " + difference for difference in result["Differences"])
+
+    summary = {
+        "Reference": reference_name,
+        "Candidate": candidate_name,
+        "Counts": counts,
+        "ReferenceMs": reference_ms,
+        "CandidateMs": candidate_ms,
+        "Results": sorted(results, key=lambda result: result["Name"]),
+    }
+    return "\n".join(lines), summary
+
+
+def _shorten(value, length=120):
+    text = json.dumps(value, sort_keys=True)
+    return text if len(text) <= length else text[: length - 3] + "..."
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reference", default="reference", help="Configuration whose output is expected")
+    parser.add_argument("--candidate", default="cache", help="Configuration to compare with the reference")
+    parser.add_argument("--runs", type=int, default=3, help="Number of timed translations per template")
+    parser.add_argument("--processes", type=int, default=multiprocessing.cpu_count(), help="Number of processes")
+    parser.add_argument(
+        "--synthetic", type=int, nargs="*", default=[10, 200], help="Sizes of the synthetic templates to translate"
+    )
+    parser.add_argument("--filter", default="", help="Only translate the templates whose name contains this")
+    parser.add_argument("--top", type=int, default=10, help="Number of time deltas to list")
+    parser.add_argument("--json", help="File to write the summary to, as JSON")
+    args = parser.parse_args()
+
+    # Fail before starting the workers if a configuration does not exist
+    get_configuration(args.reference)
+    get_configuration(args.candidate)
+
+    cases = get_cases(args.synthetic, args.filter)
+    arguments = [(case, args.reference, args.candidate, args.runs) for case in cases]
+    if args.processes > 1:
+        pool = multiprocessing.Pool(args.processes)
+        try:
+            results = pool.map(run_case, arguments, chunksize=4)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [run_case(argument) for argument in arguments]
+
+    text, summary = summarize(results, args.reference, args.candidate, args.top)
+    print(text)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(summary, f, indent=2, sort_keys=True)
+
+    sys.exit(0 if summary["Counts"][IDENTICAL] == len(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
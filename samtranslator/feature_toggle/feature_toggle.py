@@ -1,14 +1,15 @@
 import os
 import sys
 import json
-import boto3
 import logging
-
-from botocore.config import Config
+import tempfile
+import threading
 
 my_path = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, my_path + "/..")
 
+from samtranslator.utils.files import replace_file
+
 LOG = logging.getLogger(__name__)
 
 
@@ -19,7 +20,12 @@ class FeatureToggle:
     """
 
     def __init__(self, config_provider):
-        self.feature_config = config_provider.config
+        self.config_provider = config_provider
+
+    @property
+    def feature_config(self):
+        # Read the provider's config on every query so that background refreshes are picked up
+        return self.config_provider.config
 
     def is_enabled_for_stage_in_region(self, feature_name, stage, region="default"):
         """
@@ -103,30 +109,171 @@ class FeatureToggleLocalConfigProvider(FeatureToggleConfigProvider):
 
 
 class FeatureToggleAppConfigConfigProvider(FeatureToggleConfigProvider):
-    """Feature toggle config provider which loads config from AppConfig."""
+    """
+    Feature toggle config provider which loads config from AppConfig.
+
+    Config is fetched once when the provider is created. When `refresh_interval` is set, a daemon thread polls
+    AppConfig again on that interval, passing the last seen `ClientConfigurationVersion` so that an unchanged config is
+    not downloaded again. When `cache_path` is set, the last known good config is persisted to that file and used on
+    the next cold start, in which case the first fetch happens in the background instead of blocking the constructor.
+    """
+
+    CLIENT_ID = "FeatureToggleAppConfigConfigProvider"
 
-    def __init__(self, application_id, environment_id, configuration_profile_id):
+    def __init__(
+        self,
+        application_id,
+        environment_id,
+        configuration_profile_id,
+        app_config_client=None,
+        refresh_interval=None,
+        cache_path=None,
+    ):
+        """
+        :param application_id: AppConfig application id
+        :param environment_id: AppConfig environment id
+        :param configuration_profile_id: AppConfig configuration profile id
+        :param app_config_client: Optional client exposing `get_configuration`. Defaults to a boto3 AppConfig client
+        :param refresh_interval: Optional number of seconds between background refreshes. No refresh if not set
+        :param cache_path: Optional path of the file used to persist the last known good config
+        """
         FeatureToggleConfigProvider.__init__(self)
+        self.application_id = application_id
+        self.environment_id = environment_id
+        self.configuration_profile_id = configuration_profile_id
+        self.app_config_client = app_config_client
+        self.refresh_interval = refresh_interval
+        self.cache_path = cache_path
+
+        # (ConfigurationVersion, config) pair. It is always replaced as a whole so that readers never need a lock and
+        # never observe a config together with the version of another one.
+        self._state = (None, {})
+        self._stop_event = threading.Event()
+        self._refresh_thread = None
+
+        cached_state = self._load_cache()
+        if cached_state is not None:
+            self._state = cached_state
+            self._start_refresh_thread(refresh_now=True)
+            return
+
         try:
             LOG.info("Loading feature toggle config from AppConfig...")
-            # Lambda function has 120 seconds limit
-            # (5 + 25) * 2, 60 seconds maximum timeout duration
-            client_config = Config(connect_timeout=5, read_timeout=25, retries={"total_max_attempts": 2})
-            self.app_config_client = boto3.client("appconfig", config=client_config)
-            response = self.app_config_client.get_configuration(
-                Application=application_id,
-                Environment=environment_id,
-                Configuration=configuration_profile_id,
-                ClientId="FeatureToggleAppConfigConfigProvider",
-            )
-            binary_config_string = response["Content"].read()
-            self.feature_toggle_config = json.loads(binary_config_string.decode("utf-8"))
+            self.refresh()
             LOG.info("Finished loading feature toggle config from AppConfig.")
         except Exception as ex:
             LOG.error("Failed to load config from AppConfig: {}. Using empty config.".format(ex))
             # There is chance that AppConfig is not available in a particular region.
-            self.feature_toggle_config = json.loads("{}")
+
+        self._start_refresh_thread(refresh_now=False)
 
     @property
     def config(self):
-        return self.feature_toggle_config
+        return self._state[1]
+
+    @property
+    def config_version(self):
+        return self._state[0]
+
+    def refresh(self):
+        """
+        Polls AppConfig once and swaps in the returned config if it is different from the current one. Exceptions
+        raised by the AppConfig client are propagated to the caller.
+
+        :return: True if a new config was loaded, False if AppConfig reported the current version as unchanged
+        """
+        current_version = self.config_version
+        kwargs = {
+            "Application": self.application_id,
+            "Environment": self.environment_id,
+            "Configuration": self.configuration_profile_id,
+            "ClientId": self.CLIENT_ID,
+        }
+        if current_version is not None:
+            kwargs["ClientConfigurationVersion"] = current_version
+
+        response = self._get_client().get_configuration(**kwargs)
+        binary_config_string = response["Content"].read()
+        version = response.get("ConfigurationVersion")
+
+        # AppConfig returns an empty body when the client already has the latest version
+        if not binary_config_string or (version is not None and version == current_version):
+            return False
+
+        self._state = (version, json.loads(binary_config_string.decode("utf-8")))
+        self._save_cache()
+        return True
+
+    def stop(self):
+        """
+        Stops the background refresh thread, if any, and waits for it to exit.
+        """
+        self._stop_event.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join()
+            self._refresh_thread = None
+
+    def _get_client(self):
+        if self.app_config_client is None:
+            import boto3
+            from botocore.config import Config
+
+            # Lambda function has 120 seconds limit
+            # (5 + 25) * 2, 60 seconds maximum timeout duration
+            client_config = Config(connect_timeout=5, read_timeout=25, retries={"total_max_attempts": 2})
+            self.app_config_client = boto3.client("appconfig", config=client_config)
+        return self.app_config_client
+
+    def _start_refresh_thread(self, refresh_now):
+        if not refresh_now and not self.refresh_interval:
+            return
+        self._refresh_thread = threading.Thread(target=self._refresh_loop, args=(refresh_now,))
+        self._refresh_thread.daemon = True
+        self._refresh_thread.start()
+
+    def _refresh_loop(self, refresh_now):
+        if refresh_now:
+            self._refresh_keeping_last_known_good()
+        while self.refresh_interval and not self._stop_event.wait(self.refresh_interval):
+            self._refresh_keeping_last_known_good()
+
+    def _refresh_keeping_last_known_good(self):
+        try:
+            if self.refresh():
+                LOG.info("Loaded feature toggle config version '{}' from AppConfig.".format(self.config_version))
+        except Exception as ex:
+            LOG.warning("Failed to refresh config from AppConfig: {}. Keeping the current config.".format(ex))
+
+    def _load_cache(self):
+        if not self.cache_path or not os.path.isfile(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, "r") as f:
+                cached = json.load(f)
+            return cached["ConfigurationVersion"], cached["Content"]
+        except (IOError, OSError, ValueError, KeyError, TypeError) as ex:
+            LOG.warning("Ignoring unreadable feature toggle config cache '{}': {}".format(self.cache_path, ex))
+            return None
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        version, config = self._state
+        cache_dir = os.path.dirname(os.path.abspath(self.cache_path))
+        temp_path = None
+        try:
+            # Write to a temporary file first so that a crash never leaves a partially written cache behind
+            fd, temp_path = tempfile.mkstemp(dir=cache_dir, prefix=".feature_toggle_cache")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"ConfigurationVersion": version, "Content": config}, f)
+            replace_file(temp_path, self.cache_path)
+            temp_path = None
+        except (IOError, OSError) as ex:
+            LOG.warning("Failed to persist feature toggle config cache '{}': {}".format(self.cache_path, ex))
+        finally:
+            # Not moved over the cache, so that failed writes do not pile up in the cache directory
+            if temp_path is not None:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
@@ -0,0 +1,104 @@
+import copy
+
+from samtranslator.intrinsics.actions import FindInMapAction
+from samtranslator.intrinsics.resolver import IntrinsicsResolver
+from samtranslator.sdk.parameter import SamParameterValues
+
+
+class ResolutionContext(object):
+    """
+    Parameter values and mappings of a translation, shared by the plugins and the resources that resolve intrinsics
+    against them. One context is created per translation: parameter values are merged with their defaults and the
+    pseudo parameters once, and the parameter and mapping resolvers are created on first use and then reused by every
+    plugin and resource.
+
+    The context is read only: its parameter values and mappings must not be changed through it.
+    """
+
+    def __init__(self, parameter_values, mappings, intrinsics_resolver=None):
+        """
+        :param dict parameter_values: Map of parameter names to their values, including defaults and pseudo parameters
+        :param dict mappings: Mappings section of the template
+        :param IntrinsicsResolver intrinsics_resolver: Resolver of the parameter values, to share with another context
+        """
+        self._parameter_values = parameter_values
+        self._mappings = mappings
+        self._intrinsics_resolver = intrinsics_resolver
+        self._mappings_resolver = None
+
+    @classmethod
+    def from_template(cls, sam_template, parameter_values, session=None):
+        """
+        Creates the context of the translation of a template
+
+        :param dict sam_template: SAM template
+        :param dict parameter_values: Parameter values provided by the user. They are not modified.
+        :param boto3.session.Session session: Session to read the region of the pseudo parameters from
+        :return ResolutionContext: Context with the parameter values merged with their defaults and the pseudo
+            parameters, and the mappings of the template
+        """
+        sam_parameter_values = SamParameterValues(parameter_values)
+        sam_parameter_values.add_default_parameter_values(sam_template)
+        sam_parameter_values.add_pseudo_parameter_values(session)
+        return cls(sam_parameter_values.parameter_values, sam_template.get("Mappings", {}))
+
+    @property
+    def parameter_values(self):
+        return self._parameter_values
+
+    @property
+    def mappings(self):
+        return self._mappings
+
+    @property
+    def intrinsics_resolver(self):
+        """
+        :return IntrinsicsResolver: Resolver of references to parameters
+        """
+        if self._intrinsics_resolver is None:
+            self._intrinsics_resolver = IntrinsicsResolver(self._parameter_values)
+        return self._intrinsics_resolver
+
+    @property
+    def mappings_resolver(self):
+        """
+        :return IntrinsicsResolver: Resolver of Fn::FindInMap to the mappings
+        """
+        if self._mappings_resolver is None:
+            self._mappings_resolver = IntrinsicsResolver(
+                self._mappings, {FindInMapAction.intrinsic_name: FindInMapAction()}
+            )
+        return self._mappings_resolver
+
+    def create_resolvers(self):
+        """
+        Creates the parameter and mappings resolvers now rather than on first use, so that invalid parameter values or
+        mappings are reported even if nothing is resolved
+
+        :return: Tuple of the resolver of references to parameters and the resolver of Fn::FindInMap
+        :raises InvalidDocumentException: If the parameter values or the mappings are not dictionaries
+        """
+        return self.intrinsics_resolver, self.mappings_resolver
+
+    def with_mappings(self, mappings):
+        """
+        Returns the context of the same parameter values with the given mappings, for templates whose mappings were
+        replaced after the context was created
+
+        :param dict mappings: Mappings section of the template
+        :return ResolutionContext: This context if it already has these mappings, or a new context that shares its
+            parameter resolver
+        """
+        if mappings is self._mappings or mappings == self._mappings:
+            return self
+        return ResolutionContext(self._parameter_values, mappings, self.intrinsics_resolver)
+
+    def resolve(self, value):
+        """
+        Resolves references to parameters, then Fn::FindInMap, in a copy of the value
+
+        :param value: Any primitive type (dict, array, string etc) whose values might contain intrinsic functions
+        :return: Value with parameter references and mappings replaced by their values. The input is not modified.
+        """
+        value = self.intrinsics_resolver.resolve_parameter_refs(copy.deepcopy(value))
+        return self.mappings_resolver.resolve_parameter_refs(value)
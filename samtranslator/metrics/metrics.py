@@ -0,0 +1,246 @@
+"""
+Metrics of translations. Translations record counts and latencies on a Metrics object, which aggregates them in memory
+and hands them to a MetricsPublisher in batches, from a background thread.
+
+Recording never blocks the translation: records go to a bounded buffer, and are dropped when the buffer is full.
+"""
+import json
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from six.moves import queue
+
+LOG = logging.getLogger(__name__)
+
+# Namespace of the metrics of the transform
+DEFAULT_NAMESPACE = "ServerlessTransform"
+
+# Number of seconds between two publications of the aggregated metrics
+DEFAULT_FLUSH_INTERVAL = 60
+
+# Number of records the buffer holds before new records are dropped
+DEFAULT_MAX_BUFFER_SIZE = 10000
+
+
+class Unit(object):
+    COUNT = "Count"
+    MILLISECONDS = "Milliseconds"
+
+
+class MetricsPublisher(object):
+    """Interface of the publishers that Metrics hands aggregated metrics to"""
+
+    def publish(self, namespace, metrics):
+        """
+        :param string namespace: Namespace of the metrics
+        :param list metrics: Metric data in the format of CloudWatch `put_metric_data`
+        """
+        raise NotImplementedError
+
+
+class CWMetricsPublisher(MetricsPublisher):
+    """Publishes metrics to CloudWatch"""
+
+    # Number of metric data CloudWatch accepts in one put_metric_data call
+    BATCH_SIZE = 20
+
+    def __init__(self, cloudwatch_client):
+        """
+        :param cloudwatch_client: boto3 CloudWatch client
+        """
+        self.cloudwatch_client = cloudwatch_client
+
+    def publish(self, namespace, metrics):
+        for index in range(0, len(metrics), self.BATCH_SIZE):
+            self.cloudwatch_client.put_metric_data(
+                Namespace=namespace, MetricData=metrics[index : index + self.BATCH_SIZE]
+            )
+
+
+class LocalMetricsPublisher(MetricsPublisher):
+    """Writes metrics as JSON lines to a file or a stream, for offline use"""
+
+    def __init__(self, path=None, stream=None):
+        """
+        :param string path: Path of the file the metrics are appended to
+        :param stream: Stream the metrics are written to, if no path is given. Defaults to stdout
+        """
+        self.path = path
+        self.stream = stream
+
+    def publish(self, namespace, metrics):
+        lines = "".join(
+            json.dumps({"Namespace": namespace, "Metric": metric}, default=str) + "\n" for metric in metrics
+        )
+        if self.path:
+            with open(self.path, "a") as f:
+                f.write(lines)
+        else:
+            stream = self.stream if self.stream is not None else sys.stdout
+            stream.write(lines)
+            stream.flush()
+
+
+class DummyMetricsPublisher(MetricsPublisher):
+    """Discards metrics"""
+
+    def publish(self, namespace, metrics):
+        pass
+
+
+class Metrics(object):
+    """
+    Aggregates the metrics recorded by translations and publishes them periodically. Counts are summed, and latencies
+    are published as statistic sets (sample count, sum, minimum and maximum), per metric name and dimensions.
+
+    The background thread that publishes the metrics starts with the first record. Call `close` to stop it and publish
+    what is left, for example before the process exits.
+    """
+
+    def __init__(
+        self,
+        namespace=DEFAULT_NAMESPACE,
+        metrics_publisher=None,
+        flush_interval=DEFAULT_FLUSH_INTERVAL,
+        max_buffer_size=DEFAULT_MAX_BUFFER_SIZE,
+        dimensions=None,
+    ):
+        """
+        :param string namespace: Namespace of the metrics
+        :param MetricsPublisher metrics_publisher: Publisher of the metrics. Defaults to DummyMetricsPublisher
+        :param int flush_interval: Number of seconds between two publications
+        :param int max_buffer_size: Number of records buffered before new records are dropped
+        :param list dimensions: Dimensions added to every metric, such as [{"Name": "Transform", "Value": "..."}]
+        """
+        self.namespace = namespace
+        self.metrics_publisher = metrics_publisher if metrics_publisher is not None else DummyMetricsPublisher()
+        self.flush_interval = flush_interval
+        self.dimensions = list(dimensions) if dimensions else []
+        self.dropped_count = 0
+        self._buffer = queue.Queue(max_buffer_size)
+        self._flush_lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def record_count(self, name, value=1, dimensions=None):
+        """
+        :param string name: Name of the metric
+        :param int value: Count to add
+        :param list dimensions: Dimensions of the metric, in addition to those of this object
+        """
+        self._record(name, Unit.COUNT, value, dimensions)
+
+    def record_latency(self, name, milliseconds, dimensions=None):
+        """
+        :param string name: Name of the metric
+        :param float milliseconds: Latency to record
+        :param list dimensions: Dimensions of the metric, in addition to those of this object
+        """
+        self._record(name, Unit.MILLISECONDS, milliseconds, dimensions)
+
+    @contextmanager
+    def timer(self, name, dimensions=None):
+        """
+        Records the latency of the wrapped block, whether it raises or not
+
+        :param string name: Name of the metric
+        :param list dimensions: Dimensions of the metric, in addition to those of this object
+        """
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.record_latency(name, (time.time() - start) * 1000, dimensions)
+
+    def flush(self):
+        """
+        Publishes the metrics recorded so far. Errors of the publisher are logged, not raised.
+        """
+        with self._flush_lock:
+            metrics = self._aggregate()
+            if not metrics:
+                return
+            try:
+                self.metrics_publisher.publish(self.namespace, metrics)
+            except Exception as ex:
+                LOG.warning("Failed to publish {} metrics: {}".format(len(metrics), ex))
+
+    def close(self):
+        """
+        Stops the background thread and publishes the metrics that are left
+        """
+        self._stop_event.set()
+        with self._thread_lock:
+            if self._thread is not None:
+                self._thread.join()
+                self._thread = None
+        self.flush()
+
+    def _record(self, name, unit, value, dimensions):
+        if self._thread is None and not self._stop_event.is_set():
+            self._start_thread()
+        try:
+            self._buffer.put_nowait((name, unit, value, tuple(_dimension_items(dimensions))))
+        except queue.Full:
+            # Not thread safe, but an approximate count of dropped records is enough
+            self.dropped_count += 1
+
+    def _start_thread(self):
+        with self._thread_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._flush_loop)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _flush_loop(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def _aggregate(self):
+        """
+        Drains the buffer and aggregates its records
+
+        :return list: Metric data in the format of CloudWatch `put_metric_data`
+        """
+        aggregates = OrderedDict()
+        while True:
+            try:
+                name, unit, value, dimensions = self._buffer.get_nowait()
+            except queue.Empty:
+                break
+            key = (name, unit, dimensions)
+            if key not in aggregates:
+                aggregates[key] = [0, 0, value, value]
+            aggregate = aggregates[key]
+            aggregate[0] += 1
+            aggregate[1] += value
+            aggregate[2] = min(aggregate[2], value)
+            aggregate[3] = max(aggregate[3], value)
+
+        metrics = []
+        for (name, unit, dimensions), (sample_count, total, minimum, maximum) in aggregates.items():
+            metric = {"MetricName": name}
+            if unit == Unit.COUNT:
+                metric["Value"] = total
+            else:
+                metric["StatisticValues"] = {
+                    "SampleCount": sample_count,
+                    "Sum": total,
+                    "Minimum": minimum,
+                    "Maximum": maximum,
+                }
+            metric["Unit"] = unit
+            metric["Dimensions"] = self.dimensions + [{"Name": key, "Value": value} for key, value in dimensions]
+            metrics.append(metric)
+        return metrics
+
+
+def _dimension_items(dimensions):
+    for dimension in dimensions or []:
+        yield dimension["Name"], dimension["Value"]
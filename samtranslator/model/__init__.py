@@ -1,12 +1,16 @@
 """ CloudFormation Resource serialization, deserialization, and validation """
-from six import string_types
+from six import add_metaclass, string_types
 
 import re
 import inspect
+import importlib
+import threading
 from samtranslator.model.exceptions import InvalidResourceException
 from samtranslator.plugins import LifeCycleEvents
 from samtranslator.model.tags.resource_tagging import get_tag_list
 
+_LOGICAL_ID_REGEX = re.compile(r"^[A-Za-z0-9]+$")
+
 
 class PropertyType(object):
     """Stores validation information for a CloudFormation resource property.
@@ -24,6 +28,52 @@ class PropertyType(object):
         self.supports_intrinsics = supports_intrinsics
 
 
+class _ResourceType(type):
+    """Metaclass of resources. It gives every resource class `__slots__` for the keywords and properties it adds to
+    those of its bases, so that resources store their attributes in fixed slots instead of a `__dict__` per instance.
+    Translating a large template creates tens of thousands of resources.
+
+    A class attribute named like one of the new slots is the default value of the slot. `Resource.__init__` sets every
+    slot to its default, which is None unless the class says otherwise.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        slot_defaults = {}
+        for base in reversed(bases):
+            slot_defaults.update(getattr(base, "_slot_defaults", {}))
+
+        names = list(namespace.get("_keywords", [])) + list(namespace.get("property_types") or [])
+        for base in bases:
+            names += getattr(base, "_keywords", []) + list(getattr(base, "property_types", None) or [])
+
+        slots = []
+        for attribute_name in names:
+            if attribute_name in slots:
+                continue
+            if attribute_name in slot_defaults:
+                # A class attribute would hide the slot of the base class
+                if attribute_name in namespace:
+                    slot_defaults[attribute_name] = namespace.pop(attribute_name)
+                continue
+            # A slot cannot share its name with a class attribute
+            slot_defaults[attribute_name] = namespace.pop(attribute_name, None)
+            if attribute_name.startswith("__") and not attribute_name.endswith("__"):
+                # Slots with private names are mangled. Such attributes are stored in a __dict__ instead.
+                if "__dict__" not in slots and not any(base.__dictoffset__ for base in bases):
+                    slots.append("__dict__")
+            else:
+                slots.append(attribute_name)
+
+        namespace["__slots__"] = tuple(slots)
+        namespace["_slot_defaults"] = slot_defaults
+        cls = super(_ResourceType, mcs).__new__(mcs, name, bases, namespace)
+        # Names that __setattr__ accepts: the keywords and properties of the class, but not those its bases may have
+        # and the class dropped
+        cls._attribute_names = frozenset(list(cls._keywords) + list(cls.property_types or []))
+        return cls
+
+
+@add_metaclass(_ResourceType)
 class Resource(object):
     """A Resource object represents an abstract entity that contains a Type and a Properties object. They map well to
     CloudFormation resources as well sub-types like AWS::Lambda::Function or `Events` section of
@@ -64,13 +114,12 @@ class Resource(object):
         :param attributes Dictionary of resource attributes and their values
         """
         self._validate_logical_id(logical_id)
+        for name, value in self._slot_defaults.items():
+            object.__setattr__(self, name, value)
         self.logical_id = logical_id
         self.relative_id = relative_id
         self.depends_on = depends_on
 
-        for name, _ in self.property_types.items():
-            setattr(self, name, None)
-
         self.resource_attributes = {}
         if attributes is not None:
             for attr, value in attributes.items():
@@ -136,8 +185,7 @@ class Resource(object):
         :rtype: bool
         :raises TypeError: if the logical id is invalid
         """
-        pattern = re.compile(r"^[A-Za-z0-9]+$")
-        if logical_id is not None and pattern.match(logical_id):
+        if logical_id is not None and _LOGICAL_ID_REGEX.match(logical_id):
             return True
         raise InvalidResourceException(logical_id, "Logical ids must be alphanumeric.")
 
@@ -223,7 +271,7 @@ class Resource(object):
         :param value: the value of the attribute to be set
         :raises InvalidResourceException: if an invalid property is provided
         """
-        if name in self._keywords or name in self.property_types:
+        if name in self._attribute_names:
             return super(Resource, self).__setattr__(name, value)
 
         raise InvalidResourceException(
@@ -454,23 +502,42 @@ class ResourceTypeResolver(object):
     def __init__(self, *modules):
         """Initializes the ResourceTypeResolver from the given modules.
 
-        :param modules: one or more Python modules containing Resource definitions
+        Modules can be given by name, in which case they are only imported the first time a resource type is resolved.
+        This keeps modules with many or expensive imports, like the event sources, off the import path of the
+        translator until a template actually needs them.
+
+        :param modules: one or more Python modules, or fully qualified module names, containing Resource definitions
         """
         self.resource_types = {}
+        self._pending_module_names = []
+        self._lock = threading.Lock()
         for module in modules:
-            # Get all classes in the specified module which have a class variable resource_type.
-            for _, resource_class in inspect.getmembers(
-                module,
-                lambda cls: inspect.isclass(cls)
-                and cls.__module__ == module.__name__
-                and hasattr(cls, "resource_type"),
-            ):
-                self.resource_types[resource_class.resource_type] = resource_class
+            if isinstance(module, string_types):
+                self._pending_module_names.append(module)
+            else:
+                self._add_module(module)
+
+    def _add_module(self, module):
+        # Get all classes in the specified module which have a class variable resource_type.
+        for _, resource_class in inspect.getmembers(
+            module,
+            lambda cls: inspect.isclass(cls) and cls.__module__ == module.__name__ and hasattr(cls, "resource_type"),
+        ):
+            self.resource_types[resource_class.resource_type] = resource_class
+
+    def _import_pending_modules(self):
+        with self._lock:
+            while self._pending_module_names:
+                self._add_module(importlib.import_module(self._pending_module_names[0]))
+                self._pending_module_names.pop(0)
 
     def can_resolve(self, resource_dict):
         if not isinstance(resource_dict, dict) or "Type" not in resource_dict:
             return False
 
+        if self._pending_module_names:
+            self._import_pending_modules()
+
         return resource_dict["Type"] in self.resource_types
 
     def resolve_resource_type(self, resource_dict):
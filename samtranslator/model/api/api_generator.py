@@ -70,6 +70,21 @@ class SharedApiUsagePlan(object):
 
 
 class ApiGenerator(object):
+    # Stages that edit the DefinitionBody, in the order `_edit_definition_body` applies them:
+    # - Cors adds an OPTIONS method to every path. It runs before Auth, so that the DefaultAuthorizer is added to those
+    #   methods when AddDefaultAuthorizerToCorsPreflight is set, and the ResourcePolicy covers them.
+    # - Auth adds the security definitions, the default authorizer and API key, and the resource policy.
+    # - GatewayResponses, BinaryMediaTypes and Models each edit their own section of the document and run after Auth.
+    # The OpenApi 3 post processing runs once all the stages are applied, as it moves the security definitions added
+    # by Auth and the definitions added by Models to `components`, and rewrites the OPTIONS methods added by Cors.
+    DEFINITION_BODY_STAGES = (
+        "_add_cors",
+        "_add_auth",
+        "_add_gateway_responses",
+        "_add_binary_media_types",
+        "_add_models",
+    )
+
     def __init__(
         self,
         logical_id,
@@ -148,6 +163,7 @@ class ApiGenerator(object):
         self.domain = domain
         self.description = description
         self.shared_api_usage_plan = shared_api_usage_plan
+        self._swagger_editor = None
 
     def _construct_rest_api(self):
         """Constructs and returns the ApiGateway RestApi.
@@ -182,17 +198,11 @@ class ApiGenerator(object):
                     self.logical_id, "The OpenApiVersion value must be of the format '3.0.0'."
                 )
 
-        self._add_cors()
-        self._add_auth()
-        self._add_gateway_responses()
-        self._add_binary_media_types()
-        self._add_models()
+        self._edit_definition_body()
 
         if self.definition_uri:
             rest_api.BodyS3Location = self._construct_body_s3_dict()
         elif self.definition_body:
-            # # Post Process OpenApi Auth Settings
-            self.definition_body = self._openapi_postprocess(self.definition_body)
             rest_api.Body = self.definition_body
 
         if self.name:
@@ -511,7 +521,7 @@ class ApiGenerator(object):
                 "'AllowOrigin' is \"'*'\" or not set",
             )
 
-        editor = SwaggerEditor(self.definition_body)
+        editor = self._get_swagger_editor()
         for path in editor.iter_on_path():
             editor.add_cors(
                 path,
@@ -522,9 +532,6 @@ class ApiGenerator(object):
                 allow_credentials=properties.AllowCredentials,
             )
 
-        # Assign the Swagger back to template
-        self.definition_body = editor.swagger
-
     def _add_binary_media_types(self):
         """
         Add binary media types to Swagger
@@ -537,12 +544,9 @@ class ApiGenerator(object):
         if self.binary_media and not self.definition_body:
             return
 
-        editor = SwaggerEditor(self.definition_body)
+        editor = self._get_swagger_editor()
         editor.add_binary_media_types(self.binary_media)
 
-        # Assign the Swagger back to template
-        self.definition_body = editor.swagger
-
     def _add_auth(self):
         """
         Add Auth configuration to the Swagger file, if necessary
@@ -566,7 +570,7 @@ class ApiGenerator(object):
                 "Unable to add Auth configuration because "
                 "'DefinitionBody' does not contain a valid Swagger definition.",
             )
-        swagger_editor = SwaggerEditor(self.definition_body)
+        swagger_editor = self._get_swagger_editor()
         auth_properties = AuthProperties(**self.auth)
         authorizers = self._get_authorizers(auth_properties.Authorizers, auth_properties.DefaultAuthorizer)
 
@@ -592,8 +596,6 @@ class ApiGenerator(object):
             if auth_properties.ResourcePolicy.get("CustomStatements"):
                 swagger_editor.add_custom_statements(auth_properties.ResourcePolicy.get("CustomStatements"))
 
-        self.definition_body = self._openapi_postprocess(swagger_editor.swagger)
-
     def _construct_usage_plan(self, rest_api_stage=None):
         """Constructs and returns the ApiGateway UsagePlan, ApiGateway UsagePlanKey, ApiGateway ApiKey for Auth.
 
@@ -760,7 +762,7 @@ class ApiGenerator(object):
                 "'DefinitionBody' does not contain a valid Swagger definition.",
             )
 
-        swagger_editor = SwaggerEditor(self.definition_body)
+        swagger_editor = self._get_swagger_editor()
 
         gateway_responses = {}
         for response_type, response in self.gateway_responses.items():
@@ -774,9 +776,6 @@ class ApiGenerator(object):
         if gateway_responses:
             swagger_editor.add_gateway_responses(gateway_responses)
 
-        # Assign the Swagger back to template
-        self.definition_body = swagger_editor.swagger
-
     def _add_models(self):
         """
         Add Model definitions to the Swagger file, if necessary
@@ -801,12 +800,37 @@ class ApiGenerator(object):
         if not all(isinstance(model, dict) for model in self.models.values()):
             raise InvalidResourceException(self.logical_id, "Invalid value for 'Models' property")
 
-        swagger_editor = SwaggerEditor(self.definition_body)
+        swagger_editor = self._get_swagger_editor()
         swagger_editor.add_models(self.models)
 
-        # Assign the Swagger back to template
+    def _edit_definition_body(self):
+        """
+        Applies the stages of `DEFINITION_BODY_STAGES` to the DefinitionBody, in order. The stages share a single
+        SwaggerEditor, so the document is copied into the editor once, when a stage first needs it, and written back
+        once, after the last stage. The OpenApi 3 post processing then runs on the written document.
+        """
+        for stage in self.DEFINITION_BODY_STAGES:
+            getattr(self, stage)()
 
-        self.definition_body = self._openapi_postprocess(swagger_editor.swagger)
+        if self._swagger_editor is not None:
+            self.definition_body = self._swagger_editor.swagger
+            self._swagger_editor = None
+
+        if self.definition_body and not self.definition_uri:
+            self.definition_body = self._openapi_postprocess(self.definition_body)
+
+    def _get_swagger_editor(self):
+        """
+        Returns the editor shared by the stages of `_edit_definition_body`, opening the DefinitionBody on first use.
+        Stages check the DefinitionBody before editing it. As no stage changes whether the document is a valid Swagger
+        or OpenApi document, they check the DefinitionBody as it was before the first stage.
+
+        :return SwaggerEditor: Editor of the DefinitionBody
+        :raises ValueError: If the DefinitionBody is not a valid Swagger document
+        """
+        if self._swagger_editor is None:
+            self._swagger_editor = SwaggerEditor(self.definition_body)
+        return self._swagger_editor
 
     def _openapi_postprocess(self, definition_body):
         """
@@ -966,18 +990,15 @@ class ApiGenerator(object):
                 + "' was not defined in 'Authorizers'.",
             )
 
-        for path in swagger_editor.iter_on_path():
-            swagger_editor.set_path_default_authorizer(
-                path,
-                default_authorizer,
-                authorizers=authorizers,
-                add_default_auth_to_preflight=add_default_auth_to_preflight,
-                api_authorizers=api_authorizers,
-            )
+        swagger_editor.set_default_authorizer(
+            default_authorizer,
+            authorizers=authorizers,
+            add_default_auth_to_preflight=add_default_auth_to_preflight,
+            api_authorizers=api_authorizers,
+        )
 
     def _set_default_apikey_required(self, swagger_editor):
-        for path in swagger_editor.iter_on_path():
-            swagger_editor.set_path_default_apikey_required(path)
+        swagger_editor.set_default_apikey_required()
 
     def _set_endpoint_configuration(self, rest_api, value):
         """
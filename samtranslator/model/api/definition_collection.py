@@ -0,0 +1,88 @@
+from collections import OrderedDict
+
+from samtranslator.open_api.open_api import OpenApiEditor
+from samtranslator.swagger.swagger import SwaggerEditor
+
+
+class ApiDefinitionCollection(object):
+    """
+    Collects the routes that the Api and HttpApi events of functions and state machines add to the DefinitionBody of
+    the APIs of a template.
+
+    Without the collection, every event opens the API definition in a new editor, which copies the whole document, and
+    writes a copy of it back to the API. The cost of wiring an API therefore grows with the square of its number of
+    routes. Events that share the collection apply their routes to a single editor per API instead, and the collection
+    writes each DefinitionBody once, when `write_definitions` is called after all functions and state machines have
+    been translated. The Auth configuration of each API is also resolved only once.
+    """
+
+    def __init__(self):
+        self._definitions = OrderedDict()
+        self._resolved_auth = {}
+
+    def get_swagger_editor(self, api):
+        """
+        Returns the SwaggerEditor holding the DefinitionBody of the given API, creating it on first use
+
+        :param dict api: Properties of the Serverless::Api
+        :return SwaggerEditor: Editor of the API definition, or None if the API has no DefinitionBody
+        :raises ValueError: If the DefinitionBody is not a valid Swagger document
+        """
+        return self._get_editor(api, SwaggerEditor)
+
+    def get_open_api_editor(self, api):
+        """
+        Returns the OpenApiEditor holding the DefinitionBody of the given API, creating it on first use
+
+        :param dict api: Properties of the Serverless::HttpApi
+        :return OpenApiEditor: Editor of the API definition, or None if the API has no DefinitionBody
+        :raises ValueError: If the DefinitionBody is not a valid OpenApi document
+        """
+        return self._get_editor(api, OpenApiEditor)
+
+    def get_resolved_auth(self, api, intrinsics_resolver):
+        """
+        Returns the Auth property of the API with parameter references resolved. It is resolved once per API.
+
+        :param dict api: Properties of the API
+        :param intrinsics_resolver: Resolver of parameter references
+        :return dict: Resolved Auth configuration, or None if the API has no Auth
+        """
+        key = id(api)
+        if key not in self._resolved_auth:
+            # Keep a reference to the API so that its id is not reused while the collection is alive
+            self._resolved_auth[key] = (api, intrinsics_resolver.resolve_parameter_refs(api.get("Auth")))
+        return self._resolved_auth[key][1]
+
+    def write_definitions(self):
+        """
+        Writes the definition of every API that events added routes to back to the API's DefinitionBody. Editors are
+        discarded afterwards, so events applied after this call start from the written definitions.
+        """
+        for api, editor in self._definitions.values():
+            _write_definition(api, editor)
+        self._definitions.clear()
+
+    def _get_editor(self, api, editor_class):
+        key = id(api)
+        if key in self._definitions:
+            editor = self._definitions[key][1]
+            if isinstance(editor, editor_class):
+                return editor
+            # The API was edited as the other kind of document. Write those changes before reopening it.
+            _write_definition(api, editor)
+            del self._definitions[key]
+
+        definition_body = api.get("DefinitionBody")
+        if definition_body is None:
+            return None
+        editor = editor_class(definition_body)
+        self._definitions[key] = (api, editor)
+        return editor
+
+
+def _write_definition(api, editor):
+    if isinstance(editor, SwaggerEditor):
+        api["DefinitionBody"] = editor.swagger
+    else:
+        api["DefinitionBody"] = editor.openapi
@@ -86,6 +86,7 @@ class HttpApiGenerator(object):
         self.fail_on_warnings = fail_on_warnings
         self.description = description
         self.disable_execute_api_endpoint = disable_execute_api_endpoint
+        self._open_api_editor = None
 
     def _construct_http_api(self):
         """Constructs and returns the ApiGatewayV2 HttpApi.
@@ -114,6 +115,8 @@ class HttpApiGenerator(object):
 
         self._add_description()
 
+        self._write_definition_body()
+
         if self.definition_uri:
             http_api.BodyS3Location = self._construct_body_s3_dict()
         elif self.definition_body:
@@ -144,16 +147,13 @@ class HttpApiGenerator(object):
             raise InvalidResourceException(
                 self.logical_id, "DisableExecuteApiEndpoint works only within 'DefinitionBody' property."
             )
-        editor = OpenApiEditor(self.definition_body)
+        editor = self._get_open_api_editor()
 
         # if DisableExecuteApiEndpoint is set in both definition_body and as a property,
         # SAM merges and overrides the disableExecuteApiEndpoint in definition_body with headers of
         # "x-amazon-apigateway-endpoint-configuration"
         editor.add_endpoint_config(self.disable_execute_api_endpoint)
 
-        # Assign the OpenApi back to template
-        self.definition_body = editor.openapi
-
     def _add_cors(self):
         """
         Add CORS configuration if CORSConfiguration property is set in SAM.
@@ -202,7 +202,7 @@ class HttpApiGenerator(object):
                 "'AllowOrigin' is \"'*'\" or not set.",
             )
 
-        editor = OpenApiEditor(self.definition_body)
+        editor = self._get_open_api_editor()
         # if CORS is set in both definition_body and as a CorsConfiguration property,
         # SAM merges and overrides the cors headers in definition_body with headers of CorsConfiguration
         editor.add_cors(
@@ -214,9 +214,6 @@ class HttpApiGenerator(object):
             properties.AllowCredentials,
         )
 
-        # Assign the OpenApi back to template
-        self.definition_body = editor.openapi
-
     def _construct_api_domain(self, http_api):
         """
         Constructs and returns the ApiGateway Domain and BasepathMapping
@@ -415,7 +412,7 @@ class HttpApiGenerator(object):
                 self.logical_id,
                 "Unable to add Auth configuration because 'DefinitionBody' does not contain a valid OpenApi definition.",
             )
-        open_api_editor = OpenApiEditor(self.definition_body)
+        open_api_editor = self._get_open_api_editor()
         auth_properties = AuthProperties(**self.auth)
         authorizers = self._get_authorizers(auth_properties.Authorizers, auth_properties.DefaultAuthorizer)
 
@@ -424,7 +421,6 @@ class HttpApiGenerator(object):
         self._set_default_authorizer(
             open_api_editor, authorizers, auth_properties.DefaultAuthorizer, auth_properties.Authorizers
         )
-        self.definition_body = open_api_editor.openapi
 
     def _add_tags(self):
         """
@@ -450,11 +446,10 @@ class HttpApiGenerator(object):
             self.tags = {}
         self.tags[HttpApiTagName] = "SAM"
 
-        open_api_editor = OpenApiEditor(self.definition_body)
+        open_api_editor = self._get_open_api_editor()
 
         # authorizers is guaranteed to return a value or raise an exception
         open_api_editor.add_tags(self.tags)
-        self.definition_body = open_api_editor.openapi
 
     def _set_default_authorizer(self, open_api_editor, authorizers, default_authorizer, api_authorizers):
         """
@@ -484,10 +479,9 @@ class HttpApiGenerator(object):
                 + "' was not defined in 'Authorizers'.",
             )
 
-        for path in open_api_editor.iter_on_path():
-            open_api_editor.set_path_default_authorizer(
-                path, default_authorizer, authorizers=authorizers, api_authorizers=api_authorizers
-            )
+        open_api_editor.set_default_authorizer(
+            default_authorizer, authorizers=authorizers, api_authorizers=api_authorizers
+        )
 
     def _get_authorizers(self, authorizers_config, default_authorizer=None):
         """
@@ -611,9 +605,29 @@ class HttpApiGenerator(object):
                 "'DefinitionBody' property.",
             )
 
-        open_api_editor = OpenApiEditor(self.definition_body)
+        open_api_editor = self._get_open_api_editor()
         open_api_editor.add_description(self.description)
-        self.definition_body = open_api_editor.openapi
+
+    def _get_open_api_editor(self):
+        """
+        Returns the editor of the DefinitionBody. CORS, Auth, Tags, endpoint configuration and Description are all
+        applied to the same editor, which opens the DefinitionBody on first use, and the result is written back once
+        by `_write_definition_body`, instead of copying the whole document in and out for every one of them.
+
+        :return OpenApiEditor: Editor of the DefinitionBody
+        :raises ValueError: If the DefinitionBody is not a valid OpenApi document
+        """
+        if self._open_api_editor is None:
+            self._open_api_editor = OpenApiEditor(self.definition_body)
+        return self._open_api_editor
+
+    def _write_definition_body(self):
+        """
+        Writes the changes made through `_get_open_api_editor` back to the DefinitionBody
+        """
+        if self._open_api_editor is not None:
+            self.definition_body = self._open_api_editor.openapi
+            self._open_api_editor = None
 
     def to_cloudformation(self):
         """Generates CloudFormation resources from a SAM HTTP API resource
@@ -0,0 +1,211 @@
+import copy
+
+from six import string_types
+
+from samtranslator.model.intrinsics import (
+    calculate_number_of_conditions,
+    fnAnd,
+    fnOr,
+    make_condition_or_list,
+    make_not_conditional,
+)
+
+# Total number of conditions allowed in an Fn::Or statement. See docs:
+# https://docs.aws.amazon.com/AWSCloudFormation/latest/UserGuide/intrinsic-function-reference-conditions.html#intrinsic-function-reference-conditions-or
+MAX_OR_CONDITIONS = 10
+
+
+class ConditionInterner(object):
+    """
+    Adds the conditions that SAM generates by combining other conditions (Fn::Or, Fn::And and Fn::Not of conditions)
+    to the Conditions section of a template, once per logical content. One interner is used per template and
+    translation phase.
+
+    A condition with the same content as an existing one, generated or written in the template, is not added again: the
+    name of the existing one is returned instead. Fn::Or conditions are compared by the set of conditions they combine
+    once nested Fn::Or conditions are expanded, so their order and nesting do not matter. Existing Fn::Or conditions
+    that combine part of a new set are reused as members of the new condition, and the members are split into chunks of
+    MAX_OR_CONDITIONS that are reused the same way, so overlapping sets share the conditions of their common parts.
+
+    Members are sorted and existing conditions are visited in name order, so the output only depends on the template.
+    """
+
+    def __init__(self, template_dict):
+        """
+        :param dict template_dict: Template to add the conditions to. Its existing conditions are reused
+        """
+        self.template_dict = template_dict
+        # Logical content of the conditions, as keys returned by _parse_combined_condition, to their names and the other way around
+        self._names = {}
+        self._keys = {}
+        # Fn::Or conditions to the set of conditions they combine, with nested Fn::Or conditions expanded
+        self._or_members = {}
+
+        conditions = template_dict.get("Conditions")
+        if isinstance(conditions, dict):
+            for name, definition in sorted(conditions.items()):
+                self._index(name, _parse_combined_condition(definition))
+
+    def make_or_condition(self, conditions, condition_name, always_define=False):
+        """
+        Makes a condition that is true if any of the given conditions is. Since Fn::Or only accepts up to
+        MAX_OR_CONDITIONS conditions, larger sets are combined through several conditions, named by appending a number
+        to condition_name.
+
+        :param list conditions: Names of the conditions to combine
+        :param string condition_name: Name of the new condition
+        :param bool always_define: Whether condition_name must be defined, for conditions that templates can refer to
+            by name. An existing condition with the same content is then copied under condition_name instead of being
+            returned.
+        :return string: Name of the condition to use. Unless always_define is set, it is one of the given conditions
+            if they are all the same, or an existing condition with the same content.
+        """
+        name = self._make_or_condition(conditions, condition_name)
+        if always_define and name != condition_name:
+            definition = self.template_dict.get("Conditions", {}).get(name)
+            if definition is None:
+                # Not a condition of the template. Fn::Or needs at least two conditions.
+                self._add(condition_name, None, fnOr(make_condition_or_list([name, name])))
+            else:
+                self._add(condition_name, _parse_combined_condition(definition), copy.deepcopy(definition))
+            return condition_name
+        return name
+
+    def _make_or_condition(self, conditions, condition_name):
+        members = frozenset(member for condition in conditions for member in self._expand(condition))
+        existing = self._names.get(("Fn::Or", members))
+        if existing is not None:
+            return existing
+        if len(members) == 1:
+            return next(iter(members))
+
+        conditions_list = sorted(self._reuse_or_conditions(members))
+        if len(conditions_list) == 1:
+            return conditions_list[0]
+
+        # Get number of conditions needed, then minus one to use them as 0-based indices
+        zero_based_num_conditions = calculate_number_of_conditions(len(conditions_list), MAX_OR_CONDITIONS) - 1
+        while len(conditions_list) > 1:
+            new_condition_name = condition_name
+            # If more than 1 new condition is needed, add a number to the end of the name
+            if zero_based_num_conditions > 0:
+                new_condition_name = "{}{}".format(condition_name, zero_based_num_conditions)
+                zero_based_num_conditions -= 1
+            chunk = conditions_list[:MAX_OR_CONDITIONS]
+            conditions_list = conditions_list[MAX_OR_CONDITIONS:]
+            chunk_members = frozenset(member for condition in chunk for member in self._expand(condition))
+            chunk_name = self._names.get(("Fn::Or", chunk_members))
+            if chunk_name is None:
+                chunk_name = new_condition_name
+                self._add(chunk_name, ("Fn::Or", chunk_members), fnOr(make_condition_or_list(chunk)))
+            conditions_list.append(chunk_name)
+        return conditions_list[0]
+
+    def make_and_condition(self, conditions, condition_name):
+        """
+        Makes a condition that is true if all of the given conditions are
+
+        :param list conditions: Names of the conditions to combine
+        :param string condition_name: Name of the new condition
+        :return string: Name of the condition to use. It is one of the given conditions if they are all the same, or
+            an existing condition with the same content.
+        """
+        unique_conditions = []
+        for condition in conditions:
+            if condition not in unique_conditions:
+                unique_conditions.append(condition)
+        if len(unique_conditions) == 1:
+            return unique_conditions[0]
+
+        key = ("Fn::And", frozenset(unique_conditions))
+        existing = self._names.get(key)
+        if existing is not None:
+            return existing
+        self._add(condition_name, key, fnAnd(make_condition_or_list(unique_conditions)))
+        return condition_name
+
+    def make_not_condition(self, condition, condition_name):
+        """
+        Makes a condition that is true if the given condition is false
+
+        :param string condition: Name of the condition to negate
+        :param string condition_name: Name of the new condition
+        :return string: Name of the condition to use, an existing condition if one has the same content
+        """
+        key = ("Fn::Not", condition)
+        existing = self._names.get(key)
+        if existing is not None:
+            return existing
+        self._add(condition_name, key, make_not_conditional(condition))
+        return condition_name
+
+    def _expand(self, condition):
+        return self._or_members.get(condition, frozenset([condition]))
+
+    def _reuse_or_conditions(self, members):
+        """
+        Replaces the members combined by existing Fn::Or conditions with those conditions, largest first. Since Fn::Or
+        is idempotent, a condition is used as long as it only combines members of the set and covers two members that
+        are not covered yet.
+
+        :param frozenset members: Conditions to combine
+        :return set: Conditions to combine instead
+        """
+        remaining = set(members)
+        reused = set()
+        candidates = sorted(
+            (
+                (name, or_members)
+                for name, or_members in self._or_members.items()
+                if len(or_members) < len(members) and or_members <= members
+            ),
+            key=lambda candidate: (-len(candidate[1]), candidate[0]),
+        )
+        for name, or_members in candidates:
+            if len(remaining & or_members) > 1:
+                remaining -= or_members
+                reused.add(name)
+        return remaining | reused
+
+    def _add(self, name, key, definition):
+        self.template_dict.setdefault("Conditions", {})[name] = definition
+        self._index(name, key)
+
+    def _index(self, name, key):
+        # A condition that is redefined no longer has its former content
+        former_key = self._keys.pop(name, None)
+        if former_key is not None and self._names.get(former_key) == name:
+            del self._names[former_key]
+        self._or_members.pop(name, None)
+
+        if key is None:
+            return
+        if key[0] == "Fn::Or":
+            key = ("Fn::Or", frozenset(member for condition in key[1] for member in self._expand(condition)))
+            self._or_members[name] = key[1]
+        self._keys[name] = key
+        self._names.setdefault(key, name)
+
+
+def _parse_combined_condition(definition):
+    """
+    :param definition: Definition of a condition of the template
+    :return tuple: Key of the logical content of the condition if it combines other conditions, None otherwise
+    """
+    if not isinstance(definition, dict) or len(definition) != 1:
+        return None
+    function, arguments = list(definition.items())[0]
+    if function not in ("Fn::Or", "Fn::And", "Fn::Not") or not isinstance(arguments, list) or not arguments:
+        return None
+
+    conditions = []
+    for argument in arguments:
+        if not isinstance(argument, dict) or list(argument.keys()) != ["Condition"]:
+            return None
+        if not isinstance(argument["Condition"], string_types):
+            return None
+        conditions.append(argument["Condition"])
+
+    if function == "Fn::Not":
+        return ("Fn::Not", conditions[0]) if len(conditions) == 1 else None
+    return (function, frozenset(conditions))
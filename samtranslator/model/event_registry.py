@@ -0,0 +1,115 @@
+"""
+Registries of the event types of SAM resources.
+
+Each registry maps the `Type` of an event to its event source class. Classes are listed by import path, and their
+module is only imported the first time an event of that type is resolved, so registries cost nothing to create and
+resolving an event is a dictionary lookup. Plugins can add event types with `register`.
+"""
+import importlib
+import threading
+
+from six import string_types
+
+
+class EventTypeRegistry(object):
+    """
+    Maps the types of events to event source classes. It resolves event dictionaries the same way
+    samtranslator.model.ResourceTypeResolver resolves resource dictionaries.
+    """
+
+    def __init__(self, event_types=None):
+        """
+        :param dict event_types: Event source classes by event type. A class can be given as the path of the class,
+            `module:ClassName`, to import it on first use.
+        """
+        self._event_types = {}
+        self._lock = threading.Lock()
+        for event_type, event_class in (event_types or {}).items():
+            self.register(event_type, event_class)
+
+    def register(self, event_type, event_class):
+        """
+        Adds an event type, or replaces the class of an existing one
+
+        :param string event_type: Value of the `Type` property of the events
+        :param event_class: Event source class, or its path as `module:ClassName`
+        """
+        if isinstance(event_class, string_types) and ":" not in event_class:
+            raise ValueError("Event source class '{}' must be a class or 'module:ClassName'".format(event_class))
+        self._event_types[event_type] = event_class
+
+    @property
+    def event_types(self):
+        """
+        :return list: Registered event types, sorted
+        """
+        return sorted(self._event_types)
+
+    def can_resolve(self, event_dict):
+        if not isinstance(event_dict, dict) or "Type" not in event_dict:
+            return False
+        return event_dict["Type"] in self._event_types
+
+    def resolve_resource_type(self, event_dict):
+        """Returns the event source class corresponding to the 'Type' key in the given event dict.
+
+        :param dict event_dict: the event dict to resolve
+        :returns: the resolved event source class
+        :rtype: class
+        """
+        if not self.can_resolve(event_dict):
+            raise TypeError(
+                "Resource dict has missing or invalid value for key Type. Event Type is: {}.".format(
+                    event_dict.get("Type")
+                )
+            )
+        event_class = self._event_types[event_dict["Type"]]
+        if isinstance(event_class, string_types):
+            event_class = self._import(event_dict["Type"], event_class)
+        return event_class
+
+    def _import(self, event_type, path):
+        with self._lock:
+            module_name, class_name = path.split(":")
+            event_class = getattr(importlib.import_module(module_name), class_name)
+            # Unless it was registered again meanwhile
+            if self._event_types.get(event_type) == path:
+                self._event_types[event_type] = event_class
+            return event_class
+
+
+_PUSH = "samtranslator.model.eventsources.push:"
+_PULL = "samtranslator.model.eventsources.pull:"
+_STATE_MACHINE = "samtranslator.model.stepfunctions.events:"
+
+# Event types of AWS::Serverless::Function
+FUNCTION_EVENTS = EventTypeRegistry(
+    {
+        "AlexaSkill": _PUSH + "AlexaSkill",
+        "Api": _PUSH + "Api",
+        "CloudWatchEvent": _PUSH + "CloudWatchEvent",
+        "CloudWatchLogs": "samtranslator.model.eventsources.cloudwatchlogs:CloudWatchLogs",
+        "Cognito": _PUSH + "Cognito",
+        "DynamoDB": _PULL + "DynamoDB",
+        "EventBridgeRule": _PUSH + "EventBridgeRule",
+        "HttpApi": _PUSH + "HttpApi",
+        "IoTRule": _PUSH + "IoTRule",
+        "Kinesis": _PULL + "Kinesis",
+        "MQ": _PULL + "MQ",
+        "MSK": _PULL + "MSK",
+        "S3": _PUSH + "S3",
+        "SNS": _PUSH + "SNS",
+        "SQS": _PULL + "SQS",
+        "Schedule": _PUSH + "Schedule",
+    }
+)
+
+# Event types of AWS::Serverless::StateMachine
+STATE_MACHINE_EVENTS = EventTypeRegistry(
+    {
+        "Api": _STATE_MACHINE + "Api",
+        "CloudWatchEvent": _STATE_MACHINE + "CloudWatchEvent",
+        "EventBridgeRule": _STATE_MACHINE + "EventBridgeRule",
+        "Schedule": _STATE_MACHINE + "Schedule",
+    }
+)
@@ -136,27 +136,23 @@ class PullEventSource(ResourceMacro):
 
         :param model.iam.IAMRole role: the execution role generated for the function
         """
+        if role is None:
+            return
+
         policy_arn = self.get_policy_arn()
         policy_statements = self.get_policy_statements()
-        if role is not None:
-            if policy_arn is not None and policy_arn not in role.ManagedPolicyArns:
-                role.ManagedPolicyArns.append(policy_arn)
-            if policy_statements is not None:
-                if role.Policies is None:
-                    role.Policies = []
-                for policy in policy_statements:
-                    if policy not in role.Policies:
-                        if not policy.get("PolicyDocument") in [d["PolicyDocument"] for d in role.Policies]:
-                            role.Policies.append(policy)
-        # add SQS or SNS policy only if role is present in kwargs
-        if role is not None and destination_config_policy is not None and destination_config_policy:
+        policies = role.get_policy_accumulator()
+        if policy_arn is not None:
+            policies.add_managed_policy_arn(policy_arn)
+        if policy_statements is not None:
             if role.Policies is None:
                 role.Policies = []
-                role.Policies.append(destination_config_policy)
-            if role.Policies and destination_config_policy not in role.Policies:
-                # do not add the  policy if the same policy document is already present
-                if not destination_config_policy.get("PolicyDocument") in [d["PolicyDocument"] for d in role.Policies]:
-                    role.Policies.append(destination_config_policy)
+            for policy in policy_statements:
+                # do not add the policy if the same policy document is already present
+                policies.add_policy(policy)
+        # add SQS or SNS policy only if role is present in kwargs
+        if destination_config_policy:
+            policies.add_policy(destination_config_policy)
 
 
 class Kinesis(PullEventSource):
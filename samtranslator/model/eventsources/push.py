@@ -4,9 +4,9 @@ from six import string_types
 from samtranslator.model import ResourceMacro, PropertyType
 from samtranslator.model.types import is_type, list_of, dict_of, one_of, is_str
 from samtranslator.model.intrinsics import ref, fnGetAtt, fnSub, make_shorthand, make_conditional
-from samtranslator.model.tags.resource_tagging import get_tag_list
 
-from samtranslator.model.s3 import S3Bucket
+from samtranslator.model.api.definition_collection import ApiDefinitionCollection
+from samtranslator.model.s3_utils.notification_collection import S3NotificationCollection
 from samtranslator.model.sns import SNSSubscription
 from samtranslator.model.lambda_ import LambdaPermission
 from samtranslator.model.events import EventsRule
@@ -276,85 +276,34 @@ class S3(PushEventSource):
         bucket = kwargs["bucket"]
         bucket_id = kwargs["bucket_id"]
 
+        # NOTE: `bucket` here is a dictionary representing the S3 Bucket resource in your SAM template. If there are
+        # multiple S3 Events attached to the same bucket, the Bucket resource is updated with the notification
+        # configuration of every event. When translating a template, the translator passes a collection shared by all
+        # functions and adds the buckets to the output once all functions are translated. Otherwise, the bucket is
+        # updated and returned right away.
+        s3_notification_collection = kwargs.get("s3_notification_collection")
+        notifications = s3_notification_collection or S3NotificationCollection()
+
         resources = []
 
         source_account = ref("AWS::AccountId")
         permission = self._construct_permission(function, source_account=source_account)
-        if CONDITION in permission.resource_attributes:
-            self._depend_on_lambda_permissions_using_tag(bucket, permission)
-        else:
-            self._depend_on_lambda_permissions(bucket, permission)
+        notifications.add_permission(bucket_id, bucket, permission)
         resources.append(permission)
 
-        # NOTE: `bucket` here is a dictionary representing the S3 Bucket resource in your SAM template. If there are
-        # multiple S3 Events attached to the same bucket, we will update the Bucket resource with notification
-        # configuration for each event. This is the reason why we continue to use existing bucket dict and append onto
-        # it.
-        #
-        # NOTE: There is some fragile logic here where we will append multiple resources to output
-        #   SAM template but de-dupe them when merging into output CFN template. This is scary because the order of
-        #   merging is literally "last one wins", which works fine because we linearly loop through the template once.
-        #   The de-dupe happens inside `samtranslator.translator.Translator.translate` method when merging results of
-        #   to_cloudformation() to output template.
-        self._inject_notification_configuration(function, bucket)
-        resources.append(S3Bucket.from_dict(bucket_id, bucket))
+        notifications.add_lambda_configurations(bucket_id, bucket, self._construct_lambda_configurations(function))
+        if s3_notification_collection is None:
+            resources.extend(notifications.get_bucket_resources())
 
         return resources
 
-    def _depend_on_lambda_permissions(self, bucket, permission):
-        """
-        Make the S3 bucket depends on Lambda Permissions resource because when S3 adds a Notification Configuration,
-        it will check whether it has permissions to access Lambda. This will fail if the Lambda::Permissions is not
-        already applied for this bucket to invoke the Lambda.
-
-        :param dict bucket: Dictionary representing the bucket in SAM template. This is a raw dictionary and not a
-            "resource" object
-        :param model.lambda_.lambda_permission permission: Lambda Permission resource that needs to be created before
-            the bucket.
-        :return: Modified Bucket dictionary
-        """
-
-        depends_on = bucket.get("DependsOn", [])
-
-        # DependsOn can be either a list of strings or a scalar string
-        if isinstance(depends_on, string_types):
-            depends_on = [depends_on]
+    def _construct_lambda_configurations(self, function):
+        """Constructs the entries of the bucket's LambdaConfigurations that notify the function of this event.
 
-        depends_on_set = set(depends_on)
-        depends_on_set.add(permission.logical_id)
-        bucket["DependsOn"] = list(depends_on_set)
-
-        return bucket
-
-    def _depend_on_lambda_permissions_using_tag(self, bucket, permission):
-        """
-        Since conditional DependsOn is not supported this undocumented way of
-        implicitely  making dependency through tags is used.
-
-        See https://stackoverflow.com/questions/34607476/cloudformation-apply-condition-on-dependson
-
-        It is done by using Ref wrapped in a conditional Fn::If. Using Ref implies a
-        dependency, so CloudFormation will automatically wait once it reaches that function, the same
-        as if you were using a DependsOn.
+        :param function: the Lambda function or alias this event source triggers
+        :returns: one notification configuration per event type
+        :rtype: list
         """
-        properties = bucket.get("Properties", None)
-        if properties is None:
-            properties = {}
-            bucket["Properties"] = properties
-        tags = properties.get("Tags", None)
-        if tags is None:
-            tags = []
-            properties["Tags"] = tags
-        dep_tag = {
-            "sam:ConditionalDependsOn:"
-            + permission.logical_id: {
-                "Fn::If": [permission.resource_attributes[CONDITION], ref(permission.logical_id), "no dependency"]
-            }
-        }
-        properties["Tags"] = tags + get_tag_list(dep_tag)
-        return bucket
-
-    def _inject_notification_configuration(self, function, bucket):
         base_event_mapping = {"Function": function.get_runtime_attr("arn")}
 
         if self.Filter is not None:
@@ -372,26 +321,7 @@ class S3(PushEventSource):
             if CONDITION in function.resource_attributes:
                 lambda_event = make_conditional(function.resource_attributes[CONDITION], lambda_event)
             event_mappings.append(lambda_event)
-
-        properties = bucket.get("Properties", None)
-        if properties is None:
-            properties = {}
-            bucket["Properties"] = properties
-
-        notification_config = properties.get("NotificationConfiguration", None)
-        if notification_config is None:
-            notification_config = {}
-            properties["NotificationConfiguration"] = notification_config
-
-        lambda_notifications = notification_config.get("LambdaConfigurations", None)
-        if lambda_notifications is None:
-            lambda_notifications = []
-            notification_config["LambdaConfigurations"] = lambda_notifications
-
-        for event_mapping in event_mappings:
-            if event_mapping not in lambda_notifications:
-                lambda_notifications.append(event_mapping)
-        return bucket
+        return event_mappings
 
 
 class SNS(PushEventSource):
@@ -598,7 +528,14 @@ class Api(PushEventSource):
 
         explicit_api = kwargs["explicit_api"]
         if explicit_api.get("__MANAGE_SWAGGER"):
-            self._add_swagger_integration(explicit_api, function, intrinsics_resolver)
+            # When translating a template, the translator passes a collection shared by all functions and state
+            # machines, and writes the API definitions once all of them are translated. Otherwise, the definition of
+            # the API is written right away.
+            api_definition_collection = kwargs.get("api_definition_collection")
+            api_definitions = api_definition_collection or ApiDefinitionCollection()
+            self._add_swagger_integration(explicit_api, function, intrinsics_resolver, api_definitions)
+            if api_definition_collection is None:
+                api_definitions.write_definitions()
 
         return resources
 
@@ -641,13 +578,14 @@ class Api(PushEventSource):
 
         return self._construct_permission(resources_to_link["function"], source_arn=source_arn, suffix=suffix)
 
-    def _add_swagger_integration(self, api, function, intrinsics_resolver):
+    def _add_swagger_integration(self, api, function, intrinsics_resolver, api_definitions):
         """Adds the path and method for this Api event source to the Swagger body for the provided RestApi.
 
         :param model.apigateway.ApiGatewayRestApi rest_api: the RestApi to which the path and method should be added.
+        :param ApiDefinitionCollection api_definitions: collection holding the Swagger editor of the RestApi
         """
-        swagger_body = api.get("DefinitionBody")
-        if swagger_body is None:
+        editor = api_definitions.get_swagger_editor(api)
+        if editor is None:
             return
 
         function_arn = function.get_runtime_attr("arn")
@@ -660,8 +598,6 @@ class Api(PushEventSource):
             + "/invocations"
         )
 
-        editor = SwaggerEditor(swagger_body)
-
         if editor.has_integration(self.Path, self.Method):
             # Cannot add the Lambda Integration, if it is already present
             raise InvalidEventException(
@@ -675,12 +611,12 @@ class Api(PushEventSource):
         if CONDITION in function.resource_attributes:
             condition = function.resource_attributes[CONDITION]
 
-        editor.add_lambda_integration(self.Path, self.Method, uri, self.Auth, api.get("Auth"), condition=condition)
-
+        # The editor is shared by all events of the API, so the whole event is validated before it is changed
+        method_authorizer = None
+        apikey_required_setting = None
         if self.Auth:
             method_authorizer = self.Auth.get("Authorizer")
-            api_auth = api.get("Auth")
-            api_auth = intrinsics_resolver.resolve_parameter_refs(api_auth)
+            api_auth = api_definitions.get_resolved_auth(api, intrinsics_resolver)
 
             if method_authorizer:
                 api_authorizers = api_auth and api_auth.get("Authorizers")
@@ -741,17 +677,7 @@ class Api(PushEventSource):
                     ),
                 )
 
-            if method_authorizer or apikey_required_setting is not None:
-                editor.add_auth_to_method(api=api, path=self.Path, method_name=self.Method, auth=self.Auth)
-
-            if self.Auth.get("ResourcePolicy"):
-                resource_policy = self.Auth.get("ResourcePolicy")
-                editor.add_resource_policy(
-                    resource_policy=resource_policy, path=self.Path, api_id=self.RestApiId.get("Ref"), stage=self.Stage
-                )
-                if resource_policy.get("CustomStatements"):
-                    editor.add_custom_statements(resource_policy.get("CustomStatements"))
-
+        method_model = None
         if self.RequestModel:
             method_model = self.RequestModel.get("Model")
 
@@ -783,15 +709,11 @@ class Api(PushEventSource):
                         ),
                     )
 
-                editor.add_request_model_to_method(
-                    path=self.Path, method_name=self.Method, request_model=self.RequestModel
-                )
-
+        parameters = []
         if self.RequestParameters:
 
             default_value = {"Required": False, "Caching": False}
 
-            parameters = []
             for parameter in self.RequestParameters:
 
                 if isinstance(parameter, dict):
@@ -841,12 +763,28 @@ class Api(PushEventSource):
                         "Invalid value for 'RequestParameters' property. Property must be either a string or an object",
                     )
 
+        editor.add_lambda_integration(self.Path, self.Method, uri, self.Auth, api.get("Auth"), condition=condition)
+
+        if self.Auth:
+            if method_authorizer or apikey_required_setting is not None:
+                editor.add_auth_to_method(api=api, path=self.Path, method_name=self.Method, auth=self.Auth)
+
+            if self.Auth.get("ResourcePolicy"):
+                resource_policy = self.Auth.get("ResourcePolicy")
+                editor.add_resource_policy(
+                    resource_policy=resource_policy, path=self.Path, api_id=self.RestApiId.get("Ref"), stage=self.Stage
+                )
+                if resource_policy.get("CustomStatements"):
+                    editor.add_custom_statements(resource_policy.get("CustomStatements"))
+
+        if method_model:
+            editor.add_request_model_to_method(path=self.Path, method_name=self.Method, request_model=self.RequestModel)
+
+        if parameters:
             editor.add_request_parameters_to_method(
                 path=self.Path, method_name=self.Method, request_parameters=parameters
             )
 
-        api["DefinitionBody"] = editor.swagger
-
 
 class AlexaSkill(PushEventSource):
     resource_type = "AlexaSkill"
@@ -1036,25 +974,32 @@ class HttpApi(PushEventSource):
             # Convert to lower case so that user can specify either GET or get
             self.Method = self.Method.lower()
 
-        resources.extend(self._get_permissions(kwargs))
+        # When translating a template, the translator passes a collection shared by all functions, and writes the API
+        # definitions once all of them are translated. Otherwise, the definition of the API is written right away.
+        api_definition_collection = kwargs.get("api_definition_collection")
+        api_definitions = api_definition_collection or ApiDefinitionCollection()
+
+        resources.extend(self._get_permissions(kwargs, api_definitions))
 
         explicit_api = kwargs["explicit_api"]
-        self._add_openapi_integration(explicit_api, function, explicit_api.get("__MANAGE_SWAGGER"))
+        self._add_openapi_integration(explicit_api, function, api_definitions, explicit_api.get("__MANAGE_SWAGGER"))
+        if api_definition_collection is None:
+            api_definitions.write_definitions()
 
         return resources
 
-    def _get_permissions(self, resources_to_link):
+    def _get_permissions(self, resources_to_link, api_definitions):
         permissions = []
 
         # Give permission to all stages by default
         permitted_stage = "*"
 
-        permission = self._get_permission(resources_to_link, permitted_stage)
+        permission = self._get_permission(resources_to_link, permitted_stage, api_definitions)
         if permission:
             permissions.append(permission)
         return permissions
 
-    def _get_permission(self, resources_to_link, stage):
+    def _get_permission(self, resources_to_link, stage, api_definitions):
         # It turns out that APIGW doesn't like trailing slashes in paths (#665)
         # and removes as a part of their behaviour, but this isn't documented.
         # The regex removes the tailing slash to ensure the permission works as intended
@@ -1063,7 +1008,7 @@ class HttpApi(PushEventSource):
         editor = None
         if resources_to_link["explicit_api"].get("DefinitionBody"):
             try:
-                editor = OpenApiEditor(resources_to_link["explicit_api"].get("DefinitionBody"))
+                editor = api_definitions.get_open_api_editor(resources_to_link["explicit_api"])
             except ValueError as e:
                 api_logical_id = self.ApiId.get("Ref") if isinstance(self.ApiId, dict) else self.ApiId
                 raise InvalidResourceException(api_logical_id, e)
@@ -1097,13 +1042,14 @@ class HttpApi(PushEventSource):
 
         return self._construct_permission(resources_to_link["function"], source_arn=source_arn)
 
-    def _add_openapi_integration(self, api, function, manage_swagger=False):
+    def _add_openapi_integration(self, api, function, api_definitions, manage_swagger=False):
         """Adds the path and method for this Api event source to the OpenApi body for the provided RestApi.
 
         :param model.apigateway.ApiGatewayRestApi rest_api: the RestApi to which the path and method should be added.
+        :param ApiDefinitionCollection api_definitions: collection holding the OpenApi editor of the RestApi
         """
-        open_api_body = api.get("DefinitionBody")
-        if open_api_body is None:
+        editor = api_definitions.get_open_api_editor(api)
+        if editor is None:
             return
 
         function_arn = function.get_runtime_attr("arn")
@@ -1113,8 +1059,6 @@ class HttpApi(PushEventSource):
             + "/invocations"
         )
 
-        editor = OpenApiEditor(open_api_body)
-
         if manage_swagger and editor.has_integration(self.Path, self.Method):
             # Cannot add the Lambda Integration, if it is already present
             raise InvalidEventException(
@@ -1128,9 +1072,13 @@ class HttpApi(PushEventSource):
         if CONDITION in function.resource_attributes:
             condition = function.resource_attributes[CONDITION]
 
+        # The editor is shared by all events of the API, so the Auth of the event is validated before it is changed
+        if self.Auth:
+            self._validate_openapi_integration_auth(api)
+
         editor.add_lambda_integration(self.Path, self.Method, uri, self.Auth, api.get("Auth"), condition=condition)
         if self.Auth:
-            self._add_auth_to_openapi_integration(api, editor)
+            editor.add_auth_to_method(api=api, path=self.Path, method_name=self.Method, auth=self.Auth)
         if self.TimeoutInMillis:
             editor.add_timeout_to_method(api=api, path=self.Path, method_name=self.Method, timeout=self.TimeoutInMillis)
         path_parameters = re.findall("{(.*?)}", self.Path)
@@ -1143,12 +1091,12 @@ class HttpApi(PushEventSource):
             editor.add_payload_format_version_to_method(
                 api=api, path=self.Path, method_name=self.Method, payload_format_version=self.PayloadFormatVersion
             )
-        api["DefinitionBody"] = editor.openapi
 
-    def _add_auth_to_openapi_integration(self, api, editor):
-        """Adds authorization to the lambda integration
+    def _validate_openapi_integration_auth(self, api):
+        """Validates the authorization of the lambda integration against the Auth of the API. When the event does not
+        specify an Authorizer, the DefaultAuthorizer of the API is set on the event's Auth.
+
         :param api: api object
-        :param editor: OpenApiEditor object that contains the OpenApi definition
         """
         method_authorizer = self.Auth.get("Authorizer")
         api_auth = api.get("Auth", {})
@@ -1199,4 +1147,3 @@ class HttpApi(PushEventSource):
                 "Unable to set Authorizer on API method [{method}] for path [{path}] because "
                 "'AuthorizationScopes' must be a list of strings.".format(method=self.Method, path=self.Path),
             )
-        editor.add_auth_to_method(api=api, path=self.Path, method_name=self.Method, auth=self.Auth)
@@ -92,6 +92,47 @@ class InvalidEventException(Exception):
         return "Event with id [{}] is invalid. {}".format(self._event_id, self._message)
 
 
+class ErrorCollector(object):
+    """Collects the errors found while translating a template.
+
+    By default every error is collected, so that the author can fix all of them at once. Callers that only need to
+    know whether a template is valid can set `max_errors` instead. The translation then stops as soon as that many
+    errors have been found, without translating the rest of the template.
+
+    Attributes:
+        max_errors -- number of errors after which the translation stops, or None to collect all errors
+        errors -- errors collected so far
+    """
+
+    def __init__(self, max_errors=None):
+        if max_errors is not None and max_errors < 1:
+            raise ValueError("'max_errors' must be at least 1")
+        self.max_errors = max_errors
+        self.errors = []
+
+    @property
+    def stops_early(self):
+        return self.max_errors is not None
+
+    def add(self, error):
+        """Adds an error to the collection
+
+        :param Exception error: the error
+        :raises InvalidDocumentException: if the collection has reached `max_errors`
+        """
+        self.errors.append(error)
+        if self.stops_early and len(self.errors) >= self.max_errors:
+            raise InvalidDocumentException(self.errors)
+
+    def raise_errors(self):
+        """Raises the collected errors, if there are any
+
+        :raises InvalidDocumentException: if any error was collected
+        """
+        if self.errors:
+            raise InvalidDocumentException(self.errors)
+
+
 def prepend(exception, message, end=": "):
     """Prepends the first argument (i.e., the exception message) of the a BaseException with the provided message.
     Useful for reraising exceptions with additional information.
@@ -1,6 +1,7 @@
 from samtranslator.model import PropertyType, Resource
 from samtranslator.model.types import is_type, is_str, list_of
 from samtranslator.model.intrinsics import ref, fnGetAtt
+from samtranslator.utils.canonical import canonical_key
 
 
 class IAMRole(Resource):
@@ -16,6 +17,120 @@ class IAMRole(Resource):
 
     runtime_attrs = {"name": lambda self: ref(self.logical_id), "arn": lambda self: fnGetAtt(self.logical_id, "Arn")}
 
+    _keywords = Resource._keywords + ["policy_accumulator"]
+    policy_accumulator = None
+
+    def get_policy_accumulator(self):
+        """Returns the accumulator used to add managed policy ARNs and inline policies to this role, creating it on
+        first use.
+
+        :returns: the accumulator of this role
+        :rtype: IAMRolePolicyAccumulator
+        """
+        if self.policy_accumulator is None:
+            self.policy_accumulator = IAMRolePolicyAccumulator(self)
+        return self.policy_accumulator
+
+
+class IAMRolePolicyAccumulator(object):
+    """Adds managed policy ARNs and inline policies to the ManagedPolicyArns and Policies lists of an IAM role.
+
+    Policies keep the order they were added in. Every ARN, policy and policy document of the role is indexed by a
+    canonical key of its content, so checking whether the role already has a policy is a set lookup instead of a deep
+    comparison with every policy of the role. The index is rebuilt if the lists of the role are replaced or modified
+    without the accumulator.
+    """
+
+    def __init__(self, role):
+        """
+        :param IAMRole role: the role to add policies to
+        """
+        self.role = role
+        self._indexed_lists = (None, None)
+        self._indexed_lengths = (0, 0)
+        self._managed_policy_arn_keys = set()
+        self._policy_keys = set()
+        self._policy_document_keys = set()
+
+    def add_managed_policy_arn(self, policy_arn):
+        """Adds the managed policy ARN to the role, unless the role already has it.
+
+        :param policy_arn: ARN of the managed policy, or an intrinsic function resolving to it
+        :returns: True if the ARN was added, False if the role already had it
+        """
+        self._sync()
+        key = canonical_key(policy_arn)
+        if key in self._managed_policy_arn_keys:
+            return False
+        if self.role.ManagedPolicyArns is None:
+            self.role.ManagedPolicyArns = []
+        self.role.ManagedPolicyArns.append(policy_arn)
+        self._managed_policy_arn_keys.add(key)
+        self._mark_synced()
+        return True
+
+    def has_policy(self, policy):
+        """Checks whether the role has the given inline policy, or another inline policy with the same PolicyDocument.
+
+        :param dict policy: the inline policy
+        :returns: True if the role already has the policy
+        """
+        self._sync()
+        if canonical_key(policy) in self._policy_keys:
+            return True
+        return isinstance(policy, dict) and canonical_key(policy.get("PolicyDocument")) in self._policy_document_keys
+
+    def add_policy(self, policy):
+        """Adds the inline policy to the role, unless the role already has it or another policy with the same
+        PolicyDocument.
+
+        :param dict policy: the inline policy
+        :returns: True if the policy was added, False if the role already had it
+        """
+        if self.has_policy(policy):
+            return False
+        self.append_policy(policy)
+        return True
+
+    def append_policy(self, policy):
+        """Adds the inline policy to the role, even if the role already has it.
+
+        :param dict policy: the inline policy, or an intrinsic function resolving to one
+        """
+        self._sync()
+        if self.role.Policies is None:
+            self.role.Policies = []
+        self.role.Policies.append(policy)
+        self._index_policy(policy)
+        self._mark_synced()
+
+    def _sync(self):
+        managed_policy_arns = self.role.ManagedPolicyArns
+        policies = self.role.Policies
+        if self._indexed_lists[0] is managed_policy_arns and self._indexed_lists[1] is policies:
+            if self._indexed_lengths == (len(managed_policy_arns or []), len(policies or [])):
+                return
+
+        self._managed_policy_arn_keys = set()
+        self._policy_keys = set()
+        self._policy_document_keys = set()
+        for policy_arn in managed_policy_arns or []:
+            self._managed_policy_arn_keys.add(canonical_key(policy_arn))
+        for policy in policies or []:
+            self._index_policy(policy)
+        self._mark_synced()
+
+    def _mark_synced(self):
+        managed_policy_arns = self.role.ManagedPolicyArns
+        policies = self.role.Policies
+        self._indexed_lists = (managed_policy_arns, policies)
+        self._indexed_lengths = (len(managed_policy_arns or []), len(policies or []))
+
+    def _index_policy(self, policy):
+        self._policy_keys.add(canonical_key(policy))
+        if isinstance(policy, dict) and "PolicyDocument" in policy:
+            self._policy_document_keys.add(canonical_key(policy["PolicyDocument"]))
+
 
 class IAMRolePolicies:
     @classmethod
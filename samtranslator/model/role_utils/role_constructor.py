@@ -35,12 +35,9 @@ def construct_role_for_resource(
     role_logical_id = resource_logical_id + "Role"
     execution_role = IAMRole(logical_id=role_logical_id, attributes=attributes)
     execution_role.AssumeRolePolicyDocument = assume_role_policy_document
-
-    if not managed_policy_arns:
-        managed_policy_arns = []
-
-    if not policy_documents:
-        policy_documents = []
+    execution_role.ManagedPolicyArns = list(managed_policy_arns or [])
+    execution_role.Policies = list(policy_documents or [])
+    policies = execution_role.get_policy_accumulator()
 
     for index, policy_entry in enumerate(resource_policies.get()):
         if policy_entry.type is PolicyTypes.POLICY_STATEMENT:
@@ -65,10 +62,10 @@ def construct_role_for_resource(
                     }
                     intrinsic_if["Fn::If"][2] = else_statement
 
-                policy_documents.append(intrinsic_if)
+                policies.append_policy(intrinsic_if)
 
             else:
-                policy_documents.append(
+                policies.append_policy(
                     {
                         "PolicyName": execution_role.logical_id + "Policy" + str(index),
                         "PolicyDocument": policy_entry.data,
@@ -92,8 +89,7 @@ def construct_role_for_resource(
             # De-Duplicate managed policy arns before inserting. Mainly useful
             # when customer specifies a managed policy which is already inserted
             # by SAM, such as AWSLambdaBasicExecutionRole
-            if policy_arn not in managed_policy_arns:
-                managed_policy_arns.append(policy_arn)
+            policies.add_managed_policy_arn(policy_arn)
         else:
             # Policy Templates are not supported here in the "core"
             raise InvalidResourceException(
@@ -103,8 +99,7 @@ def construct_role_for_resource(
                 ),
             )
 
-    execution_role.ManagedPolicyArns = list(managed_policy_arns)
-    execution_role.Policies = policy_documents or None
+    execution_role.Policies = execution_role.Policies or None
     execution_role.PermissionsBoundary = permissions_boundary
     execution_role.Tags = tags
 
@@ -0,0 +1,137 @@
+from collections import OrderedDict
+
+from six import string_types
+
+from samtranslator.model.intrinsics import ref
+from samtranslator.model.s3 import S3Bucket
+from samtranslator.model.tags.resource_tagging import get_tag_list
+from samtranslator.utils.canonical import canonical_key
+
+CONDITION = "Condition"
+
+
+class S3NotificationCollection(object):
+    """
+    Collects the Lambda notification configurations that S3 events add to the S3 buckets of a template, along with the
+    Lambda permissions that each bucket must depend on.
+
+    A bucket can be the event source of many functions. Instead of rewriting the bucket after every S3 event, the
+    collection indexes the notifications of each bucket by a canonical key of their content, and writes the bucket's
+    NotificationConfiguration, DependsOn and dependency tags once, when `get_bucket_resources` is called after all
+    functions have been translated.
+    """
+
+    def __init__(self):
+        self._buckets = OrderedDict()
+
+    def add_permission(self, bucket_id, bucket, permission):
+        """
+        Makes the bucket depend on the Lambda permission, because S3 checks that it is allowed to invoke the function
+        when the notification configuration is added. Conditional permissions cannot be used in DependsOn, so the
+        bucket references them from a tag instead.
+
+        :param string bucket_id: Logical id of the bucket
+        :param dict bucket: Dictionary representing the bucket in the SAM template
+        :param model.lambda_.LambdaPermission permission: Permission to invoke the function
+        """
+        self._get_bucket(bucket_id, bucket).add_permission(permission)
+
+    def add_lambda_configurations(self, bucket_id, bucket, lambda_configurations):
+        """
+        Adds the notification configurations to the bucket, skipping those the bucket already has
+
+        :param string bucket_id: Logical id of the bucket
+        :param dict bucket: Dictionary representing the bucket in the SAM template
+        :param list lambda_configurations: Entries of the LambdaConfigurations of the bucket's NotificationConfiguration
+        """
+        self._get_bucket(bucket_id, bucket).add_lambda_configurations(lambda_configurations)
+
+    def get_bucket_resources(self):
+        """
+        Writes the collected notifications and dependencies to the bucket dictionaries and returns the buckets as
+        resources, in the order they were first added to the collection
+
+        :return list: S3Bucket resources
+        :raises InvalidResourceException: If a bucket is not a valid S3 bucket
+        """
+        resources = []
+        for bucket_id, notifications in self._buckets.items():
+            notifications.write()
+            resources.append(S3Bucket.from_dict(bucket_id, notifications.bucket))
+        return resources
+
+    def _get_bucket(self, bucket_id, bucket):
+        if bucket_id not in self._buckets:
+            self._buckets[bucket_id] = _BucketNotifications(bucket)
+        return self._buckets[bucket_id]
+
+
+class _BucketNotifications(object):
+    """Notifications and dependencies collected for a single bucket"""
+
+    def __init__(self, bucket):
+        self.bucket = bucket
+        self.depends_on = []
+        self.dependency_tags = []
+        self.lambda_configurations = []
+        self._lambda_configuration_keys = set()
+
+        properties = bucket.get("Properties", None) or {}
+        notification_config = properties.get("NotificationConfiguration", None) or {}
+        for lambda_configuration in notification_config.get("LambdaConfigurations", None) or []:
+            self._lambda_configuration_keys.add(canonical_key(lambda_configuration))
+
+    def add_permission(self, permission):
+        if CONDITION in permission.resource_attributes:
+            # Since conditional DependsOn is not supported this undocumented way of implicitly making dependency
+            # through tags is used. See https://stackoverflow.com/questions/34607476/cloudformation-apply-condition-on-dependson
+            # Using Ref implies a dependency, so CloudFormation will wait for the permission as if DependsOn was used.
+            dependency_tag = {
+                "sam:ConditionalDependsOn:"
+                + permission.logical_id: {
+                    "Fn::If": [permission.resource_attributes[CONDITION], ref(permission.logical_id), "no dependency"]
+                }
+            }
+            self.dependency_tags.extend(get_tag_list(dependency_tag))
+        else:
+            self.depends_on.append(permission.logical_id)
+
+    def add_lambda_configurations(self, lambda_configurations):
+        for lambda_configuration in lambda_configurations:
+            key = canonical_key(lambda_configuration)
+            if key not in self._lambda_configuration_keys:
+                self._lambda_configuration_keys.add(key)
+                self.lambda_configurations.append(lambda_configuration)
+
+    def write(self):
+        bucket = self.bucket
+
+        if self.depends_on:
+            # DependsOn can be either a list of strings or a scalar string
+            depends_on = bucket.get("DependsOn", [])
+            if isinstance(depends_on, string_types):
+                depends_on = [depends_on]
+            bucket["DependsOn"] = list(OrderedDict.fromkeys(depends_on + self.depends_on))
+            self.depends_on = []
+
+        properties = bucket.get("Properties", None)
+        if properties is None:
+            properties = {}
+            bucket["Properties"] = properties
+
+        if self.dependency_tags:
+            properties["Tags"] = (properties.get("Tags", None) or []) + self.dependency_tags
+            self.dependency_tags = []
+
+        notification_config = properties.get("NotificationConfiguration", None)
+        if notification_config is None:
+            notification_config = {}
+            properties["NotificationConfiguration"] = notification_config
+
+        lambda_notifications = notification_config.get("LambdaConfigurations", None)
+        if lambda_notifications is None:
+            lambda_notifications = []
+            notification_config["LambdaConfigurations"] = lambda_notifications
+
+        lambda_notifications.extend(self.lambda_configurations)
+        self.lambda_configurations = []
@@ -1,16 +1,10 @@
 ﻿""" SAM macro definitions """
 from six import string_types
 
-import samtranslator.model.eventsources
-import samtranslator.model.eventsources.pull
-import samtranslator.model.eventsources.push
-import samtranslator.model.eventsources.cloudwatchlogs
-from .api.api_generator import ApiGenerator
-from .api.http_api_generator import HttpApiGenerator
 from .packagetype import ZIP, IMAGE
 from .s3_utils.uri_parser import construct_s3_location_object, construct_image_code_object
 from .tags.resource_tagging import get_tag_list
-from samtranslator.model import PropertyType, SamResourceMacro, ResourceTypeResolver
+from samtranslator.model import PropertyType, SamResourceMacro
 from samtranslator.model.apigateway import (
     ApiGatewayDeployment,
     ApiGatewayStage,
@@ -20,7 +14,9 @@ from samtranslator.model.apigateway import (
     ApiGatewayApiKey,
 )
 from samtranslator.model.apigatewayv2 import ApiGatewayV2Stage, ApiGatewayV2DomainName
+from samtranslator.model.conditions import ConditionInterner
 from samtranslator.model.cloudformation import NestedStack
+from samtranslator.model.event_registry import FUNCTION_EVENTS, STATE_MACHINE_EVENTS
 from samtranslator.model.dynamodb import DynamoDBTable
 from samtranslator.model.exceptions import InvalidEventException, InvalidResourceException
 from samtranslator.model.resource_policies import ResourcePolicies, PolicyTypes
@@ -39,13 +35,10 @@ from samtranslator.model.intrinsics import (
     is_intrinsic_if,
     is_intrinsic_no_value,
     ref,
-    make_not_conditional,
     make_conditional,
-    make_and_condition,
 )
 from samtranslator.model.sqs import SQSQueue
 from samtranslator.model.sns import SNSTopic
-from samtranslator.model.stepfunctions import StateMachineGenerator
 from samtranslator.model.role_utils import construct_role_for_resource
 from samtranslator.model.xray_utils import get_xray_managed_policy_name
 
@@ -89,12 +82,10 @@ class SamFunction(SamResourceMacro):
         "ImageConfig": PropertyType(False, is_type(dict)),
         "CodeSigningConfigArn": PropertyType(False, is_str()),
     }
-    event_resolver = ResourceTypeResolver(
-        samtranslator.model.eventsources,
-        samtranslator.model.eventsources.pull,
-        samtranslator.model.eventsources.push,
-        samtranslator.model.eventsources.cloudwatchlogs,
-    )
+    # Event sources parsed by `resources_to_link`, by logical id of the event, so that `to_cloudformation` does not
+    # parse the events again
+    _keywords = SamResourceMacro._keywords + ["parsed_events"]
+    event_resolver = FUNCTION_EVENTS
 
     # DeadLetterQueue
     dead_letter_queue_policy_actions = {"SQS": "sqs:SendMessage", "SNS": "sns:Publish"}
@@ -129,7 +120,7 @@ class SamFunction(SamResourceMacro):
         resources = []
         intrinsics_resolver = kwargs["intrinsics_resolver"]
         mappings_resolver = kwargs.get("mappings_resolver", None)
-        conditions = kwargs.get("conditions", {})
+        condition_interner = kwargs.get("condition_interner") or ConditionInterner({})
 
         if self.DeadLetterQueue:
             self._validate_dlq()
@@ -169,7 +160,7 @@ class SamFunction(SamResourceMacro):
         if self.EventInvokeConfig:
             function_name = lambda_function.logical_id
             event_invoke_resources, event_invoke_policies = self._construct_event_invoke_config(
-                function_name, alias_name, lambda_alias, intrinsics_resolver, conditions
+                function_name, alias_name, lambda_alias, intrinsics_resolver, condition_interner
             )
             resources.extend(event_invoke_resources)
 
@@ -190,13 +181,17 @@ class SamFunction(SamResourceMacro):
                 kwargs["event_resources"],
                 intrinsics_resolver,
                 lambda_alias=lambda_alias,
+                s3_notification_collection=kwargs.get("s3_notification_collection"),
+                api_definition_collection=kwargs.get("api_definition_collection"),
             )
         except InvalidEventException as e:
             raise InvalidResourceException(self.logical_id, e.message)
 
         return resources
 
-    def _construct_event_invoke_config(self, function_name, alias_name, lambda_alias, intrinsics_resolver, conditions):
+    def _construct_event_invoke_config(
+        self, function_name, alias_name, lambda_alias, intrinsics_resolver, condition_interner
+    ):
         """
         Create a `AWS::Lambda::EventInvokeConfig` based on the input dict `EventInvokeConfig`
         """
@@ -220,7 +215,7 @@ class SamFunction(SamResourceMacro):
         input_dest_config = resolved_event_invoke_config.get("DestinationConfig")
         if input_dest_config and input_dest_config.get("OnSuccess") is not None:
             resource, on_success, policy = self._validate_and_inject_resource(
-                input_dest_config.get("OnSuccess"), "OnSuccess", logical_id, conditions
+                input_dest_config.get("OnSuccess"), "OnSuccess", logical_id, condition_interner
             )
             dest_config["OnSuccess"] = on_success
             self.EventInvokeConfig["DestinationConfig"]["OnSuccess"]["Destination"] = on_success.get("Destination")
@@ -231,7 +226,7 @@ class SamFunction(SamResourceMacro):
 
         if input_dest_config and input_dest_config.get("OnFailure") is not None:
             resource, on_failure, policy = self._validate_and_inject_resource(
-                input_dest_config.get("OnFailure"), "OnFailure", logical_id, conditions
+                input_dest_config.get("OnFailure"), "OnFailure", logical_id, condition_interner
             )
             dest_config["OnFailure"] = on_failure
             self.EventInvokeConfig["DestinationConfig"]["OnFailure"]["Destination"] = on_failure.get("Destination")
@@ -254,7 +249,7 @@ class SamFunction(SamResourceMacro):
 
         return resources, policy_document
 
-    def _validate_and_inject_resource(self, dest_config, event, logical_id, conditions):
+    def _validate_and_inject_resource(self, dest_config, event, logical_id, condition_interner):
         """
         For Event Invoke Config, if the user has not specified a destination ARN for SQS/SNS, SAM
         auto creates a SQS and SNS resource with defaults. Intrinsics are supported in the Destination
@@ -275,11 +270,11 @@ class SamFunction(SamResourceMacro):
             )
 
         property_condition, dest_arn = self._get_or_make_condition(
-            dest_config.get("Destination"), logical_id, conditions
+            dest_config.get("Destination"), logical_id, condition_interner
         )
         if dest_config.get("Destination") is None or property_condition is not None:
             combined_condition = self._make_and_conditions(
-                self.get_passthrough_resource_attributes(), property_condition, conditions
+                self.get_passthrough_resource_attributes(), property_condition, condition_interner
             )
             if dest_config.get("Type") in auto_inject_list:
                 if dest_config.get("Type") == "SQS":
@@ -308,22 +303,21 @@ class SamFunction(SamResourceMacro):
 
         return resource, destination, policy
 
-    def _make_and_conditions(self, resource_condition, property_condition, conditions):
+    def _make_and_conditions(self, resource_condition, property_condition, condition_interner):
         if resource_condition is None:
             return property_condition
 
         if property_condition is None:
             return resource_condition["Condition"]
 
-        and_condition = make_and_condition([resource_condition, {"Condition": property_condition}])
         condition_name = self._make_gen_condition_name(
             resource_condition.get("Condition") + "AND" + property_condition, self.logical_id
         )
-        conditions[condition_name] = and_condition
-
-        return condition_name
+        return condition_interner.make_and_condition(
+            [resource_condition["Condition"], property_condition], condition_name
+        )
 
-    def _get_or_make_condition(self, destination, logical_id, conditions):
+    def _get_or_make_condition(self, destination, logical_id, condition_interner):
         """
         This method checks if there is an If condition on Destination property. Since we auto create
         SQS and SNS if the destination ARN is not provided, we need to make sure that If condition
@@ -348,8 +342,7 @@ class SamFunction(SamResourceMacro):
             if is_intrinsic_no_value(dest_list[2]):
                 condition = dest_list[0]
                 not_condition = self._make_gen_condition_name("NOT" + condition, logical_id)
-                conditions[not_condition] = make_not_conditional(condition)
-                return not_condition, dest_list[1]
+                return condition_interner.make_not_condition(condition, not_condition), dest_list[1]
         return None, None
 
     def _make_gen_condition_name(self, name, hash_input):
@@ -557,6 +550,7 @@ class SamFunction(SamResourceMacro):
 
     def _event_resources_to_link(self, resources):
         event_resources = {}
+        self.parsed_events = {}
         if self.Events:
             for logical_id, event_dict in self.Events.items():
                 try:
@@ -566,6 +560,7 @@ class SamFunction(SamResourceMacro):
                 except (TypeError, AttributeError) as e:
                     raise InvalidEventException(logical_id, "{}".format(e))
                 event_resources[logical_id] = event_source.resources_to_link(resources)
+                self.parsed_events[logical_id] = event_source
         return event_resources
 
     @staticmethod
@@ -584,7 +579,14 @@ class SamFunction(SamResourceMacro):
         return event_dict.get("Properties", {}).get("Path", logical_id)
 
     def _generate_event_resources(
-        self, lambda_function, execution_role, event_resources, intrinsics_resolver, lambda_alias=None
+        self,
+        lambda_function,
+        execution_role,
+        event_resources,
+        intrinsics_resolver,
+        lambda_alias=None,
+        s3_notification_collection=None,
+        api_definition_collection=None,
     ):
         """Generates and returns the resources associated with this function's events.
 
@@ -595,6 +597,10 @@ class SamFunction(SamResourceMacro):
         :param event_resources: All the event sources associated with this Lambda function
         :param model.lambda_.LambdaAlias lambda_alias: Optional Lambda Alias resource if we want to connect the
             event sources to this alias
+        :param S3NotificationCollection s3_notification_collection: Optional collection of the notifications that S3
+            events add to buckets, shared by all functions of the template
+        :param ApiDefinitionCollection api_definition_collection: Optional collection of the API definitions that Api
+            and HttpApi events add routes to, shared by all functions and state machines of the template
 
         :returns: a list containing the function's event resources
         :rtype: list
@@ -602,18 +608,23 @@ class SamFunction(SamResourceMacro):
         resources = []
         if self.Events:
             for logical_id, event_dict in sorted(self.Events.items(), key=SamFunction.order_events):
-                try:
-                    eventsource = self.event_resolver.resolve_resource_type(event_dict).from_dict(
-                        lambda_function.logical_id + logical_id, event_dict, logical_id
-                    )
-                except TypeError as e:
-                    raise InvalidEventException(logical_id, "{}".format(e))
+                # Each parsed event is translated once
+                eventsource = self.parsed_events.pop(logical_id, None) if self.parsed_events else None
+                if eventsource is None:
+                    try:
+                        eventsource = self.event_resolver.resolve_resource_type(event_dict).from_dict(
+                            lambda_function.logical_id + logical_id, event_dict, logical_id
+                        )
+                    except TypeError as e:
+                        raise InvalidEventException(logical_id, "{}".format(e))
 
                 kwargs = {
                     # When Alias is provided, connect all event sources to the alias and *not* the function
                     "function": lambda_alias or lambda_function,
                     "role": execution_role,
                     "intrinsics_resolver": intrinsics_resolver,
+                    "s3_notification_collection": s3_notification_collection,
+                    "api_definition_collection": api_definition_collection,
                 }
 
                 for name, resource in event_resources[logical_id].items():
@@ -859,6 +870,9 @@ class SamApi(SamResourceMacro):
         redeploy_restapi_parameters = kwargs.get("redeploy_restapi_parameters")
         shared_api_usage_plan = kwargs.get("shared_api_usage_plan")
 
+        # Imported here so that the API generators are only loaded by templates that define APIs
+        from samtranslator.model.api.api_generator import ApiGenerator
+
         api_generator = ApiGenerator(
             self.logical_id,
             self.CacheClusterEnabled,
@@ -961,6 +975,9 @@ class SamHttpApi(SamResourceMacro):
         intrinsics_resolver = kwargs["intrinsics_resolver"]
         self.Domain = intrinsics_resolver.resolve_parameter_refs(self.Domain)
 
+        # Imported here so that the API generators are only loaded by templates that define APIs
+        from samtranslator.model.api.http_api_generator import HttpApiGenerator
+
         api_generator = HttpApiGenerator(
             self.logical_id,
             self.StageVariables,
@@ -1231,15 +1248,16 @@ class SamStateMachine(SamResourceMacro):
         "Tracing": PropertyType(False, is_type(dict)),
         "PermissionsBoundary": PropertyType(False, is_str()),
     }
-    event_resolver = ResourceTypeResolver(
-        samtranslator.model.stepfunctions.events,
-    )
+    event_resolver = STATE_MACHINE_EVENTS
 
     def to_cloudformation(self, **kwargs):
         managed_policy_map = kwargs.get("managed_policy_map", {})
         intrinsics_resolver = kwargs["intrinsics_resolver"]
         event_resources = kwargs["event_resources"]
 
+        # Imported here so that the state machine generator is only loaded by templates that define state machines
+        from samtranslator.model.stepfunctions import StateMachineGenerator
+
         state_machine_generator = StateMachineGenerator(
             logical_id=self.logical_id,
             depends_on=self.depends_on,
@@ -1261,6 +1279,7 @@ class SamStateMachine(SamResourceMacro):
             tags=self.Tags,
             resource_attributes=self.resource_attributes,
             passthrough_resource_attributes=self.get_passthrough_resource_attributes(),
+            api_definition_collection=kwargs.get("api_definition_collection"),
         )
 
         resources = state_machine_generator.to_cloudformation()
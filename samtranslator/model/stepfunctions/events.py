@@ -10,7 +10,7 @@ from samtranslator.translator import logical_id_generator
 from samtranslator.model.exceptions import InvalidEventException, InvalidResourceException
 from samtranslator.model.eventbridge_utils import EventBridgeRuleUtils
 from samtranslator.translator.arn_generator import ArnGenerator
-from samtranslator.swagger.swagger import SwaggerEditor
+from samtranslator.model.api.definition_collection import ApiDefinitionCollection
 from samtranslator.open_api.open_api import OpenApiEditor
 
 CONDITION = "Condition"
@@ -311,24 +311,30 @@ class Api(EventSource):
 
         explicit_api = kwargs["explicit_api"]
         if explicit_api.get("__MANAGE_SWAGGER"):
-            self._add_swagger_integration(explicit_api, resource, role, intrinsics_resolver)
+            # When translating a template, the translator passes a collection shared by all functions and state
+            # machines, and writes the API definitions once all of them are translated. Otherwise, the definition of
+            # the API is written right away.
+            api_definition_collection = kwargs.get("api_definition_collection")
+            api_definitions = api_definition_collection or ApiDefinitionCollection()
+            self._add_swagger_integration(explicit_api, resource, role, intrinsics_resolver, api_definitions)
+            if api_definition_collection is None:
+                api_definitions.write_definitions()
 
         return resources
 
-    def _add_swagger_integration(self, api, resource, role, intrinsics_resolver):
+    def _add_swagger_integration(self, api, resource, role, intrinsics_resolver, api_definitions):
         """Adds the path and method for this Api event source to the Swagger body for the provided RestApi.
 
         :param model.apigateway.ApiGatewayRestApi rest_api: the RestApi to which the path and method should be added.
+        :param ApiDefinitionCollection api_definitions: collection holding the Swagger editor of the RestApi
         """
-        swagger_body = api.get("DefinitionBody")
-        if swagger_body is None:
+        editor = api_definitions.get_swagger_editor(api)
+        if editor is None:
             return
 
         resource_arn = resource.get_runtime_attr("arn")
         integration_uri = fnSub("arn:${AWS::Partition}:apigateway:${AWS::Region}:states:action/StartExecution")
 
-        editor = SwaggerEditor(swagger_body)
-
         if editor.has_integration(self.Path, self.Method):
             # Cannot add the integration, if it is already present
             raise InvalidEventException(
@@ -342,20 +348,13 @@ class Api(EventSource):
         if CONDITION in resource.resource_attributes:
             condition = resource.resource_attributes[CONDITION]
 
-        editor.add_state_machine_integration(
-            self.Path,
-            self.Method,
-            integration_uri,
-            role.get_runtime_attr("arn"),
-            self._generate_request_template(resource),
-            condition=condition,
-        )
-
         # Note: Refactor and combine the section below with the Api eventsource for functions
+        # The editor is shared by all events of the API, so the whole event is validated before it is changed
+        method_authorizer = None
+        apikey_required_setting = None
         if self.Auth:
             method_authorizer = self.Auth.get("Authorizer")
-            api_auth = api.get("Auth")
-            api_auth = intrinsics_resolver.resolve_parameter_refs(api_auth)
+            api_auth = api_definitions.get_resolved_auth(api, intrinsics_resolver)
 
             if method_authorizer:
                 api_authorizers = api_auth and api_auth.get("Authorizers")
@@ -407,6 +406,16 @@ class Api(EventSource):
                     ),
                 )
 
+        editor.add_state_machine_integration(
+            self.Path,
+            self.Method,
+            integration_uri,
+            role.get_runtime_attr("arn"),
+            self._generate_request_template(resource),
+            condition=condition,
+        )
+
+        if self.Auth:
             if method_authorizer or apikey_required_setting is not None:
                 editor.add_auth_to_method(api=api, path=self.Path, method_name=self.Method, auth=self.Auth)
 
@@ -418,8 +427,6 @@ class Api(EventSource):
                 if resource_policy.get("CustomStatements"):
                     editor.add_custom_statements(resource_policy.get("CustomStatements"))
 
-        api["DefinitionBody"] = editor.swagger
-
     def _generate_request_template(self, resource):
         """Generates the Body mapping request template for the Api. This allows for the input
         request to the Api to be passed as the execution input to the associated state machine resource.
@@ -49,6 +49,7 @@ class StateMachineGenerator(object):
         tags=None,
         resource_attributes=None,
         passthrough_resource_attributes=None,
+        api_definition_collection=None,
     ):
         """
         Constructs an State Machine Generator class that generates a State Machine resource
@@ -73,6 +74,7 @@ class StateMachineGenerator(object):
         :param tags: Tags to be associated with the State Machine resource
         :param resource_attributes: Resource attributes to add to the State Machine resource
         :param passthrough_resource_attributes: Attributes such as `Condition` that are added to derived resources
+        :param api_definition_collection: Collection of the API definitions that Api events add routes to
         """
         self.logical_id = logical_id
         self.depends_on = depends_on
@@ -94,6 +96,7 @@ class StateMachineGenerator(object):
         self.event_resources = event_resources
         self.event_resolver = event_resolver
         self.tags = tags
+        self.api_definition_collection = api_definition_collection
         self.state_machine = StepFunctionsStateMachine(
             logical_id, depends_on=depends_on, attributes=resource_attributes
         )
@@ -254,6 +257,7 @@ class StateMachineGenerator(object):
                 kwargs = {
                     "intrinsics_resolver": self.intrinsics_resolver,
                     "permissions_boundary": self.permissions_boundary,
+                    "api_definition_collection": self.api_definition_collection,
                 }
                 try:
                     eventsource = self.event_resolver.resolve_resource_type(event_dict).from_dict(
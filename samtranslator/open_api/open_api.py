@@ -1,5 +1,6 @@
 import copy
 import re
+from collections import OrderedDict
 from six import string_types
 
 from samtranslator.model.intrinsics import ref
@@ -47,6 +48,7 @@ class OpenApiEditor(object):
         self.definitions = self._doc.get("definitions", {})
         self.tags = self._doc.get("tags", [])
         self.info = self._doc.get("info", {})
+        self._routes = None
 
     def get_path(self, path):
         """
@@ -191,7 +193,10 @@ class OpenApiEditor(object):
         if self._CONDITIONAL_IF in path_dict:
             path_dict = path_dict[self._CONDITIONAL_IF][1]
 
-        path_dict.setdefault(method, {})
+        if method not in path_dict:
+            path_dict[method] = {}
+            if self._routes is not None:
+                self._routes.setdefault(path, []).append((method, method))
 
     def add_lambda_integration(
         self, path, method, integration_uri, method_auth_config=None, api_auth_config=None, condition=None
@@ -253,6 +258,43 @@ class OpenApiEditor(object):
         for path, value in self.paths.items():
             yield path
 
+    def _get_routes(self):
+        """
+        Returns the route table of the OpenApi document, which lists the methods of every path along with their
+        normalized names. The table is built on first use and `add_path` keeps it up to date, so operations that apply
+        to every method of the API walk it once instead of re-reading and re-normalizing the methods of each path.
+
+        :return OrderedDict: Path name to list of (method name, normalized method name) tuples. Paths whose value is not
+            a dictionary map to None
+        """
+        if self._routes is None:
+            routes = OrderedDict()
+            for path in self.paths:
+                path_dict = self.get_path(path)
+                if isinstance(path_dict, dict):
+                    routes[path] = [(method, self._normalize_method_name(method)) for method in path_dict]
+                else:
+                    routes[path] = None
+            self._routes = routes
+        return self._routes
+
+    def _get_path_routes(self, path):
+        """
+        :param string path: Path name
+        :return list: (method name, normalized method name) tuples of the path
+        :raises InvalidDocumentException: If the value of `path` in OpenApi is not a dictionary
+        """
+        methods = self._get_routes().get(path)
+        if methods is None:
+            raise InvalidDocumentException(
+                [
+                    InvalidTemplateException(
+                        "Value of '{}' path must be a dictionary according to Swagger spec.".format(path)
+                    )
+                ]
+            )
+        return methods
+
     def add_timeout_to_method(self, api, path, method_name, timeout):
         """
         Adds a timeout to this path/method.
@@ -324,6 +366,18 @@ class OpenApiEditor(object):
         for authorizer_name, authorizer in authorizers.items():
             self.security_schemes[authorizer_name] = authorizer.generate_openapi()
 
+    def set_default_authorizer(self, default_authorizer, authorizers, api_authorizers):
+        """
+        Adds the default_authorizer to the security block of every method in the OpenApi document, in a single pass over
+        the route table. See `set_path_default_authorizer` for details.
+
+        :param string default_authorizer: Name of the authorizer to use as the default. Must be a key in the
+            authorizers param.
+        :param list authorizers: List of Authorizer configurations defined on the related Api.
+        """
+        for path in self._get_routes():
+            self.set_path_default_authorizer(path, default_authorizer, authorizers, api_authorizers)
+
     def set_path_default_authorizer(self, path, default_authorizer, authorizers, api_authorizers):
         """
         Adds the default_authorizer to the security block for each method on this path unless an Authorizer
@@ -336,15 +390,14 @@ class OpenApiEditor(object):
             authorizers param.
         :param list authorizers: List of Authorizer configurations defined on the related Api.
         """
-        for method_name, method in self.get_path(path).items():
-            normalized_method_name = self._normalize_method_name(method_name)
+        path_dict = self.get_path(path)
+        for method_name, normalized_method_name in self._get_path_routes(path):
             # Excluding parameters section
             if normalized_method_name == "parameters":
                 continue
             if normalized_method_name != "options":
-                normalized_method_name = self._normalize_method_name(method_name)
                 # It is possible that the method could have two definitions in a Fn::If block.
-                if normalized_method_name not in self.get_path(path):
+                if normalized_method_name not in path_dict:
                     raise InvalidDocumentException(
                         [
                             InvalidTemplateException(
@@ -352,16 +405,13 @@ class OpenApiEditor(object):
                             )
                         ]
                     )
-                for method_definition in self.get_method_contents(self.get_path(path)[normalized_method_name]):
+                for method_definition in self.get_method_contents(path_dict[normalized_method_name]):
                     # If no integration given, then we don't need to process this definition (could be AWS::NoValue)
                     if not self.method_definition_has_integration(method_definition):
                         continue
                     existing_security = method_definition.get("security", [])
                     if existing_security:
                         return
-                    authorizer_list = []
-                    if authorizers:
-                        authorizer_list.extend(authorizers.keys())
                     security_dict = dict()
                     security_dict[default_authorizer] = self._get_authorization_scopes(
                         api_authorizers, default_authorizer
@@ -40,6 +40,12 @@ class SamPlugins(object):
     Arguments passed to the hook method is different for each life cycle event. Check out the hook methods in the
     `BasePlugin` class for detailed description of the method signature
 
+    ### Dispatch
+    `act` only calls plugins that override the hook for the event; `BasePlugin`'s no-op hooks are skipped. A plugin
+    can also set `resource_types` to the set of resource types its `on_before_transform_resource` hook cares about, in
+    which case the hook is not called for any other type of resource. The list of plugins to call is computed on first
+    use of each event (and resource type) and reused until another plugin is registered.
+
     ### Raising validation errors
     Plugins must raise an `samtranslator.model.exception.InvalidResourceException` when the input SAM template does
     not conform to the expectation
@@ -53,6 +59,8 @@ class SamPlugins(object):
         :param BasePlugin or list initial_plugins: Single plugin or a List of plugins to initialize with
         """
         self._plugins = []
+        # Plugins to call, by hook method name (and resource type for resource level events). See _get_hook_plugins
+        self._hook_plugins = {}
 
         if initial_plugins is None:
             initial_plugins = []
@@ -80,6 +88,7 @@ class SamPlugins(object):
             raise ValueError("Plugin with name {} is already registered".format(plugin.name))
 
         self._plugins.append(plugin)
+        self._hook_plugins = {}
 
     def is_registered(self, plugin_name):
         """
@@ -122,12 +131,11 @@ class SamPlugins(object):
 
         method_name = "on_" + event.name
 
-        for plugin in self._plugins:
+        resource_type = None
+        if event is LifeCycleEvents.before_transform_resource:
+            resource_type = args[1] if len(args) > 1 else kwargs.get("resource_type")
 
-            if not hasattr(plugin, method_name):
-                raise NameError(
-                    "'{}' method is not found in the plugin with name '{}'".format(method_name, plugin.name)
-                )
+        for plugin in self._get_hook_plugins(method_name, resource_type):
 
             try:
                 getattr(plugin, method_name)(*args, **kwargs)
@@ -138,6 +146,51 @@ class SamPlugins(object):
                 LOG.exception("Plugin '%s' raised an exception: %s", plugin.name, ex)
                 raise ex
 
+    def _get_hook_plugins(self, method_name, resource_type=None):
+        """
+        Returns the plugins whose hook must be called for the given hook method, in registration order. Plugins that
+        keep `BasePlugin`'s no-op hook, and plugins whose `resource_types` do not contain `resource_type`, are left out.
+
+        :param string method_name: Name of the hook method
+        :param string resource_type: Type of the resource for resource level events. None for template level events
+        :return list: Plugins to call
+        :raises NameError: If a plugin does not have the hook method defined
+        """
+        key = (method_name, resource_type)
+        if key not in self._hook_plugins:
+            hook_plugins = []
+            for plugin in self._plugins:
+                if not hasattr(plugin, method_name):
+                    raise NameError(
+                        "'{}' method is not found in the plugin with name '{}'".format(method_name, plugin.name)
+                    )
+                if not _overrides_hook(plugin, method_name):
+                    continue
+                resource_types = getattr(plugin, "resource_types", None)
+                if resource_type is not None and resource_types is not None and resource_type not in resource_types:
+                    continue
+                hook_plugins.append(plugin)
+            self._hook_plugins[key] = hook_plugins
+        return self._hook_plugins[key]
+
+    def get_async_hooks(self, event):
+        """
+        Returns the async hooks that registered plugins declare for the given life cycle event. An async hook is a
+        coroutine method named `on_` followed by the name of the life cycle event and `_async`, for example
+        `on_before_transform_template_async`. They are awaited by `samtranslator.translator.async_transform` before
+        the synchronous hooks run, so plugins use them to prefetch whatever the synchronous hook needs from the network.
+
+        :param samtranslator.plugins.LifeCycleEvents event: Event to get the async hooks for
+        :return list: Bound hook methods, in plugin registration order. Plugins without an async hook are skipped
+        :raises ValueError: If event is not a valid life cycle event
+        """
+
+        if not isinstance(event, LifeCycleEvents):
+            raise ValueError("'event' must be an instance of LifeCycleEvents class")
+
+        method_name = "on_" + event.name + "_async"
+        return [getattr(plugin, method_name) for plugin in self._plugins if hasattr(plugin, method_name)]
+
     def __len__(self):
         """
         Returns the number of plugins registered with this class
@@ -147,6 +200,22 @@ class SamPlugins(object):
         return len(self._plugins)
 
 
+def _overrides_hook(plugin, method_name):
+    """
+    Checks whether the plugin implements the hook method itself instead of inheriting BasePlugin's no-op
+
+    :param BasePlugin plugin: Plugin to check
+    :param string method_name: Name of the hook method
+    :return: True if the hook must be called
+    """
+    if method_name in getattr(plugin, "__dict__", {}):
+        return True
+    for cls in type(plugin).__mro__:
+        if method_name in cls.__dict__:
+            return cls is not BasePlugin
+    return True
+
+
 class LifeCycleEvents(Enum):
     """
     Enum of LifeCycleEvents
@@ -162,6 +231,9 @@ class BasePlugin(object):
     Base class for a NoOp plugin that implements all available hooks
     """
 
+    # Set of resource types this plugin's `on_before_transform_resource` hook handles. None means all resource types
+    resource_types = None
+
     def __init__(self, name):
         """
         Initialize the plugin with given name. Name is always required to register a plugin
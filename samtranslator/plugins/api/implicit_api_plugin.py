@@ -1,8 +1,10 @@
 import copy
+from collections import OrderedDict
 
-from samtranslator.model.intrinsics import make_combined_condition
+from samtranslator.model.exceptions import ErrorCollector
+from samtranslator.model.conditions import ConditionInterner
 from samtranslator.public.plugins import BasePlugin
-from samtranslator.public.exceptions import InvalidDocumentException, InvalidResourceException, InvalidEventException
+from samtranslator.public.exceptions import InvalidResourceException, InvalidEventException
 from samtranslator.public.sdk.resource import SamResourceType
 from samtranslator.public.sdk.template import SamTemplate
 
@@ -29,13 +31,22 @@ class ImplicitApiPlugin(BasePlugin):
 
     """
 
-    def __init__(self, name):
+    def __init__(self, name, max_errors=None):
         """
         Initialize the plugin
+
+        :param string name: Name of the plugin
+        :param int max_errors: Number of invalid API events after which the plugin stops, or None to report them all
         """
         super(ImplicitApiPlugin, self).__init__(name)
 
+        self._max_errors = max_errors
+
         self.existing_implicit_api_resource = None
+        # Editors of the API definitions that events add paths to, by API logical id. See _get_api_editor
+        self._api_editors = OrderedDict()
+        # Adds the conditions that combine the conditions of the methods to the template. Set per template
+        self._condition_interner = None
         # dict containing condition (or None) for each resource path+method for all APIs. dict format:
         # {api_id: {path: {method: condition_name_or_None}}}
         self.api_conditions = {}
@@ -68,7 +79,8 @@ class ImplicitApiPlugin(BasePlugin):
 
         template.set(self.implicit_api_logical_id, self._generate_implicit_api_resource())
 
-        errors = []
+        errors = ErrorCollector(self._max_errors)
+        self._api_editors = OrderedDict()
         for logicalId, resource in template.iterate(
             {SamResourceType.Function.value, SamResourceType.StateMachine.value}
         ):
@@ -82,14 +94,16 @@ class ImplicitApiPlugin(BasePlugin):
                 self._process_api_events(resource, api_events, template, condition)
 
             except InvalidEventException as ex:
-                errors.append(InvalidResourceException(logicalId, ex.message))
+                errors.add(InvalidResourceException(logicalId, ex.message))
 
-        self._maybe_add_condition_to_implicit_api(template_dict)
+        self._write_api_definitions(template)
+        # Path conditions come first, so that the condition of the implicit API can be made of them
+        self._condition_interner = ConditionInterner(template_dict)
         self._maybe_add_conditions_to_implicit_api_paths(template)
+        self._maybe_add_condition_to_implicit_api(template_dict)
         self._maybe_remove_implicit_api(template)
 
-        if len(errors) > 0:
-            raise InvalidDocumentException(errors)
+        errors.raise_errors()
 
     def _get_api_events(self, resource):
         """
@@ -191,15 +205,35 @@ class ImplicitApiPlugin(BasePlugin):
             # Until then, we will not modify explicit explicit APIs.
             return
 
-        swagger = resource.properties.get("DefinitionBody")
-
         path = event_properties["Path"]
         method = event_properties["Method"]
-        editor = self.editor(swagger)
+        editor = self._get_api_editor(api_id, resource)
         editor.add_path(path, method)
 
-        resource.properties["DefinitionBody"] = self._get_api_definition_from_editor(editor)
-        template.set(api_id, resource)
+    def _get_api_editor(self, api_id, resource):
+        """
+        Returns the editor of the API's definition. The events of all functions add their paths to the same editor, and
+        the definition is written back to the API once by `_write_api_definitions`, instead of being copied in and out
+        of an editor for every event.
+
+        :param string api_id: LogicalId of the API
+        :param SamResource resource: The API resource
+        :return: Editor of the API's DefinitionBody
+        """
+        if api_id not in self._api_editors:
+            self._api_editors[api_id] = (resource, self.editor(resource.properties.get("DefinitionBody")))
+        return self._api_editors[api_id][1]
+
+    def _write_api_definitions(self, template):
+        """
+        Writes the definitions of the editors returned by `_get_api_editor` back to their APIs
+
+        :param SamTemplate template: SAM Template containing the APIs
+        """
+        for api_id, (resource, editor) in self._api_editors.items():
+            resource.properties["DefinitionBody"] = self._get_api_definition_from_editor(editor)
+            template.set(api_id, resource)
+        self._api_editors = OrderedDict()
 
     def _get_api_id(self, event_properties):
         """
@@ -242,28 +276,29 @@ class ImplicitApiPlugin(BasePlugin):
                 # If multiple functions with multiple different conditions reference the Implicit Api, we need to
                 # aggregate those conditions in order to conditionally create the Implicit Api. See RFC:
                 # https://github.com/awslabs/serverless-application-model/issues/758
-                implicit_api_resource["Condition"] = self.implicit_api_condition
-                self._add_combined_condition_to_template(
-                    template_dict, self.implicit_api_condition, all_resource_method_conditions
+                # Templates can refer to the condition of the implicit API by name, so it is always defined
+                implicit_api_resource["Condition"] = self._add_combined_condition_to_template(
+                    self.implicit_api_condition, all_resource_method_conditions, always_define=True
                 )
 
-    def _add_combined_condition_to_template(self, template_dict, condition_name, conditions_to_combine):
+    def _add_combined_condition_to_template(self, condition_name, conditions_to_combine, always_define=False):
         """
-        Add top-level template condition that combines the given list of conditions.
+        Add top-level template condition that combines the given list of conditions. If the template already has a
+        condition that combines the same conditions, it is used instead, unless always_define is set.
 
-        :param dict template_dict: SAM template dictionary
         :param string condition_name: Name of top-level template condition
         :param list conditions_to_combine: List of conditions that should be combined (via OR operator) to form
                                            top-level condition.
+        :param bool always_define: Whether the condition must be defined under condition_name
+        :return string: Name of the condition that combines the given conditions
         """
         # defensive precondition check
         if not conditions_to_combine or len(conditions_to_combine) < 2:
             raise ValueError("conditions_to_combine must have at least 2 conditions")
 
-        template_conditions = template_dict.setdefault("Conditions", {})
-        new_template_conditions = make_combined_condition(sorted(list(conditions_to_combine)), condition_name)
-        for name, definition in new_template_conditions.items():
-            template_conditions[name] = definition
+        return self._condition_interner.make_or_condition(
+            sorted(list(conditions_to_combine)), condition_name, always_define=always_define
+        )
 
     def _maybe_add_conditions_to_implicit_api_paths(self, template):
         """
@@ -294,9 +329,8 @@ class ImplicitApiPlugin(BasePlugin):
                     if len(all_method_conditions) == 1:
                         editor.make_path_conditional(path, all_method_conditions.pop())
                     else:
-                        path_condition_name = self._path_condition_name(api_id, path)
-                        self._add_combined_condition_to_template(
-                            template.template_dict, path_condition_name, all_method_conditions
+                        path_condition_name = self._add_combined_condition_to_template(
+                            self._path_condition_name(api_id, path), all_method_conditions
                         )
                         editor.make_path_conditional(path, path_condition_name)
 
@@ -26,11 +26,13 @@ class ImplicitHttpApiPlugin(ImplicitApiPlugin):
                                              in OpenApi. Does **not** configure the API by any means.
     """
 
-    def __init__(self):
+    def __init__(self, max_errors=None):
         """
         Initializes the plugin
+
+        :param int max_errors: Number of invalid API events after which the plugin stops, or None to report them all
         """
-        super(ImplicitHttpApiPlugin, self).__init__(ImplicitHttpApiPlugin.__name__)
+        super(ImplicitHttpApiPlugin, self).__init__(ImplicitHttpApiPlugin.__name__, max_errors=max_errors)
 
     def _setup_api_properties(self):
         """
@@ -29,11 +29,13 @@ class ImplicitRestApiPlugin(ImplicitApiPlugin):
 
     """
 
-    def __init__(self):
+    def __init__(self, max_errors=None):
         """
         Initialize the plugin
+
+        :param int max_errors: Number of invalid API events after which the plugin stops, or None to report them all
         """
-        super(ImplicitRestApiPlugin, self).__init__(ImplicitRestApiPlugin.__name__)
+        super(ImplicitRestApiPlugin, self).__init__(ImplicitRestApiPlugin.__name__, max_errors=max_errors)
 
     def _setup_api_properties(self):
         """
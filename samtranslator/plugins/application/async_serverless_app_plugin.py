@@ -0,0 +1,69 @@
+"""
+Asyncio flavor of the ServerlessAppPlugin. This module uses `async` syntax and requires Python 3.5+; it is only imported
+by the asyncio entry point in `samtranslator.translator.async_transform`.
+"""
+
+import asyncio
+import functools
+import logging
+
+from samtranslator.plugins.application.serverless_app_plugin import ServerlessAppPlugin
+from samtranslator.region_configuration import RegionConfiguration
+
+LOG = logging.getLogger(__name__)
+
+
+class AsyncServerlessAppPlugin(ServerlessAppPlugin):
+    """
+    ServerlessAppPlugin that issues its Serverless Application Repository calls concurrently from an asyncio event loop
+    instead of one after the other while the template is being transformed.
+
+    The calls are made in `on_before_transform_template_async`, which runs before the synchronous translation. By the
+    time the regular `on_before_transform_template` hook runs, every application already has a result and no service
+    call is left to make. The boto3 client is blocking, so each call runs on `executor` while the event loop keeps
+    serving other requests.
+    """
+
+    def __init__(self, service_call_limit, executor=None, **kwargs):
+        """
+        :param asyncio.Semaphore service_call_limit: Semaphore bounding the number of concurrent service calls
+        :param concurrent.futures.Executor executor: Executor to run the blocking calls on. Defaults to the loop's
+        :param kwargs: Arguments of ServerlessAppPlugin
+        """
+        super(AsyncServerlessAppPlugin, self).__init__(**kwargs)
+        self._service_call_limit = service_call_limit
+        self._executor = executor
+
+    async def on_before_transform_template_async(self, template_dict):
+        """
+        Resolves and fetches all applications of the template concurrently.
+
+        This runs before the template is validated, so templates without a well formed "Resources" section are left
+        for the synchronous translation to reject.
+
+        :param dict template_dict: Dictionary of the SAM template
+        :return: Nothing
+        """
+        resources = template_dict.get("Resources")
+        if not isinstance(resources, dict) or not all(isinstance(r, dict) for r in resources.values()):
+            return
+
+        applications = self._get_applications_to_fetch(template_dict)
+        if not applications:
+            return
+
+        # boto3 clients are thread safe, but creating them is not. Create it once here before fanning out.
+        if not self._sar_client and RegionConfiguration.is_sar_supported():
+            import boto3
+
+            self._sar_client = boto3.client("serverlessrepo")
+
+        loop = asyncio.get_event_loop()
+        await asyncio.gather(*[self._fetch_application_async(loop, *application) for application in applications])
+
+    async def _fetch_application_async(self, loop, app_id, semver, key, logical_id):
+        async with self._service_call_limit:
+            LOG.debug("Fetching application %s/%s on the executor", app_id, semver)
+            await loop.run_in_executor(
+                self._executor, functools.partial(self._fetch_application, app_id, semver, key, logical_id)
+            )
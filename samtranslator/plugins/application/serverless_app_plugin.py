@@ -1,17 +1,13 @@
-import boto3
 import json
-from botocore.exceptions import ClientError, EndpointConnectionError
 import logging
 from time import sleep, time
-import copy
 
 from samtranslator.model.exceptions import InvalidResourceException
 from samtranslator.plugins import BasePlugin
 from samtranslator.plugins.exceptions import InvalidPluginException
 from samtranslator.public.sdk.resource import SamResourceType
 from samtranslator.public.sdk.template import SamTemplate
-from samtranslator.intrinsics.resolver import IntrinsicsResolver
-from samtranslator.intrinsics.actions import FindInMapAction
+from samtranslator.intrinsics.context import ResolutionContext
 from samtranslator.region_configuration import RegionConfiguration
 
 LOG = logging.getLogger(__name__)
@@ -33,6 +29,7 @@ class ServerlessAppPlugin(BasePlugin):
     """
 
     SUPPORTED_RESOURCE_TYPE = "AWS::Serverless::Application"
+    resource_types = {SUPPORTED_RESOURCE_TYPE}
     SLEEP_TIME_SECONDS = 2
     # CloudFormation times out on transforms after 2 minutes, so setting this
     # timeout below that to leave some buffer
@@ -42,7 +39,16 @@ class ServerlessAppPlugin(BasePlugin):
     LOCATION_KEY = "Location"
     TEMPLATE_URL_KEY = "TemplateUrl"
 
-    def __init__(self, sar_client=None, wait_for_template_active_status=False, validate_only=False, parameters={}):
+    def __init__(
+        self,
+        sar_client=None,
+        wait_for_template_active_status=False,
+        validate_only=False,
+        parameters={},
+        max_errors=None,
+        metrics=None,
+        resolution_context=None,
+    ):
         """
         Initialize the plugin.
 
@@ -50,6 +56,14 @@ class ServerlessAppPlugin(BasePlugin):
         :param boto3.client sar_client: The boto3 client to use to access the Serverless Application Repository
         :param bool wait_for_template_active_status: Flag to wait for all templates to become active
         :param bool validate_only: Flag to only validate application access (uses get_application API instead)
+        :param int max_errors: Number of errors after which the translation stops, or None if it collects all errors.
+            When the translation can stop early, each application is fetched only when its resource is transformed,
+            so that no service call is made for templates that have already failed.
+        :param samtranslator.metrics.metrics.Metrics metrics: Optional metrics to record the number and latency of the
+            service calls on, per operation
+        :param samtranslator.intrinsics.context.ResolutionContext resolution_context: Parameter values and mappings of
+            the translation to resolve the locations of applications with. Without it, locations are resolved with
+            `parameters` and the mappings of the template.
         """
         super(ServerlessAppPlugin, self).__init__(ServerlessAppPlugin.__name__)
         self._applications = {}
@@ -58,6 +72,9 @@ class ServerlessAppPlugin(BasePlugin):
         self._wait_for_template_active_status = wait_for_template_active_status
         self._validate_only = validate_only
         self._parameters = parameters
+        self._resolution_context = resolution_context
+        self._fetch_on_transform_resource = max_errors is not None
+        self._metrics = metrics
 
         # make sure the flag combination makes sense
         if self._validate_only is True and self._wait_for_template_active_status is True:
@@ -75,25 +92,35 @@ class ServerlessAppPlugin(BasePlugin):
         :param dict template_dict: Dictionary of the SAM template
         :return: Nothing
         """
+        applications_to_fetch = self._get_applications_to_fetch(template_dict)
+        if self._fetch_on_transform_resource:
+            # Fetched by on_before_transform_resource, if the translation gets that far
+            return
+        for app_id, semver, key, logical_id in applications_to_fetch:
+            self._fetch_application(app_id, semver, key, logical_id)
+
+    def _get_applications_to_fetch(self, template_dict):
+        """
+        Resolves ApplicationId and SemanticVersion of every application in the template and returns the ones that
+        still need a service call, one entry per distinct (ApplicationId, SemanticVersion) pair.
+
+        :param dict template_dict: Dictionary of the SAM template
+        :return list: List of (app_id, semver, key, logical_id) tuples
+        """
         template = SamTemplate(template_dict)
-        intrinsic_resolvers = self._get_intrinsic_resolvers(template_dict.get("Mappings", {}))
+        resolution_context = self._get_resolution_context(template_dict.get("Mappings", {}))
 
-        service_call = None
-        if self._validate_only:
-            service_call = self._handle_get_application_request
-        else:
-            service_call = self._handle_create_cfn_template_request
+        applications_to_fetch = []
+        keys_to_fetch = set()
         for logical_id, app in template.iterate({SamResourceType.Application.value}):
             if not self._can_process_application(app):
                 # Handle these cases in the on_before_transform_resource event
                 continue
 
-            app_id = self._replace_value(
-                app.properties[self.LOCATION_KEY], self.APPLICATION_ID_KEY, intrinsic_resolvers
-            )
+            app_id = self._replace_value(app.properties[self.LOCATION_KEY], self.APPLICATION_ID_KEY, resolution_context)
 
             semver = self._replace_value(
-                app.properties[self.LOCATION_KEY], self.SEMANTIC_VERSION_KEY, intrinsic_resolvers
+                app.properties[self.LOCATION_KEY], self.SEMANTIC_VERSION_KEY, resolution_context
             )
 
             if isinstance(app_id, dict) or isinstance(semver, dict):
@@ -103,36 +130,54 @@ class ServerlessAppPlugin(BasePlugin):
 
             key = (app_id, semver)
 
-            if key not in self._applications:
-                try:
-                    if not RegionConfiguration.is_sar_supported():
-                        raise InvalidResourceException(
-                            logical_id, "Serverless Application Repository is not available in this region."
-                        )
-                    # Lazy initialization of the client- create it when it is needed
-                    if not self._sar_client:
-                        self._sar_client = boto3.client("serverlessrepo")
-                    service_call(app_id, semver, key, logical_id)
-                except InvalidResourceException as e:
-                    # Catch all InvalidResourceExceptions, raise those in the before_resource_transform target.
-                    self._applications[key] = e
-
-    def _replace_value(self, input_dict, key, intrinsic_resolvers):
-        value = self._resolve_location_value(input_dict.get(key), intrinsic_resolvers)
+            if key not in self._applications and key not in keys_to_fetch:
+                keys_to_fetch.add(key)
+                applications_to_fetch.append((app_id, semver, key, logical_id))
+
+        return applications_to_fetch
+
+    def _fetch_application(self, app_id, semver, key, logical_id):
+        """
+        Makes the service call for a single application and records its result in `_applications`
+
+        :param string app_id: ApplicationId
+        :param string semver: SemanticVersion
+        :param string key: The dictionary key consisting of (ApplicationId, SemanticVersion)
+        :param string logical_id: the logical_id of this application resource
+        """
+        if self._validate_only:
+            service_call = self._handle_get_application_request
+        else:
+            service_call = self._handle_create_cfn_template_request
+
+        try:
+            if not RegionConfiguration.is_sar_supported():
+                raise InvalidResourceException(
+                    logical_id, "Serverless Application Repository is not available in this region."
+                )
+            # Lazy initialization of the client- create it when it is needed
+            if not self._sar_client:
+                import boto3
+
+                self._sar_client = boto3.client("serverlessrepo")
+            service_call(app_id, semver, key, logical_id)
+        except InvalidResourceException as e:
+            # Catch all InvalidResourceExceptions, raise those in the before_resource_transform target.
+            self._applications[key] = e
+
+    def _replace_value(self, input_dict, key, resolution_context):
+        value = resolution_context.resolve(input_dict.get(key))
         input_dict[key] = value
         return value
 
-    def _get_intrinsic_resolvers(self, mappings):
-        return [
-            IntrinsicsResolver(self._parameters),
-            IntrinsicsResolver(mappings, {FindInMapAction.intrinsic_name: FindInMapAction()}),
-        ]
-
-    def _resolve_location_value(self, value, intrinsic_resolvers):
-        resolved_value = copy.deepcopy(value)
-        for intrinsic_resolver in intrinsic_resolvers:
-            resolved_value = intrinsic_resolver.resolve_parameter_refs(resolved_value)
-        return resolved_value
+    def _get_resolution_context(self, mappings):
+        if self._resolution_context is None:
+            resolution_context = ResolutionContext(self._parameters, mappings)
+        else:
+            resolution_context = self._resolution_context.with_mappings(mappings)
+        # Invalid parameters or mappings are reported even without applications
+        resolution_context.create_resolvers()
+        return resolution_context
 
     def _can_process_application(self, app):
         """
@@ -161,10 +206,15 @@ class ServerlessAppPlugin(BasePlugin):
         :param string key: The dictionary key consisting of (ApplicationId, SemanticVersion)
         :param string logical_id: the logical_id of this application resource
         """
+        from botocore.exceptions import EndpointConnectionError
+
         LOG.info("Getting application {}/{} from serverless application repo...".format(app_id, semver))
-        get_application = lambda app_id, semver: self._sar_client.get_application(
-            ApplicationId=self._sanitize_sar_str_param(app_id), SemanticVersion=self._sanitize_sar_str_param(semver)
-        )
+
+        def get_application(app_id, semver):
+            return self._sar_client.get_application(
+                ApplicationId=self._sanitize_sar_str_param(app_id), SemanticVersion=self._sanitize_sar_str_param(semver)
+            )
+
         try:
             self._sar_service_call(get_application, logical_id, app_id, semver)
             self._applications[key] = {"Available"}
@@ -185,9 +235,12 @@ class ServerlessAppPlugin(BasePlugin):
         :param string logical_id: the logical_id of this application resource
         """
         LOG.info("Requesting to create CFN template {}/{} in serverless application repo...".format(app_id, semver))
-        create_cfn_template = lambda app_id, semver: self._sar_client.create_cloud_formation_template(
-            ApplicationId=self._sanitize_sar_str_param(app_id), SemanticVersion=self._sanitize_sar_str_param(semver)
-        )
+
+        def create_cfn_template(app_id, semver):
+            return self._sar_client.create_cloud_formation_template(
+                ApplicationId=self._sanitize_sar_str_param(app_id), SemanticVersion=self._sanitize_sar_str_param(semver)
+            )
+
         response = self._sar_service_call(create_cfn_template, logical_id, app_id, semver)
         LOG.info("Requested to create CFN template {}/{} in serverless application repo.".format(app_id, semver))
         self._applications[key] = response[self.TEMPLATE_URL_KEY]
@@ -263,6 +316,9 @@ class ServerlessAppPlugin(BasePlugin):
 
         key = (app_id, semver)
 
+        if key not in self._applications and self._fetch_on_transform_resource:
+            self._fetch_application(app_id, semver, key, logical_id)
+
         # Throw any resource exceptions saved from the before_transform_template event
         if isinstance(self._applications[key], InvalidResourceException):
             raise self._applications[key]
@@ -304,12 +360,13 @@ class ServerlessAppPlugin(BasePlugin):
                 # Check each resource to make sure it's active
                 LOG.info("Checking resources in serverless application repo...")
                 for application_id, template_id in temp:
-                    get_cfn_template = (
-                        lambda application_id, template_id: self._sar_client.get_cloud_formation_template(
+
+                    def get_cfn_template(application_id, template_id):
+                        return self._sar_client.get_cloud_formation_template(
                             ApplicationId=self._sanitize_sar_str_param(application_id),
                             TemplateId=self._sanitize_sar_str_param(template_id),
                         )
-                    )
+
                     response = self._sar_service_call(get_cfn_template, application_id, application_id, template_id)
                     self._handle_get_cfn_template_response(response, application_id, template_id)
                 LOG.info("Finished checking resources in serverless application repo.")
@@ -352,10 +409,14 @@ class ServerlessAppPlugin(BasePlugin):
         Handles service calls and exception management for service calls
         to the Serverless Application Repository.
 
-        :param lambda service_call_lambda: lambda function that contains the service call
+        :param function service_call_lambda: function that contains the service call. Its name is the operation the
+            call is recorded as in the metrics
         :param string logical_id: Logical ID of the resource being processed
         :param list *args: arguments for the service call lambda
         """
+        from botocore.exceptions import ClientError
+
+        start = time()
         try:
             response = service_call_lambda(*args)
             LOG.info(response)
@@ -368,6 +429,11 @@ class ServerlessAppPlugin(BasePlugin):
             # 'ForbiddenException'- SAR rejects connection
             LOG.exception(e)
             raise e
+        finally:
+            if self._metrics is not None:
+                dimensions = [{"Name": "Operation", "Value": service_call_lambda.__name__}]
+                self._metrics.record_count("SarCall", dimensions=dimensions)
+                self._metrics.record_latency("SarCallLatency", (time() - start) * 1000, dimensions=dimensions)
 
     def _resource_is_supported(self, resource_type):
         """
@@ -377,3 +443,13 @@ class ServerlessAppPlugin(BasePlugin):
         :return: True, if this plugin supports this resource. False otherwise
         """
         return resource_type == self.SUPPORTED_RESOURCE_TYPE
+
+
+class OfflineSarClient(object):
+    """
+    Stand-in for the Serverless Application Repository client of translations that only validate the template. Every
+    application is reported as available without making a service call. Use it with `validate_only=True`.
+    """
+
+    def get_application(self, ApplicationId=None, SemanticVersion=None):
+        return {"ApplicationId": ApplicationId, "SemanticVersion": SemanticVersion}
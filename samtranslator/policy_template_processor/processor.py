@@ -1,8 +1,6 @@
 import json
-import jsonschema
 from samtranslator import policy_templates_data
 
-from jsonschema.exceptions import ValidationError
 from samtranslator.policy_template_processor.template import Template
 from samtranslator.policy_template_processor.exceptions import TemplateNotFoundException
 
@@ -110,6 +108,9 @@ class PolicyTemplatesProcessor(object):
         :raises ValueError: If the template dictionary doesn't match up with the schema
         """
 
+        import jsonschema
+        from jsonschema.exceptions import ValidationError
+
         if not schema:
             schema = PolicyTemplatesProcessor._read_schema()
 
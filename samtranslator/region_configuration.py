@@ -1,5 +1,3 @@
-import boto3
-
 from .translator.arn_generator import ArnGenerator
 
 
@@ -33,6 +31,8 @@ class RegionConfiguration(object):
 
         :return: True, if SAR is supported in current region.
         """
+        import boto3
+
         return boto3.Session().region_name not in [
             "af-south-1",
         ]
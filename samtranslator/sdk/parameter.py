@@ -1,4 +1,3 @@
-import boto3
 import copy
 
 from samtranslator.translator.arn_generator import ArnGenerator, NoRegionFound
@@ -16,7 +15,11 @@ class SamParameterValues(object):
         :param dict parameter_values: Parameter value dictionary containing parameter name & value
         """
 
-        self.parameter_values = copy.deepcopy(parameter_values)
+        # Only top level values are added, so only values that can be modified in place are copied
+        self.parameter_values = {
+            name: copy.deepcopy(value) if isinstance(value, (dict, list)) else value
+            for name, value in parameter_values.items()
+        }
 
     def add_default_parameter_values(self, sam_template):
         """
@@ -67,7 +70,7 @@ class SamParameterValues(object):
         """
 
         if session is None:
-            session = boto3.session.Session()
+            session = ArnGenerator.get_default_boto_session()
 
         if not session.region_name:
             raise NoRegionFound("AWS Region cannot be found")
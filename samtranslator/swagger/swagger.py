@@ -1,6 +1,7 @@
 ﻿import copy
 import json
 import re
+from collections import OrderedDict
 from six import string_types
 
 from samtranslator.model.intrinsics import ref
@@ -48,6 +49,7 @@ class SwaggerEditor(object):
         self.gateway_responses = self._doc.get(self._X_APIGW_GATEWAY_RESPONSES, {})
         self.resource_policy = self._doc.get(self._X_APIGW_POLICY, {})
         self.definitions = self._doc.get("definitions", {})
+        self._routes = None
 
     def get_path(self, path):
         path_dict = self.paths.get(path)
@@ -150,7 +152,10 @@ class SwaggerEditor(object):
         if self._CONDITIONAL_IF in path_dict:
             path_dict = path_dict[self._CONDITIONAL_IF][1]
 
-        path_dict.setdefault(method, {})
+        if method not in path_dict:
+            path_dict[method] = {}
+            if self._routes is not None:
+                self._routes.setdefault(path, []).append((method, method))
 
     def add_lambda_integration(
         self, path, method, integration_uri, method_auth_config=None, api_auth_config=None, condition=None
@@ -286,6 +291,43 @@ class SwaggerEditor(object):
         for path, value in self.paths.items():
             yield path
 
+    def _get_routes(self):
+        """
+        Returns the route table of the Swagger, which lists the methods of every path along with their normalized names.
+        The table is built on first use and `add_path` keeps it up to date, so operations that apply to every method of
+        the API walk it once instead of re-reading and re-normalizing the methods of each path.
+
+        :return OrderedDict: Path name to list of (method name, normalized method name) tuples. Paths whose value is not
+            a dictionary map to None
+        """
+        if self._routes is None:
+            routes = OrderedDict()
+            for path in self.paths:
+                path_dict = self.get_path(path)
+                if isinstance(path_dict, dict):
+                    routes[path] = [(method, self._normalize_method_name(method)) for method in path_dict]
+                else:
+                    routes[path] = None
+            self._routes = routes
+        return self._routes
+
+    def _get_path_routes(self, path):
+        """
+        :param string path: Path name
+        :return list: (method name, normalized method name) tuples of the path
+        :raises InvalidDocumentException: If the value of `path` in Swagger is not a dictionary
+        """
+        methods = self._get_routes().get(path)
+        if methods is None:
+            raise InvalidDocumentException(
+                [
+                    InvalidTemplateException(
+                        "Value of '{}' path must be a dictionary according to Swagger spec.".format(path)
+                    )
+                ]
+            )
+        return methods
+
     def add_cors(
         self, path, allowed_origins, allowed_headers=None, allowed_methods=None, max_age=None, allow_credentials=None
     ):
@@ -505,6 +547,25 @@ class SwaggerEditor(object):
         if "api_key" not in self.security_definitions:
             self.security_definitions.update(api_key_security_definition)
 
+    def set_default_authorizer(
+        self, default_authorizer, authorizers, add_default_auth_to_preflight=True, api_authorizers=None
+    ):
+        """
+        Adds the default_authorizer to the security block of every method in the Swagger, in a single pass over the
+        route table. See `set_path_default_authorizer` for details.
+
+        :param string default_authorizer: Name of the authorizer to use as the default. Must be a key in the
+            authorizers param.
+        :param list authorizers: List of Authorizer configurations defined on the related Api.
+        :param bool add_default_auth_to_preflight: Bool of whether to add the default
+            authorizer to OPTIONS preflight requests.
+        """
+        authorizer_names = self._get_authorizer_names(authorizers)
+        for path in self._get_routes():
+            self._set_path_default_authorizer(
+                path, default_authorizer, authorizer_names, add_default_auth_to_preflight, api_authorizers
+            )
+
     def set_path_default_authorizer(
         self, path, default_authorizer, authorizers, add_default_auth_to_preflight=True, api_authorizers=None
     ):
@@ -521,17 +582,32 @@ class SwaggerEditor(object):
         :param bool add_default_auth_to_preflight: Bool of whether to add the default
             authorizer to OPTIONS preflight requests.
         """
+        self._set_path_default_authorizer(
+            path,
+            default_authorizer,
+            self._get_authorizer_names(authorizers),
+            add_default_auth_to_preflight,
+            api_authorizers,
+        )
 
-        for method_name, method in self.get_path(path).items():
-            normalized_method_name = self._normalize_method_name(method_name)
-
+    @staticmethod
+    def _get_authorizer_names(authorizers):
+        authorizer_list = ["AWS_IAM"]
+        if authorizers:
+            authorizer_list.extend(authorizers.keys())
+        return set(authorizer_list)
+
+    def _set_path_default_authorizer(
+        self, path, default_authorizer, authorizer_names, add_default_auth_to_preflight, api_authorizers
+    ):
+        path_dict = self.get_path(path)
+        for method_name, normalized_method_name in self._get_path_routes(path):
             # Excluding parameters section
             if normalized_method_name == "parameters":
                 continue
             if add_default_auth_to_preflight or normalized_method_name != "options":
-                normalized_method_name = self._normalize_method_name(method_name)
                 # It is possible that the method could have two definitions in a Fn::If block.
-                for method_definition in self.get_method_contents(self.get_path(path)[normalized_method_name]):
+                for method_definition in self.get_method_contents(path_dict[normalized_method_name]):
 
                     # If no integration given, then we don't need to process this definition (could be AWS::NoValue)
                     if not isinstance(method_definition, dict):
@@ -545,10 +621,6 @@ class SwaggerEditor(object):
                     if not self.method_definition_has_integration(method_definition):
                         continue
                     existing_security = method_definition.get("security", [])
-                    authorizer_list = ["AWS_IAM"]
-                    if authorizers:
-                        authorizer_list.extend(authorizers.keys())
-                    authorizer_names = set(authorizer_list)
                     existing_non_authorizer_security = []
                     existing_authorizer_security = []
 
@@ -606,10 +678,18 @@ class SwaggerEditor(object):
                         method_definition["security"] = security
 
                         # The first element of the method_definition['security'] should be AWS_IAM
-                        # because authorizer_list = ['AWS_IAM'] is hardcoded above
+                        # because authorizer_names always contains 'AWS_IAM'
                         if "AWS_IAM" in method_definition["security"][0]:
                             self.add_awsiam_security_definition()
 
+    def set_default_apikey_required(self):
+        """
+        Adds the ApiKey security as required for every method in the Swagger, in a single pass over the route table.
+        See `set_path_default_apikey_required` for details.
+        """
+        for path in self._get_routes():
+            self.set_path_default_apikey_required(path)
+
     def set_path_default_apikey_required(self, path):
         """
         Add the ApiKey security as required for each method on this path unless ApiKeyRequired
@@ -619,15 +699,14 @@ class SwaggerEditor(object):
 
         :param string path: Path name
         """
-
-        for method_name, _ in self.get_path(path).items():
+        path_dict = self.get_path(path)
+        for method_name, normalized_method_name in self._get_path_routes(path):
             # Excluding parameters section
             if method_name == "parameters":
                 continue
 
-            normalized_method_name = self._normalize_method_name(method_name)
             # It is possible that the method could have two definitions in a Fn::If block.
-            for method_definition in self.get_method_contents(self.get_path(path)[normalized_method_name]):
+            for method_definition in self.get_method_contents(path_dict[normalized_method_name]):
 
                 # If no integration given, then we don't need to process this definition (could be AWS::NoValue)
                 if not self.method_definition_has_integration(method_definition):
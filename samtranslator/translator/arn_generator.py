@@ -1,12 +1,13 @@
-import boto3
-
-
 class NoRegionFound(Exception):
     pass
 
 
 class ArnGenerator(object):
     class_boto_session = None
+    # Session that finds the region when no session is given. Creating a boto3 session registers hundreds of event
+    # handlers, so it is created once rather than for every ARN. It still reads the region from the environment
+    # variables each time it is asked for it.
+    _default_boto_session = None
 
     @classmethod
     def generate_arn(cls, partition, service, resource, include_account_id=True):
@@ -51,7 +52,7 @@ class ArnGenerator(object):
             # mechanism, starting from AWS_DEFAULT_REGION environment variable.
 
             if ArnGenerator.class_boto_session is None:
-                region = boto3.session.Session().region_name
+                region = cls.get_default_boto_session().region_name
             else:
                 region = ArnGenerator.class_boto_session.region_name
 
@@ -75,3 +76,16 @@ class ArnGenerator(object):
             partition = "aws-us-gov"
 
         return partition
+
+    @classmethod
+    def get_default_boto_session(cls):
+        """
+        Gets the boto3 session that finds the region when no session is given, creating it on first use
+
+        :return boto3.session.Session: Default session
+        """
+        if ArnGenerator._default_boto_session is None:
+            import boto3
+
+            ArnGenerator._default_boto_session = boto3.session.Session()
+        return ArnGenerator._default_boto_session
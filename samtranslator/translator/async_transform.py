@@ -0,0 +1,117 @@
+"""
+Asyncio entry point of the translator, for services that embed it in an event loop. This module uses `async` syntax and
+requires Python 3.5+.
+
+Translation itself is CPU bound and stays synchronous; it runs on an executor so the event loop is free while it runs.
+The service calls translation needs (IAM managed policies, Serverless Application Repository and AppConfig) are made
+from the event loop ahead of time, concurrently and bounded by a semaphore, instead of from inside the translation.
+"""
+import asyncio
+import functools
+
+from samtranslator.feature_toggle.feature_toggle import FeatureToggle, FeatureToggleAppConfigConfigProvider
+from samtranslator.intrinsics.context import ResolutionContext
+from samtranslator.parser.parser import Parser
+from samtranslator.plugins import LifeCycleEvents, SamPlugins
+from samtranslator.plugins.application.async_serverless_app_plugin import AsyncServerlessAppPlugin
+from samtranslator.plugins.application.serverless_app_plugin import ServerlessAppPlugin
+from samtranslator.translator.translator import Translator
+
+# Default number of service calls a single translation is allowed to have in flight at once. Share one semaphore
+# between translations to bound the total instead.
+DEFAULT_SERVICE_CALL_CONCURRENCY = 8
+
+
+async def act_async(sam_plugins, event, *args, **kwargs):
+    """
+    Awaits the async hooks that the registered plugins declare for the given life cycle event, one plugin after the
+    other in registration order, the same way `SamPlugins.act` invokes synchronous hooks.
+
+    :param samtranslator.plugins.SamPlugins sam_plugins: Plugins to act on
+    :param samtranslator.plugins.LifeCycleEvents event: Event to act upon
+    :return: Nothing
+    """
+    for hook in sam_plugins.get_async_hooks(event):
+        await hook(*args, **kwargs)
+
+
+async def transform_async(
+    input_fragment,
+    parameter_values,
+    managed_policy_loader,
+    feature_toggle=None,
+    plugins=None,
+    executor=None,
+    service_call_limit=None,
+):
+    """Asyncio counterpart of `samtranslator.translator.transform.transform`.
+
+    :param dict input_fragment: the SAM template to transform
+    :param dict parameter_values: Parameter values provided by the user
+    :param managed_policy_loader: Loader of the managed policy map. Its blocking `load()` runs on the executor
+    :param FeatureToggle feature_toggle: Optional feature toggle, see `load_app_config_feature_toggle_async`
+    :param list plugins: Optional list of plugins, in addition to the default ones. Plugins may declare async hooks,
+        see `SamPlugins.get_async_hooks`
+    :param concurrent.futures.Executor executor: Executor running translation and blocking service calls. Defaults to
+        the event loop's default executor
+    :param asyncio.Semaphore service_call_limit: Semaphore bounding concurrent service calls. Defaults to a new
+        semaphore of DEFAULT_SERVICE_CALL_CONCURRENCY for this translation
+    :returns: the transformed CloudFormation template
+    :rtype: dict
+    """
+    loop = asyncio.get_event_loop()
+    if service_call_limit is None:
+        service_call_limit = asyncio.Semaphore(DEFAULT_SERVICE_CALL_CONCURRENCY)
+
+    async with service_call_limit:
+        managed_policy_map = await loop.run_in_executor(executor, managed_policy_loader.load)
+
+    # Created once, for the plugins and for the translation
+    resolution_context = ResolutionContext.from_template(input_fragment, parameter_values)
+    plugins = list(plugins) if plugins else []
+    if not any(isinstance(plugin, ServerlessAppPlugin) for plugin in plugins):
+        # Same position as the default ServerlessAppPlugin: after customer plugins, before the required ones
+        plugins.append(
+            AsyncServerlessAppPlugin(service_call_limit, executor=executor, resolution_context=resolution_context)
+        )
+
+    await act_async(SamPlugins(plugins), LifeCycleEvents.before_transform_template, input_fragment)
+
+    translator = Translator(managed_policy_map, Parser(), plugins=plugins)
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(
+            translator.translate,
+            input_fragment,
+            parameter_values=parameter_values,
+            feature_toggle=feature_toggle,
+            resolution_context=resolution_context,
+        ),
+    )
+
+
+async def load_app_config_feature_toggle_async(
+    application_id, environment_id, configuration_profile_id, executor=None, service_call_limit=None, **kwargs
+):
+    """
+    Creates a FeatureToggle backed by FeatureToggleAppConfigConfigProvider without blocking the event loop on the
+    initial AppConfig call. Background refreshes of the provider run on their own thread.
+
+    :param application_id: AppConfig application id
+    :param environment_id: AppConfig environment id
+    :param configuration_profile_id: AppConfig configuration profile id
+    :param concurrent.futures.Executor executor: Executor to run the initial fetch on
+    :param asyncio.Semaphore service_call_limit: Optional semaphore bounding concurrent service calls
+    :param kwargs: Other arguments of FeatureToggleAppConfigConfigProvider
+    :return FeatureToggle: Feature toggle using the AppConfig provider
+    """
+    loop = asyncio.get_event_loop()
+    create_provider = functools.partial(
+        FeatureToggleAppConfigConfigProvider, application_id, environment_id, configuration_profile_id, **kwargs
+    )
+    if service_call_limit is None:
+        provider = await loop.run_in_executor(executor, create_provider)
+    else:
+        async with service_call_limit:
+            provider = await loop.run_in_executor(executor, create_provider)
+    return FeatureToggle(provider)
@@ -0,0 +1,331 @@
+"""
+Cache of translated templates, in front of `Translator.translate`.
+
+Translating a template is deterministic given the template, the effective parameter values (the values passed in,
+with the defaults of the template's parameters and the pseudo parameters added), the feature toggle config, the managed
+policy map, the policy templates and the version of the translator. The cache keys the translated template by a
+SHA-256 digest of all of these, so byte-identical re-translations (re-runs, promotions between stages with the same
+parameters, several tools of one pipeline transforming the same template) are served without translating again.
+
+Templates with applications of the Serverless Application Repository are an exception: their translation depends on
+the application as SAR serves it at the time. They are not cached, unless the cache is given a TTL for them.
+
+Templates are only cached if they are plain JSON: with dictionary keys that are all strings, and values that JSON
+encodes, such as no dates. JSON would encode the key 1 like the key "1", although they translate differently.
+
+Every hit returns a new copy of the template that callers are free to modify, equal to the template of a translation
+and of the same types. MemoryCacheBackend pickles entries. DiskCacheBackend stores them as JSON text, and skips
+templates that JSON does not preserve, such as templates with dictionary keys that are not strings.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from six import string_types
+
+from samtranslator import __version__
+from samtranslator.policy_templates_data import POLICY_TEMPLATES_FILE
+from samtranslator.utils.files import replace_file
+
+LOG = logging.getLogger(__name__)
+
+# Default number of templates kept by MemoryCacheBackend
+DEFAULT_MAX_ENTRIES = 128
+
+# Default total size, in bytes, of the templates kept by DiskCacheBackend
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+_APPLICATION_TYPE = "AWS::Serverless::Application"
+
+# Key of a translation. `ttl` is the number of seconds the translated template may be served for, or None if it does
+# not expire.
+TranslationCacheKey = namedtuple("TranslationCacheKey", ["digest", "ttl"])
+
+# Cached translation: the translated template, and the state of the translator the translation leaves behind, see
+# `Translator.function_names`, `Translator.redeploy_restapi_parameters` and `Translator.resource_sources`
+CachedTranslation = namedtuple(
+    "CachedTranslation", ["template", "function_names", "redeploy_restapi_parameters", "resource_sources"]
+)
+
+
+class TranslationCache(object):
+    """
+    Cache of translated templates. Pass it to the Translator (or to `transform`) to use it. One cache can be shared by
+    several translators, as long as they are configured with the same plugins: plugins are not part of the key.
+    """
+
+    def __init__(self, backend=None, application_ttl=None):
+        """
+        :param backend: Storage of the cached templates, MemoryCacheBackend or DiskCacheBackend. Defaults to a
+            MemoryCacheBackend of DEFAULT_MAX_ENTRIES templates
+        :param int application_ttl: Number of seconds the translations of templates with Serverless Application
+            Repository applications are cached for. By default, they are not cached
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.application_ttl = application_ttl
+        self._policy_map_digest = (None, None)
+
+    def get_key(self, sam_template, parameter_values, feature_toggle, managed_policy_map, minimize_output=False):
+        """
+        Computes the key of a translation. It must be called before the translation, which modifies the template.
+
+        :param dict sam_template: SAM template to translate
+        :param dict parameter_values: Effective parameter values of the translation
+        :param FeatureToggle feature_toggle: Feature toggle of the translation
+        :param dict managed_policy_map: Managed policy map of the translation
+        :param bool minimize_output: Whether the translated template is minimized
+        :return TranslationCacheKey: Key of the translation, or None if it must not be cached
+        """
+        ttl = None
+        if _has_applications(sam_template):
+            if self.application_ttl is None:
+                return None
+            ttl = self.application_ttl
+
+        inputs = [
+            __version__,
+            _get_policy_templates_digest(),
+            self._get_policy_map_digest(managed_policy_map),
+            _get_feature_toggle_version(feature_toggle),
+            parameter_values,
+            sam_template,
+        ]
+        if minimize_output:
+            inputs.append("MinimizedOutput")
+        try:
+            digest = _digest(inputs)
+        except (TypeError, ValueError) as ex:
+            # Such as keys that are not strings, or values that are not JSON
+            LOG.debug("Template is not cached, its key cannot be computed: %s", ex)
+            return None
+        return TranslationCacheKey(digest, ttl)
+
+    def get(self, key):
+        """
+        :param TranslationCacheKey key: Key of the translation
+        :return CachedTranslation: New copy of the translation, or None if it is not cached or has expired
+        """
+        entry = self.backend.get(key.digest)
+        if entry is None:
+            return None
+        if entry["Expires"] is not None and entry["Expires"] <= time.time():
+            self.backend.delete(key.digest)
+            return None
+        return CachedTranslation(
+            entry["Template"], entry["FunctionNames"], entry["RedeployRestApiParameters"], entry["ResourceSources"]
+        )
+
+    def put(self, key, translation):
+        """
+        :param TranslationCacheKey key: Key of the translation
+        :param CachedTranslation translation: Translation to cache. It is serialized right away, so the caller may
+            modify it afterwards
+        """
+        expires = time.time() + key.ttl if key.ttl is not None else None
+        entry = {
+            "Expires": expires,
+            "Template": translation.template,
+            "FunctionNames": translation.function_names,
+            "RedeployRestApiParameters": translation.redeploy_restapi_parameters,
+            "ResourceSources": translation.resource_sources,
+        }
+        self.backend.set(key.digest, entry)
+
+    def _get_policy_map_digest(self, managed_policy_map):
+        # Policy maps are loaded once and reused for every translation, so the digest of the last one is kept. The map
+        # itself is kept along with it, so that its id is not reused by another map.
+        policy_map, digest = self._policy_map_digest
+        if policy_map is not managed_policy_map:
+            digest = _digest(managed_policy_map)
+            self._policy_map_digest = (managed_policy_map, digest)
+        return digest
+
+
+class MemoryCacheBackend(object):
+    """
+    Keeps the most recently used templates in memory, pickled so that every hit returns a new copy of the same types
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        :param int max_entries: Number of templates to keep. The least recently used ones are evicted beyond it
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return None
+            self._entries[key] = entry
+        return pickle.loads(entry)
+
+    def set(self, key, entry):
+        try:
+            entry = pickle.dumps(entry, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as ex:
+            LOG.debug("Translated template is not cached, it cannot be pickled: %s", ex)
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskCacheBackend(object):
+    """
+    Keeps templates in JSON files of a directory, so that they are shared between processes and survive restarts. When
+    the files grow beyond the maximum size, the least recently used ones are deleted.
+    """
+
+    SUFFIX = ".json"
+
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE):
+        """
+        :param string directory: Directory of the cache. It is created if it does not exist
+        :param int max_size: Total size of the files to keep, in bytes
+        """
+        self.directory = directory
+        self.max_size = max_size
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def get(self, key):
+        path = self._get_path(key)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+            # The modification time of the file records when it was last used
+            os.utime(path, None)
+        except (IOError, OSError, ValueError):
+            return None
+        return entry
+
+    def set(self, key, entry):
+        try:
+            encoded = json.dumps(entry, separators=(",", ":"))
+        except (TypeError, ValueError) as ex:
+            LOG.debug("Translated template is not cached, it cannot be serialized: %s", ex)
+            return
+        if json.loads(encoded) != entry:
+            # Such as dictionary keys that are not strings, which JSON turns into strings
+            LOG.debug("Translated template is not cached, JSON does not preserve it")
+            return
+        temp_path = None
+        try:
+            # Write to a temporary file first so that readers never see a partially written entry
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=".translation")
+            with os.fdopen(fd, "w") as f:
+                f.write(encoded)
+            replace_file(temp_path, self._get_path(key))
+            temp_path = None
+        except (IOError, OSError) as ex:
+            LOG.warning("Failed to write translation cache entry in '{}': {}".format(self.directory, ex))
+            return
+        finally:
+            if temp_path is not None:
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+        self._evict()
+
+    def delete(self, key):
+        try:
+            os.remove(self._get_path(key))
+        except (IOError, OSError):
+            pass
+
+    def _get_path(self, key):
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def _evict(self):
+        files = []
+        total_size = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(self.SUFFIX):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                # Deleted by another process
+                continue
+            files.append((stat.st_mtime, name, stat.st_size))
+            total_size += stat.st_size
+
+        for _, name, size in sorted(files):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total_size -= size
+
+
+def _has_applications(sam_template):
+    resources = sam_template.get("Resources")
+    if not isinstance(resources, dict):
+        return False
+    return any(
+        isinstance(resource, dict) and resource.get("Type") == _APPLICATION_TYPE for resource in resources.values()
+    )
+
+
+def _get_feature_toggle_version(feature_toggle):
+    # Providers that track the version of their config, such as the AppConfig one, spare hashing the whole config
+    version = getattr(feature_toggle.config_provider, "config_version", None)
+    if version is not None:
+        return version
+    return _digest(feature_toggle.feature_config)
+
+
+_policy_templates_digest = None
+
+
+def _get_policy_templates_digest():
+    global _policy_templates_digest
+    if _policy_templates_digest is None:
+        with open(POLICY_TEMPLATES_FILE, "rb") as f:
+            _policy_templates_digest = hashlib.sha256(f.read()).hexdigest()
+    return _policy_templates_digest
+
+
+def _digest(value):
+    """
+    :return string: SHA-256 hex digest of the canonical JSON encoding of the value, with dictionary keys sorted
+    :raises TypeError: If the value has dictionary keys that are not strings, or values that JSON cannot encode
+    """
+    _check_keys(value)
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _check_keys(value):
+    # JSON encodes the key 1 like the key "1", and True like "true", while they translate differently
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if not isinstance(key, string_types):
+                raise TypeError("Dictionary key {!r} is not a string".format(key))
+            _check_keys(item)
+    elif isinstance(value, list):
+        for item in value:
+            _check_keys(item)
@@ -24,3 +24,16 @@ class ManagedPolicyLoader(object):
             LOG.info("Finished loading policies from IAM.")
             self._policy_map = name_to_arn_map
         return self._policy_map
+
+
+class OfflineManagedPolicyMap(dict):
+    """
+    Stand-in for the managed policy map of translations that only validate the template. It is empty, so policy names
+    are left as they are instead of being resolved to ARNs, which does not change whether a template is valid. Unlike
+    an empty map, it is not rejected as a map that failed to load.
+    """
+
+    def __bool__(self):
+        return True
+
+    __nonzero__ = __bool__
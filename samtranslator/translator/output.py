@@ -0,0 +1,128 @@
+"""
+Writers of translated templates. They stream the template to a file-like object (a file, or a socket through
+`socket.makefile`) section by section instead of building the whole document in memory first, and compute the SHA-256
+digest of the written document along the way so callers do not serialize it a second time to get it.
+"""
+import hashlib
+import json
+
+from six import string_types
+
+# Written text is buffered and passed to the stream and the digest in chunks of this many characters
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# Indentation of the pretty JSON output
+PRETTY_INDENT = 2
+
+# Levels of the template that are written one entry at a time. The template is written key by key, and sections such
+# as Resources and Outputs entry by entry. Each entry is encoded as a whole, with the C accelerated encoder of the
+# standard library when the output is compact.
+_STREAMED_LEVELS = 2
+
+
+def write_json(template, stream, pretty=True):
+    """
+    Writes the template to the stream as JSON
+
+    :param dict template: CloudFormation template
+    :param stream: File-like object opened for writing text
+    :param bool pretty: Indent the document. The output is then the same as `json.dumps(template, indent=2)`.
+        Otherwise the document is written in its most compact form, without whitespace.
+    :return string: Hex SHA-256 digest of the UTF-8 encoded document
+    """
+    if pretty:
+        encoder = json.JSONEncoder(indent=PRETTY_INDENT, separators=(",", ": "))
+    else:
+        encoder = json.JSONEncoder(separators=(",", ":"))
+
+    writer = DigestWriter(stream)
+    for chunk in _iterencode(template, encoder, pretty, 0):
+        writer.write(chunk)
+    writer.flush()
+    return writer.hexdigest()
+
+
+def write_yaml(template, stream):
+    """
+    Writes the template to the stream as YAML, with intrinsic functions in their short form (!Ref, !GetAtt, !Sub...).
+    Requires PyYAML.
+
+    :param dict template: CloudFormation template
+    :param stream: File-like object opened for writing text
+    :return string: Hex SHA-256 digest of the UTF-8 encoded document
+    """
+    # PyYAML is only needed to write YAML
+    from samtranslator.yaml_helper import yaml_dump
+
+    writer = DigestWriter(stream)
+    yaml_dump(template, writer)
+    writer.flush()
+    return writer.hexdigest()
+
+
+class DigestWriter(object):
+    """
+    File-like object that buffers the text written to it, passes it on to another stream and computes the SHA-256
+    digest of its UTF-8 encoding
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._sha256 = hashlib.sha256()
+        self._buffer = []
+        self._buffer_size = 0
+
+    def write(self, data):
+        self._buffer.append(data)
+        self._buffer_size += len(data)
+        if self._buffer_size >= WRITE_BUFFER_SIZE:
+            self._write_buffer()
+
+    def flush(self):
+        self._write_buffer()
+        if hasattr(self._stream, "flush"):
+            self._stream.flush()
+
+    def hexdigest(self):
+        """
+        :return string: Hex SHA-256 digest of everything written so far
+        """
+        self._write_buffer()
+        return self._sha256.hexdigest()
+
+    def _write_buffer(self):
+        if not self._buffer:
+            return
+        data = "".join(self._buffer)
+        self._buffer = []
+        self._buffer_size = 0
+        self._stream.write(data)
+        self._sha256.update(data.encode("utf-8") if not isinstance(data, bytes) else data)
+
+
+def _iterencode(value, encoder, pretty, level):
+    """
+    Yields the JSON encoding of the value in chunks, one per entry of the first levels of the document
+    """
+    if (
+        level >= _STREAMED_LEVELS
+        or not isinstance(value, dict)
+        or not value
+        or not all(isinstance(key, string_types) for key in value)
+    ):
+        encoded = encoder.encode(value)
+        if pretty and level:
+            # JSON strings cannot contain line breaks, so every line break is an indentation of the encoded value
+            encoded = encoded.replace("\n", "\n" + " " * PRETTY_INDENT * level)
+        yield encoded
+        return
+
+    item_indent = "\n" + " " * PRETTY_INDENT * (level + 1) if pretty else ""
+    key_separator = ": " if pretty else ":"
+    separator = "{"
+    for key, item in value.items():
+        yield separator + item_indent + encoder.encode(key) + key_separator
+        for chunk in _iterencode(item, encoder, pretty, level + 1):
+            yield chunk
+        separator = ","
+    yield ("\n" + " " * PRETTY_INDENT * level if pretty else "") + "}"
@@ -0,0 +1,255 @@
+"""
+Size of translated templates, and how to reduce it.
+
+CloudFormation rejects templates larger than TEMPLATE_SIZE_LIMIT bytes. `analyze_template_size` reports where the bytes
+of a translated template go, per resource type and per SAM resource that generated the resources. Sizes are those of
+the compact JSON encoding of the template, the smallest form it can be uploaded in.
+
+`minimize_template` applies encodings that make the template smaller without changing what is deployed:
+
+- State machine definitions built by SAM as an `Fn::Join` of pretty-printed lines are written as a single compact JSON
+  string. Step Functions parses the definition, so the whitespace does not matter.
+- The Lambda permissions that API Gateway events of a function add for each route of an API are merged into one
+  permission for the whole API, as SAM already does for functions that serve the `$default` route of an HTTP API. API
+  Gateway only invokes the function on the routes that integrate it, so the same requests reach the function.
+"""
+import json
+import re
+from collections import OrderedDict, namedtuple
+
+from six import string_types, text_type
+
+# Maximum size, in bytes, of a template passed to CloudFormation through S3
+TEMPLATE_SIZE_LIMIT = 1024 * 1024
+
+_STATE_MACHINE_TYPE = "AWS::StepFunctions::StateMachine"
+_PERMISSION_TYPE = "AWS::Lambda::Permission"
+_API_GATEWAY_PRINCIPAL = "apigateway.amazonaws.com"
+
+# SourceArn of the permissions of API Gateway events, as built by Api and HttpApi event sources
+_API_SOURCE_ARN_REGEX = re.compile(
+    r"^(arn:(?:\$\{AWS::Partition\}|[^:$]+):execute-api:\$\{AWS::Region\}:\$\{AWS::AccountId\}:\$\{__ApiId__\}/).+$"
+)
+_API_PERMISSION_PROPERTIES = {"Action", "FunctionName", "Principal", "SourceArn"}
+
+# Size of a part of a template. `bytes` is the size of its compact JSON encoding, and `count` the number of resources
+# it is made of.
+SizeEntry = namedtuple("SizeEntry", ["bytes", "count"])
+
+
+class TemplateSizeReport(object):
+    """
+    Sizes of a translated template, in bytes of its compact JSON encoding
+    """
+
+    def __init__(self, total_bytes, section_bytes, resource_type_sizes, source_sizes):
+        """
+        :param int total_bytes: Size of the whole template
+        :param OrderedDict section_bytes: Size of each top-level section of the template, largest first
+        :param OrderedDict resource_type_sizes: SizeEntry of the resources of each type, largest first
+        :param OrderedDict source_sizes: SizeEntry of the resources generated by each SAM resource, largest first.
+            Resources that are not generated by a SAM resource are their own source.
+        """
+        self.total_bytes = total_bytes
+        self.section_bytes = section_bytes
+        self.resource_type_sizes = resource_type_sizes
+        self.source_sizes = source_sizes
+
+    @property
+    def limit_ratio(self):
+        """
+        :return float: Size of the template relative to TEMPLATE_SIZE_LIMIT
+        """
+        return float(self.total_bytes) / TEMPLATE_SIZE_LIMIT
+
+    def to_dict(self):
+        return {
+            "TotalBytes": self.total_bytes,
+            "LimitRatio": round(self.limit_ratio, 4),
+            "Sections": dict(self.section_bytes),
+            "ResourceTypes": _entries_to_dict(self.resource_type_sizes),
+            "Sources": _entries_to_dict(self.source_sizes),
+        }
+
+    def format(self, top=10):
+        """
+        :param int top: Number of resource types and sources to list
+        :return string: Human readable report
+        """
+        lines = ["Template size: {} bytes ({:.1%} of the limit)".format(self.total_bytes, self.limit_ratio)]
+        for title, sizes in (("resource type", self.resource_type_sizes), ("SAM resource", self.source_sizes)):
+            lines.append("Largest by {}:".format(title))
+            for name, entry in list(sizes.items())[:top]:
+                lines.append("  {:>10} bytes  {:>5} resources  {}".format(entry.bytes, entry.count, name))
+        return "\n".join(lines)
+
+
+def analyze_template_size(template, resource_sources=None):
+    """
+    :param dict template: Translated template
+    :param dict resource_sources: Logical ids of the SAM resources that generated the resources of the template, by
+        logical id of the generated resource, such as Translator.resource_sources
+    :return TemplateSizeReport: Sizes of the template
+    """
+    resource_sources = resource_sources or {}
+    section_bytes = {}
+    total_bytes = 2 + max(len(template) - 1, 0)  # Braces and commas
+    for section, value in template.items():
+        section_bytes[section] = _get_entry_size(section, value)
+        total_bytes += section_bytes[section]
+
+    resource_type_sizes = {}
+    source_sizes = {}
+    resources = template.get("Resources")
+    if isinstance(resources, dict):
+        for logical_id, resource in resources.items():
+            size = _get_entry_size(logical_id, resource)
+            resource_type = resource.get("Type") if isinstance(resource, dict) else None
+            _add_size(resource_type_sizes, resource_type or "Unknown", size)
+            _add_size(source_sizes, resource_sources.get(logical_id, logical_id), size)
+
+    return TemplateSizeReport(
+        total_bytes,
+        OrderedDict(sorted(section_bytes.items(), key=lambda item: (-item[1], item[0]))),
+        _sort_sizes(resource_type_sizes),
+        _sort_sizes(source_sizes),
+    )
+
+
+def minimize_template(template):
+    """
+    Applies the encodings described in the module documentation to the template, in place
+
+    :param dict template: Translated template
+    :return dict: The template
+    """
+    resources = template.get("Resources")
+    if not isinstance(resources, dict):
+        return template
+    _compact_definition_strings(resources)
+    _merge_api_permissions(template, resources)
+    return template
+
+
+def _compact_definition_strings(resources):
+    for resource in resources.values():
+        if not isinstance(resource, dict) or resource.get("Type") != _STATE_MACHINE_TYPE:
+            continue
+        properties = resource.get("Properties")
+        if not isinstance(properties, dict):
+            continue
+        definition = _parse_joined_definition(properties.get("DefinitionString"))
+        if definition is not None:
+            properties["DefinitionString"] = json.dumps(definition, sort_keys=True, separators=(",", ":"))
+
+
+def _parse_joined_definition(definition_string):
+    """
+    :return dict: State machine definition of a DefinitionString that joins JSON lines, None for other values
+    """
+    if not isinstance(definition_string, dict) or list(definition_string.keys()) != ["Fn::Join"]:
+        return None
+    arguments = definition_string["Fn::Join"]
+    if not isinstance(arguments, list) or len(arguments) != 2 or arguments[0] != "\n":
+        return None
+    lines = arguments[1]
+    if not isinstance(lines, list) or not all(isinstance(line, string_types) for line in lines):
+        return None
+    try:
+        definition = json.loads("\n".join(lines))
+    except ValueError:
+        return None
+    return definition if isinstance(definition, dict) else None
+
+
+def _merge_api_permissions(template, resources):
+    referenced_ids = set()
+    _collect_referenced_ids(template, referenced_ids)
+
+    groups = OrderedDict()
+    for logical_id in sorted(resources):
+        key = _get_api_permission_key(resources[logical_id])
+        if key is not None:
+            groups.setdefault(key, []).append(logical_id)
+
+    for logical_ids in groups.values():
+        if len(logical_ids) < 2:
+            continue
+        kept_id = logical_ids[0]
+        source_arn = resources[kept_id]["Properties"]["SourceArn"]["Fn::Sub"]
+        match = _API_SOURCE_ARN_REGEX.match(source_arn[0])
+        resources[kept_id]["Properties"]["SourceArn"] = {
+            "Fn::Sub": [match.group(1) + "*", {"__ApiId__": source_arn[1]["__ApiId__"]}]
+        }
+        for logical_id in logical_ids[1:]:
+            # Permissions that something depends on or refers to are kept as they are
+            if logical_id not in referenced_ids:
+                del resources[logical_id]
+
+
+def _get_api_permission_key(resource):
+    """
+    :return string: Key of the permissions that can be merged with this one, None if it cannot be merged
+    """
+    if not isinstance(resource, dict) or resource.get("Type") != _PERMISSION_TYPE:
+        return None
+    properties = resource.get("Properties")
+    if not isinstance(properties, dict) or set(properties.keys()) != _API_PERMISSION_PROPERTIES:
+        return None
+    if properties["Principal"] != _API_GATEWAY_PRINCIPAL or properties["Action"] != "lambda:InvokeFunction":
+        return None
+    source_arn = properties["SourceArn"]
+    if not isinstance(source_arn, dict) or list(source_arn.keys()) != ["Fn::Sub"]:
+        return None
+    arguments = source_arn["Fn::Sub"]
+    if not isinstance(arguments, list) or len(arguments) != 2 or not isinstance(arguments[0], string_types):
+        return None
+    if not isinstance(arguments[1], dict) or set(arguments[1].keys()) != {"__ApiId__", "__Stage__"}:
+        return None
+    match = _API_SOURCE_ARN_REGEX.match(arguments[0])
+    if match is None:
+        return None
+    # Permissions of the same function and API, with the same resource attributes
+    attributes = dict((key, value) for key, value in resource.items() if key not in ("Properties",))
+    return json.dumps(
+        [match.group(1), properties["FunctionName"], arguments[1]["__ApiId__"], attributes], sort_keys=True
+    )
+
+
+def _collect_referenced_ids(value, referenced_ids):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key == "Ref" and isinstance(item, string_types):
+                referenced_ids.add(item)
+            elif key == "Fn::GetAtt" and isinstance(item, list) and item and isinstance(item[0], string_types):
+                referenced_ids.add(item[0])
+            elif key == "DependsOn":
+                referenced_ids.update([item] if isinstance(item, string_types) else item)
+            _collect_referenced_ids(item, referenced_ids)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_referenced_ids(item, referenced_ids)
+
+
+def _get_entry_size(key, value):
+    return _get_size(key) + 1 + _get_size(value)
+
+
+def _get_size(value):
+    encoded = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+    if isinstance(encoded, text_type):
+        encoded = encoded.encode("utf-8")
+    return len(encoded)
+
+
+def _add_size(sizes, name, size):
+    entry = sizes.get(name, SizeEntry(0, 0))
+    sizes[name] = SizeEntry(entry.bytes + size, entry.count + 1)
+
+
+def _sort_sizes(sizes):
+    return OrderedDict(sorted(sizes.items(), key=lambda item: (-item[1].bytes, item[0])))
+
+
+def _entries_to_dict(sizes):
+    return dict((name, {"Bytes": entry.bytes, "Count": entry.count}) for name, entry in sizes.items())
@@ -2,15 +2,35 @@ from samtranslator.translator.translator import Translator
 from samtranslator.parser.parser import Parser
 
 
-def transform(input_fragment, parameter_values, managed_policy_loader, feature_toggle=None):
+def transform(
+    input_fragment,
+    parameter_values,
+    managed_policy_loader,
+    feature_toggle=None,
+    max_errors=None,
+    cache=None,
+    metrics=None,
+    minimize_output=False,
+):
     """Translates the SAM manifest provided in the and returns the translation to CloudFormation.
 
     :param dict input_fragment: the SAM template to transform
     :param dict parameter_values: Parameter values provided by the user
+    :param int max_errors: Number of errors after which the translation stops, or None to collect all errors
+    :param samtranslator.translator.cache.TranslationCache cache: Optional cache of translated templates, see
+        `samtranslator.translator.cache`
+    :param samtranslator.metrics.metrics.Metrics metrics: Optional metrics the translation records on, see
+        `samtranslator.metrics.metrics`
+    :param bool minimize_output: Make the transformed template smaller without changing what is deployed, see
+        `samtranslator.translator.output_size`
     :returns: the transformed CloudFormation template
     :rtype: dict
     """
 
     sam_parser = Parser()
-    translator = Translator(managed_policy_loader.load(), sam_parser)
-    return translator.translate(input_fragment, parameter_values=parameter_values, feature_toggle=feature_toggle)
+    translator = Translator(
+        managed_policy_loader.load(), sam_parser, cache=cache, metrics=metrics, minimize_output=minimize_output
+    )
+    return translator.translate(
+        input_fragment, parameter_values=parameter_values, feature_toggle=feature_toggle, max_errors=max_errors
+    )
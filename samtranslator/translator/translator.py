@@ -1,49 +1,83 @@
 import copy
+from time import time
 
 from samtranslator.feature_toggle.feature_toggle import (
     FeatureToggle,
     FeatureToggleLocalConfigProvider,
     FeatureToggleDefaultConfigProvider,
 )
-from samtranslator.model import ResourceTypeResolver, sam_resources
-from samtranslator.model.api.api_generator import SharedApiUsagePlan
+from samtranslator.model import ResourceTypeResolver
+from samtranslator.translator.cache import CachedTranslation
+from samtranslator.translator.output_size import minimize_template
 from samtranslator.translator.verify_logical_id import verify_unique_logical_id
+from samtranslator.model.conditions import ConditionInterner
 from samtranslator.model.preferences.deployment_preference_collection import DeploymentPreferenceCollection
 from samtranslator.model.exceptions import (
     InvalidDocumentException,
     InvalidResourceException,
     DuplicateLogicalIdException,
     InvalidEventException,
+    ErrorCollector,
 )
-from samtranslator.intrinsics.resolver import IntrinsicsResolver
-from samtranslator.intrinsics.actions import FindInMapAction
+from samtranslator.intrinsics.context import ResolutionContext
 from samtranslator.intrinsics.resource_refs import SupportedResourceReferences
 from samtranslator.plugins.api.default_definition_body_plugin import DefaultDefinitionBodyPlugin
-from samtranslator.plugins.application.serverless_app_plugin import ServerlessAppPlugin
+from samtranslator.plugins.application.serverless_app_plugin import OfflineSarClient, ServerlessAppPlugin
 from samtranslator.plugins import LifeCycleEvents
 from samtranslator.plugins import SamPlugins
 from samtranslator.plugins.globals.globals_plugin import GlobalsPlugin
 from samtranslator.plugins.policies.policy_templates_plugin import PolicyTemplatesForResourcePlugin
 from samtranslator.policy_template_processor.processor import PolicyTemplatesProcessor
-from samtranslator.sdk.parameter import SamParameterValues
 from samtranslator.translator.arn_generator import ArnGenerator
+from samtranslator.translator.managed_policy_translator import OfflineManagedPolicyMap
 
 
 class Translator:
     """Translates SAM templates into CloudFormation templates"""
 
-    def __init__(self, managed_policy_map, sam_parser, plugins=None, boto_session=None):
+    def __init__(
+        self,
+        managed_policy_map,
+        sam_parser,
+        plugins=None,
+        boto_session=None,
+        validate_only=False,
+        cache=None,
+        metrics=None,
+        minimize_output=False,
+    ):
         """
-        :param dict managed_policy_map: Map of managed policy names to the ARNs
+        :param dict managed_policy_map: Map of managed policy names to the ARNs. Can be None if `validate_only` is set
         :param sam_parser: Instance of a SAM Parser
         :param list of samtranslator.plugins.BasePlugin plugins: List of plugins to be installed in the translator,
             in addition to the default ones.
+        :param bool validate_only: Only check that templates translate, without building the CloudFormation template.
+            Resources are translated and validated as usual, but `translate` returns None. Managed policy names are not
+            resolved, and applications of the Serverless Application Repository are not fetched, so that no service
+            call is made.
+        :param samtranslator.translator.cache.TranslationCache cache: Optional cache of translated templates. A
+            template that was translated before with the same parameter values and configuration is returned from it
+            instead of being translated again. Templates are not cached when the translator only validates.
+        :param samtranslator.metrics.metrics.Metrics metrics: Optional metrics that translations record their latency,
+            the latency of their phases, their number of resources and their errors on, along with the calls made to
+            the Serverless Application Repository
+        :param bool minimize_output: Make translated templates smaller with the encodings of
+            `samtranslator.translator.output_size.minimize_template`, which do not change what is deployed
         """
+        if validate_only and managed_policy_map is None:
+            managed_policy_map = OfflineManagedPolicyMap()
         self.managed_policy_map = managed_policy_map
         self.plugins = plugins
         self.sam_parser = sam_parser
         self.feature_toggle = None
         self.boto_session = boto_session
+        self.validate_only = validate_only
+        self.cache = cache
+        self.metrics = metrics
+        self.minimize_output = minimize_output
+        # Logical ids of the SAM resources that generated the resources of the last translated template, by logical id
+        # of the generated resource. See samtranslator.translator.output_size.analyze_template_size
+        self.resource_sources = {}
 
         ArnGenerator.class_boto_session = self.boto_session
 
@@ -77,45 +111,123 @@ class Translator:
                                 )
         return self.function_names
 
-    def translate(self, sam_template, parameter_values, feature_toggle=None):
+    def translate(self, sam_template, parameter_values, feature_toggle=None, max_errors=None, resolution_context=None):
         """Loads the SAM resources from the given SAM manifest, replaces them with their corresponding
         CloudFormation resources, and returns the resulting CloudFormation template.
 
         :param dict sam_template: the SAM manifest, as loaded by json.load() or yaml.load(), or as provided by \
-                CloudFormation transforms.
+                CloudFormation transforms. Plugins modify it, unless the translator has a cache: it is then left
+                unchanged, whether the translation is cached or not.
         :param dict parameter_values: Map of template parameter names to their values. It is a required parameter that
                 should at least be an empty map. By providing an empty map, the caller explicitly opts-into the idea
                 that some functionality that relies on resolving parameter references might not work as expected
                 (ex: auto-creating new Lambda Version when CodeUri contains reference to template parameter). This is
                 why this parameter is required
+        :param int max_errors: Number of errors after which the translation stops and raises them. By default all
+                errors of the template are collected. Set it to 1 to stop at the first error, when only the validity of
+                the template matters.
+        :param samtranslator.intrinsics.context.ResolutionContext resolution_context: Optional context of the parameter
+                values of this template, if the caller already created it for its own plugins. By default it is created
+                from the template and the parameter values.
 
         :returns: a copy of the template with SAM resources replaced with the corresponding CloudFormation, which may \
-                be dumped into a valid CloudFormation JSON or YAML template
+                be dumped into a valid CloudFormation JSON or YAML template. None if the translator only validates.
         """
+        if self.metrics is None:
+            return self._translate(sam_template, parameter_values, feature_toggle, max_errors, resolution_context)
+
+        start = time()
+        transform_failure = 0
+        invalid_document = 0
+        try:
+            return self._translate(sam_template, parameter_values, feature_toggle, max_errors, resolution_context)
+        except InvalidDocumentException as e:
+            invalid_document = 1
+            for cause in e.causes:
+                self.metrics.record_count(
+                    "DocumentError", dimensions=[{"Name": "ErrorType", "Value": type(cause).__name__}]
+                )
+            raise
+        except Exception:
+            transform_failure = 1
+            raise
+        finally:
+            self.metrics.record_count("TransformFailure", transform_failure)
+            self.metrics.record_count("InvalidDocument", invalid_document)
+            self._record_latency("TransformLatency", start)
+
+    def _translate(self, sam_template, parameter_values, feature_toggle, max_errors, resolution_context):
         self.feature_toggle = feature_toggle if feature_toggle else FeatureToggle(FeatureToggleDefaultConfigProvider())
         self.function_names = dict()
         self.redeploy_restapi_parameters = dict()
-        sam_parameter_values = SamParameterValues(parameter_values)
-        sam_parameter_values.add_default_parameter_values(sam_template)
-        sam_parameter_values.add_pseudo_parameter_values(self.boto_session)
-        parameter_values = sam_parameter_values.parameter_values
+        self.resource_sources = {}
+        if resolution_context is None:
+            resolution_context = ResolutionContext.from_template(sam_template, parameter_values, self.boto_session)
+        parameter_values = resolution_context.parameter_values
+
+        cache_key = None
+        if self.cache is not None and not self.validate_only:
+            cache_key = self.cache.get_key(
+                sam_template,
+                parameter_values,
+                self.feature_toggle,
+                self.managed_policy_map,
+                minimize_output=self.minimize_output,
+            )
+            cached = self.cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                self.function_names = cached.function_names
+                self.redeploy_restapi_parameters = cached.redeploy_restapi_parameters
+                if "function_names" in self.redeploy_restapi_parameters:
+                    # Same dictionary, as after a translation
+                    self.redeploy_restapi_parameters["function_names"] = self.function_names
+                self.resource_sources = cached.resource_sources
+                return cached.template
+            # Plugins modify the template they translate. Hits leave the caller's template as it is, and so do misses.
+            sam_template = copy.deepcopy(sam_template)
+
         # Create & Install plugins
-        sam_plugins = prepare_plugins(self.plugins, parameter_values)
+        sam_plugins = prepare_plugins(
+            self.plugins,
+            parameter_values,
+            max_errors=max_errors,
+            validate_only=self.validate_only,
+            metrics=self.metrics,
+            resolution_context=resolution_context,
+        )
 
+        phase_start = time()
         self.sam_parser.parse(sam_template=sam_template, parameter_values=parameter_values, sam_plugins=sam_plugins)
-
-        template = copy.deepcopy(sam_template)
-        macro_resolver = ResourceTypeResolver(sam_resources)
-        intrinsics_resolver = IntrinsicsResolver(parameter_values)
-        mappings_resolver = IntrinsicsResolver(
-            template.get("Mappings", {}), {FindInMapAction.intrinsic_name: FindInMapAction()}
-        )
+        self._record_latency("ParseLatency", phase_start)
+        phase_start = time()
+
+        # Without output, the template is only read, so it is not copied
+        template = sam_template if self.validate_only else copy.deepcopy(sam_template)
+        # SAM resources (and the generators they use) are imported on first translation rather than with the package
+        from samtranslator.model.api.api_generator import SharedApiUsagePlan
+        from samtranslator.model.api.definition_collection import ApiDefinitionCollection
+        from samtranslator.model.s3_utils.notification_collection import S3NotificationCollection
+
+        macro_resolver = ResourceTypeResolver("samtranslator.model.sam_resources")
+        # Plugins share the context, unless they replaced the mappings of the template
+        resolution_context = resolution_context.with_mappings(sam_template.get("Mappings", {}))
+        intrinsics_resolver = resolution_context.intrinsics_resolver
+        mappings_resolver = resolution_context.mappings_resolver
         deployment_preference_collection = DeploymentPreferenceCollection()
         supported_resource_refs = SupportedResourceReferences()
         shared_api_usage_plan = SharedApiUsagePlan()
-        document_errors = []
+        s3_notification_collection = S3NotificationCollection()
+        api_definition_collection = ApiDefinitionCollection()
+        document_errors = ErrorCollector(max_errors)
+        condition_interner = ConditionInterner(template)
         changed_logical_ids = {}
-        for logical_id, resource_dict in self._get_resources_to_iterate(sam_template, macro_resolver):
+        resources_to_iterate = self._get_resources_to_iterate(sam_template, macro_resolver)
+        self._record_count("SamResourceCount", len(resources_to_iterate))
+        for logical_id, resource_dict in resources_to_iterate:
+            # Functions and state machines come first. API definitions are written once, after all of their events
+            # have added routes, and before the APIs are translated.
+            if resource_dict["Type"] not in ("AWS::Serverless::Function", "AWS::Serverless::StateMachine"):
+                api_definition_collection.write_definitions()
             try:
                 macro = macro_resolver.resolve_resource_type(resource_dict).from_dict(
                     logical_id, resource_dict, sam_plugins=sam_plugins
@@ -126,13 +238,15 @@ class Translator:
                 kwargs["intrinsics_resolver"] = intrinsics_resolver
                 kwargs["mappings_resolver"] = mappings_resolver
                 kwargs["deployment_preference_collection"] = deployment_preference_collection
-                kwargs["conditions"] = template.get("Conditions")
+                kwargs["condition_interner"] = condition_interner
                 # add the value of FunctionName property if the function is referenced with the api resource
                 self.redeploy_restapi_parameters["function_names"] = self._get_function_names(
                     resource_dict, intrinsics_resolver
                 )
                 kwargs["redeploy_restapi_parameters"] = self.redeploy_restapi_parameters
                 kwargs["shared_api_usage_plan"] = shared_api_usage_plan
+                kwargs["s3_notification_collection"] = s3_notification_collection
+                kwargs["api_definition_collection"] = api_definition_collection
                 translated = macro.to_cloudformation(**kwargs)
 
                 supported_resource_refs = macro.get_resource_references(translated, supported_resource_refs)
@@ -141,49 +255,106 @@ class Translator:
                 if logical_id != macro.logical_id:
                     changed_logical_ids[logical_id] = macro.logical_id
 
-                del template["Resources"][logical_id]
+                if not self.validate_only:
+                    del template["Resources"][logical_id]
                 for resource in translated:
                     if verify_unique_logical_id(resource, sam_template["Resources"]):
-                        template["Resources"].update(resource.to_dict())
+                        self._add_resource(template, resource)
+                        self.resource_sources[resource.logical_id] = logical_id
                     else:
-                        document_errors.append(
+                        document_errors.add(
                             DuplicateLogicalIdException(logical_id, resource.logical_id, resource.resource_type)
                         )
             except (InvalidResourceException, InvalidEventException) as e:
-                document_errors.append(e)
+                document_errors.add(e)
+
+        # In case no API resource followed the functions and state machines
+        api_definition_collection.write_definitions()
+
+        # Buckets are written once, after the S3 events of all functions have been collected
+        try:
+            for bucket in s3_notification_collection.get_bucket_resources():
+                self._add_resource(template, bucket)
+        except InvalidResourceException as e:
+            document_errors.add(e)
 
         if deployment_preference_collection.any_enabled():
-            template["Resources"].update(deployment_preference_collection.codedeploy_application.to_dict())
+            self._add_resource(template, deployment_preference_collection.codedeploy_application)
 
             if not deployment_preference_collection.can_skip_service_role():
-                template["Resources"].update(deployment_preference_collection.codedeploy_iam_role.to_dict())
+                self._add_resource(template, deployment_preference_collection.codedeploy_iam_role)
 
             for logical_id in deployment_preference_collection.enabled_logical_ids():
                 try:
-                    template["Resources"].update(
-                        deployment_preference_collection.deployment_group(logical_id).to_dict()
-                    )
+                    self._add_resource(template, deployment_preference_collection.deployment_group(logical_id))
                 except InvalidResourceException as e:
-                    document_errors.append(e)
+                    document_errors.add(e)
+
+        self._record_latency("TranslateResourcesLatency", phase_start)
+        phase_start = time()
+
+        if self.validate_only:
+            # The after-transform plugins work on the translated template, which is not built. References to SAM
+            # resources are still resolved, on a copy of the template, because that rejects invalid GetAtt values.
+            document_errors.raise_errors()
+            if len(supported_resource_refs) > 0:
+                intrinsics_resolver.resolve_sam_resource_refs(copy.deepcopy(template), supported_resource_refs)
+            return None
 
         # Run the after-transform plugin target
         try:
             sam_plugins.act(LifeCycleEvents.after_transform_template, template)
         except (InvalidDocumentException, InvalidResourceException) as e:
-            document_errors.append(e)
+            document_errors.add(e)
 
         # Cleanup
         if "Transform" in template:
             del template["Transform"]
 
-        if len(document_errors) == 0:
-            template = intrinsics_resolver.resolve_sam_resource_id_refs(template, changed_logical_ids)
-            template = intrinsics_resolver.resolve_sam_resource_refs(template, supported_resource_refs)
-            return template
-        else:
-            raise InvalidDocumentException(document_errors)
+        document_errors.raise_errors()
+
+        template = intrinsics_resolver.resolve_sam_resource_id_refs(template, changed_logical_ids)
+        template = intrinsics_resolver.resolve_sam_resource_refs(template, supported_resource_refs)
+        if self.minimize_output:
+            minimize_template(template)
+        self._record_latency("PostProcessLatency", phase_start)
+        self._record_count("GeneratedResourceCount", len(template.get("Resources", {})))
+        if cache_key is not None:
+            self.cache.put(
+                cache_key,
+                CachedTranslation(
+                    template, self.function_names, self.redeploy_restapi_parameters, self.resource_sources
+                ),
+            )
+        return template
 
     # private methods
+    def _record_count(self, name, value):
+        if self.metrics is not None:
+            self.metrics.record_count(name, value)
+
+    def _record_latency(self, name, start):
+        """
+        :param string name: Name of the metric
+        :param float start: Time the measured phase started at, as returned by time()
+        """
+        if self.metrics is not None:
+            self.metrics.record_latency(name, (time() - start) * 1000)
+
+    def _add_resource(self, template, resource):
+        """
+        Adds the translated resource to the template. If the translator only validates, the resource is validated
+        without generating its dictionary.
+
+        :param dict template: Translated template
+        :param samtranslator.model.Resource resource: Resource to add
+        :raises InvalidResourceException: If the resource is invalid
+        """
+        if self.validate_only:
+            resource.validate_properties()
+        else:
+            template["Resources"].update(resource.to_dict())
+
     def _get_resources_to_iterate(self, sam_template, macro_resolver):
         """
         Returns a list of resources to iterate, order them based on the following order:
@@ -226,20 +397,30 @@ class Translator:
         return functions + statemachines + apis + others
 
 
-def prepare_plugins(plugins, parameters={}):
+def prepare_plugins(
+    plugins, parameters={}, max_errors=None, validate_only=False, metrics=None, resolution_context=None
+):
     """
     Creates & returns a plugins object with the given list of plugins installed. In addition to the given plugins,
     we will also install a few "required" plugins that are necessary to provide complete support for SAM template spec.
 
     :param plugins: list of samtranslator.plugins.BasePlugin plugins: List of plugins to install
     :param parameters: Dictionary of parameter values
+    :param int max_errors: Number of errors after which the required plugins stop, or None to collect all errors.
+        Plugins in `plugins` keep their own configuration.
+    :param bool validate_only: Whether the translation only validates the template. The required ServerlessAppPlugin
+        then does not call the Serverless Application Repository.
+    :param samtranslator.metrics.metrics.Metrics metrics: Optional metrics the required ServerlessAppPlugin records its
+        calls to the Serverless Application Repository on
+    :param samtranslator.intrinsics.context.ResolutionContext resolution_context: Optional parameter values and mappings
+        of the translation, shared with the required ServerlessAppPlugin
     :return samtranslator.plugins.SamPlugins: Instance of `SamPlugins`
     """
 
     required_plugins = [
         DefaultDefinitionBodyPlugin(),
-        make_implicit_rest_api_plugin(),
-        make_implicit_http_api_plugin(),
+        make_implicit_rest_api_plugin(max_errors),
+        make_implicit_http_api_plugin(max_errors),
         GlobalsPlugin(),
         make_policy_template_for_function_plugin(),
     ]
@@ -248,25 +429,38 @@ def prepare_plugins(plugins, parameters={}):
 
     # If a ServerlessAppPlugin does not yet exist, create one and add to the beginning of the required plugins list.
     if not any(isinstance(plugin, ServerlessAppPlugin) for plugin in plugins):
-        required_plugins.insert(0, ServerlessAppPlugin(parameters=parameters))
+        if validate_only:
+            serverless_app_plugin = ServerlessAppPlugin(
+                sar_client=OfflineSarClient(),
+                validate_only=True,
+                parameters=parameters,
+                max_errors=max_errors,
+                metrics=metrics,
+                resolution_context=resolution_context,
+            )
+        else:
+            serverless_app_plugin = ServerlessAppPlugin(
+                parameters=parameters, max_errors=max_errors, metrics=metrics, resolution_context=resolution_context
+            )
+        required_plugins.insert(0, serverless_app_plugin)
 
     # Execute customer's plugins first before running SAM plugins. It is very important to retain this order because
     # other plugins will be dependent on this ordering.
     return SamPlugins(plugins + required_plugins)
 
 
-def make_implicit_rest_api_plugin():
+def make_implicit_rest_api_plugin(max_errors=None):
     # This is necessary to prevent a circular dependency on imports when loading package
     from samtranslator.plugins.api.implicit_rest_api_plugin import ImplicitRestApiPlugin
 
-    return ImplicitRestApiPlugin()
+    return ImplicitRestApiPlugin(max_errors=max_errors)
 
 
-def make_implicit_http_api_plugin():
+def make_implicit_http_api_plugin(max_errors=None):
     # This is necessary to prevent a circular dependency on imports when loading package
     from samtranslator.plugins.api.implicit_http_api_plugin import ImplicitHttpApiPlugin
 
-    return ImplicitHttpApiPlugin()
+    return ImplicitHttpApiPlugin(max_errors=max_errors)
 
 
 def make_policy_template_for_function_plugin():
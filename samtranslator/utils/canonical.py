@@ -0,0 +1,16 @@
+def canonical_key(value):
+    """Returns a hashable key of a JSON-like value. Two values have the same key if and only if they are equal, with
+    dictionaries comparing regardless of the order of their keys.
+
+    :param value: dict, list or scalar value
+    :returns: hashable key of the value
+    """
+    if isinstance(value, dict):
+        return dict, frozenset((key, canonical_key(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return list, tuple(canonical_key(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return type(value), repr(value)
+    return value
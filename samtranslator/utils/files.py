@@ -0,0 +1,17 @@
+import os
+
+
+def replace_file(source, destination):
+    """
+    Moves the source file over the destination file, replacing it atomically on POSIX platforms
+
+    :param string source: Path of the file to move
+    :param string destination: Path of the file to replace
+    """
+    # os.replace is not available in Python 2. os.rename does the same thing on POSIX platforms.
+    replace = getattr(os, "replace", None)
+    if replace is None:
+        if os.path.exists(destination):
+            os.remove(destination)
+        replace = os.rename
+    replace(source, destination)
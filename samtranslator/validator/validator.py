@@ -1,8 +1,5 @@
 import json
 
-import jsonschema
-from jsonschema.exceptions import ValidationError
-
 from . import sam_schema
 
 
@@ -17,6 +14,9 @@ class SamTemplateValidator(object):
         :return: Empty string if there are no validation errors in template
         """
 
+        import jsonschema
+        from jsonschema.exceptions import ValidationError
+
         if not schema:
             schema = SamTemplateValidator._read_schema()
 
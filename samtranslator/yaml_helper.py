@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 import yaml
 from yaml import ScalarNode, SequenceNode
 from six import string_types
@@ -47,3 +49,64 @@ def intrinsics_multi_constructor(loader, tag_prefix, node):
         value = loader.construct_mapping(node)
 
     return {cfntag: value}
+
+
+def yaml_dump(dict_to_dump, stream=None):
+    """
+    Dumps the dictionary as a YAML document, writing CloudFormation intrinsic functions in their short form (!Ref,
+    !GetAtt, !Sub...) so that the document parses back to the same dictionary with `yaml_parse`.
+
+    :param dict dict_to_dump: Dictionary to dump
+    :param stream: File-like object to write to. The document is written as it is emitted.
+    :return: The YAML string if no stream is given, None otherwise
+    """
+    return yaml.dump(dict_to_dump, stream, Dumper=_IntrinsicsDumper, default_flow_style=False)
+
+
+class _IntrinsicsDumper(yaml.SafeDumper):
+    """SafeDumper that keeps the order of the keys and restores the short form of intrinsic functions"""
+
+    def ignore_aliases(self, data):
+        # Translated templates share dictionaries between resources. Repeat them instead of using anchors.
+        return True
+
+
+def _intrinsics_representer(dumper, data):
+    if len(data) == 1:
+        key, value = next(iter(data.items()))
+        tag = _get_short_form_tag(key, value)
+        if tag == "!GetAtt" and _is_dotted_get_att(value):
+            return dumper.represent_scalar(tag, ".".join(value))
+        if tag and tag != "!GetAtt" and isinstance(value, string_types):
+            # A string after !GetAtt is parsed as Resource.Attribute, so {"Fn::GetAtt": "..."} keeps its long form
+            return dumper.represent_scalar(tag, value)
+        if tag and isinstance(value, list):
+            return dumper.represent_sequence(tag, value)
+        if tag and isinstance(value, dict):
+            return dumper.represent_mapping(tag, value.items())
+    return dumper.represent_mapping("tag:yaml.org,2002:map", data.items())
+
+
+def _get_short_form_tag(key, value):
+    if not isinstance(key, string_types):
+        return None
+    if key in ["Ref", "Condition"]:
+        # Only the string form is an intrinsic. {"Condition": {...}} is an IAM policy condition, for example.
+        return "!" + key if isinstance(value, string_types) else None
+    if key.startswith("Fn::") and len(key) > len("Fn::"):
+        return "!" + key[len("Fn::") :]
+    return None
+
+
+def _is_dotted_get_att(value):
+    # !GetAtt Resource.Attribute is split at the first dot when parsed, so the resource name must not contain one
+    return (
+        isinstance(value, list)
+        and len(value) == 2
+        and all(isinstance(item, string_types) for item in value)
+        and "." not in value[0]
+    )
+
+
+_IntrinsicsDumper.add_representer(dict, _intrinsics_representer)
+_IntrinsicsDumper.add_representer(OrderedDict, _intrinsics_representer)
@@ -1,7 +1,12 @@
 from mock import patch, Mock
 from parameterized import parameterized, param
 from unittest import TestCase
+import io
+import json
 import os, sys
+import shutil
+import tempfile
+import time
 
 from samtranslator.feature_toggle.feature_toggle import (
     FeatureToggle,
@@ -72,9 +77,9 @@ class TestFeatureToggleAppConfig(TestCase):
             param("feature-2", "beta", "us-west-2", False),  # because feature is missing
         ]
     )
-    @patch("samtranslator.feature_toggle.feature_toggle.boto3")
-    def test_feature_toggle_for_stage(self, feature_name, stage, region, expected, boto3_mock):
-        boto3_mock.client.return_value = self.app_config_mock
+    @patch("boto3.client")
+    def test_feature_toggle_for_stage(self, feature_name, stage, region, expected, boto3_client_mock):
+        boto3_client_mock.return_value = self.app_config_mock
         feature_toggle_config_provider = FeatureToggleAppConfigConfigProvider(
             "test_app_id", "test_env_id", "test_conf_id"
         )
@@ -88,11 +93,11 @@ class TestFeatureToggleAppConfig(TestCase):
             param("feature-2", "beta", "us-west-2", "123456789124", False),  # because feature is missing
         ]
     )
-    @patch("samtranslator.feature_toggle.feature_toggle.boto3")
+    @patch("boto3.client")
     def test_feature_toggle_with_local_provider_for_account_id(
-        self, feature_name, stage, region, account_id, expected, boto3_mock
+        self, feature_name, stage, region, account_id, expected, boto3_client_mock
     ):
-        boto3_mock.client.return_value = self.app_config_mock
+        boto3_client_mock.return_value = self.app_config_mock
         feature_toggle_config_provider = FeatureToggleAppConfigConfigProvider(
             "test_app_id", "test_env_id", "test_conf_id"
         )
@@ -100,3 +105,117 @@ class TestFeatureToggleAppConfig(TestCase):
         self.assertEqual(
             feature_toggle.is_enabled_for_account_in_region(feature_name, stage, account_id, region), expected
         )
+
+
+class StubAppConfigClient(object):
+    """Local stand-in for the AppConfig client which serves configs from a list of (version, config) pairs"""
+
+    def __init__(self, versions):
+        self.versions = versions
+        self.calls = []
+
+    def get_configuration(self, **kwargs):
+        self.calls.append(kwargs)
+        version, config = self.versions[-1]
+        if isinstance(config, Exception):
+            raise config
+        content = b"" if kwargs.get("ClientConfigurationVersion") == version else json.dumps(config).encode("utf-8")
+        return {"Content": io.BytesIO(content), "ConfigurationVersion": version}
+
+
+class TestFeatureToggleAppConfigRefresh(TestCase):
+    def setUp(self):
+        self.config_v1 = {"feature-1": {"beta": {"default": {"enabled": False}}}}
+        self.config_v2 = {"feature-1": {"beta": {"default": {"enabled": True}}}}
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.temp_dir, "feature_toggle_cache.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _make_provider(self, client, **kwargs):
+        provider = FeatureToggleAppConfigConfigProvider("test_app_id", "test_env_id", "test_conf_id", client, **kwargs)
+        self.addCleanup(provider.stop)
+        return provider
+
+    def test_refresh_sends_client_configuration_version(self):
+        client = StubAppConfigClient([("1", self.config_v1)])
+        provider = self._make_provider(client)
+
+        self.assertEqual(provider.config, self.config_v1)
+        self.assertEqual(provider.config_version, "1")
+        self.assertNotIn("ClientConfigurationVersion", client.calls[0])
+
+        self.assertFalse(provider.refresh())
+        self.assertEqual(client.calls[1]["ClientConfigurationVersion"], "1")
+        self.assertEqual(provider.config, self.config_v1)
+
+        client.versions.append(("2", self.config_v2))
+        self.assertTrue(provider.refresh())
+        self.assertEqual(provider.config, self.config_v2)
+        self.assertEqual(provider.config_version, "2")
+
+    def test_feature_toggle_sees_refreshed_config(self):
+        client = StubAppConfigClient([("1", self.config_v1)])
+        provider = self._make_provider(client)
+        feature_toggle = FeatureToggle(provider)
+        self.assertFalse(feature_toggle.is_enabled_for_stage_in_region("feature-1", "beta"))
+
+        client.versions.append(("2", self.config_v2))
+        provider.refresh()
+        self.assertTrue(feature_toggle.is_enabled_for_stage_in_region("feature-1", "beta"))
+
+    def test_failed_initial_load_uses_empty_config(self):
+        client = StubAppConfigClient([("1", Exception("AppConfig is unavailable"))])
+        provider = self._make_provider(client)
+        self.assertEqual(provider.config, {})
+        self.assertIsNone(provider.config_version)
+
+    def test_background_refresh_keeps_last_known_good_config(self):
+        client = StubAppConfigClient([("1", self.config_v1)])
+        provider = self._make_provider(client, refresh_interval=0.01)
+
+        client.versions.append(("2", Exception("AppConfig is unavailable")))
+        self._wait_for(lambda: len(client.calls) > 2)
+        self.assertEqual(provider.config, self.config_v1)
+
+        client.versions.append(("3", self.config_v2))
+        self._wait_for(lambda: provider.config_version == "3")
+        self.assertEqual(provider.config, self.config_v2)
+
+    def test_last_known_good_config_is_persisted_and_used_on_cold_start(self):
+        client = StubAppConfigClient([("1", self.config_v1)])
+        self._make_provider(client, cache_path=self.cache_path).stop()
+        with open(self.cache_path) as f:
+            self.assertEqual(json.load(f), {"ConfigurationVersion": "1", "Content": self.config_v1})
+
+        # Cold start is served from disk while the first fetch runs in the background
+        client.versions.append(("2", self.config_v2))
+        provider = self._make_provider(client, cache_path=self.cache_path)
+        provider._refresh_thread.join()
+        self.assertEqual(client.calls[-1]["ClientConfigurationVersion"], "1")
+        self.assertEqual(provider.config, self.config_v2)
+        with open(self.cache_path) as f:
+            self.assertEqual(json.load(f)["ConfigurationVersion"], "2")
+
+    def test_unreadable_cache_falls_back_to_app_config(self):
+        with open(self.cache_path, "w") as f:
+            f.write("not json")
+        client = StubAppConfigClient([("1", self.config_v1)])
+        provider = self._make_provider(client, cache_path=self.cache_path)
+        self.assertEqual(provider.config, self.config_v1)
+
+    @parameterized.expand([("samtranslator.feature_toggle.feature_toggle.replace_file",), ("json.dump",)])
+    def test_failed_cache_write_removes_temporary_file(self, failing_function):
+        client = StubAppConfigClient([("1", self.config_v1)])
+        with patch(failing_function, side_effect=IOError("Disk is full")):
+            provider = self._make_provider(client, cache_path=self.cache_path)
+
+        self.assertEqual(provider.config, self.config_v1)
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    def _wait_for(self, condition, timeout=5):
+        deadline = time.time() + timeout
+        while not condition():
+            self.assertLess(time.time(), deadline, "Timed out waiting for background refresh")
+            time.sleep(0.01)
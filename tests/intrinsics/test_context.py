@@ -0,0 +1,71 @@
+from unittest import TestCase
+
+from mock import patch
+
+from samtranslator.intrinsics.context import ResolutionContext
+from samtranslator.model.exceptions import InvalidDocumentException
+
+MAPPINGS = {"Stages": {"us-east-1": {"Name": "prod"}}}
+
+
+class TestResolutionContext(TestCase):
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_from_template_must_merge_defaults_and_pseudo_parameters(self):
+        parameter_values = {"Tags": ["a", "b"]}
+        sam_template = {
+            "Parameters": {"Stage": {"Type": "String", "Default": "prod"}, "Tags": {"Type": "CommaDelimitedList"}},
+            "Mappings": MAPPINGS,
+        }
+
+        context = ResolutionContext.from_template(sam_template, parameter_values)
+
+        expected = {"Stage": "prod", "Tags": ["a", "b"], "AWS::Region": "us-east-1", "AWS::Partition": "aws"}
+        self.assertEqual(context.parameter_values, expected)
+        self.assertIs(context.mappings, MAPPINGS)
+        # Values of the caller are not shared, nor modified
+        self.assertEqual(parameter_values, {"Tags": ["a", "b"]})
+        self.assertIsNot(context.parameter_values["Tags"], parameter_values["Tags"])
+
+    def test_resolvers_must_be_created_once(self):
+        context = ResolutionContext({"Stage": "prod"}, MAPPINGS)
+
+        self.assertIs(context.intrinsics_resolver, context.intrinsics_resolver)
+        self.assertIs(context.mappings_resolver, context.mappings_resolver)
+
+    def test_resolve_must_resolve_parameters_then_mappings(self):
+        context = ResolutionContext({"AWS::Region": "us-east-1"}, MAPPINGS)
+        value = {"Name": {"Fn::FindInMap": ["Stages", {"Ref": "AWS::Region"}, "Name"]}}
+
+        self.assertEqual(context.resolve(value), {"Name": "prod"})
+        self.assertEqual(value, {"Name": {"Fn::FindInMap": ["Stages", {"Ref": "AWS::Region"}, "Name"]}})
+        self.assertEqual(context.resolve("plain"), "plain")
+
+    def test_with_mappings_must_reuse_the_context_for_the_same_mappings(self):
+        context = ResolutionContext({"AWS::Region": "us-east-1"}, MAPPINGS)
+
+        self.assertIs(context.with_mappings(MAPPINGS), context)
+        self.assertIs(context.with_mappings({"Stages": {"us-east-1": {"Name": "prod"}}}), context)
+
+        other = context.with_mappings({"Stages": {"us-east-1": {"Name": "dev"}}})
+        self.assertIs(other.intrinsics_resolver, context.intrinsics_resolver)
+        self.assertEqual(other.resolve({"Fn::FindInMap": ["Stages", "us-east-1", "Name"]}), "dev")
+
+    def test_invalid_mappings_must_be_reported_by_the_resolver(self):
+        context = ResolutionContext({}, None)
+
+        with self.assertRaises(InvalidDocumentException):
+            context.mappings_resolver
+
+    def test_create_resolvers_must_create_both_resolvers_once(self):
+        context = ResolutionContext({"Stage": "prod"}, MAPPINGS)
+        intrinsics_resolver = context.intrinsics_resolver
+
+        resolvers = context.create_resolvers()
+
+        self.assertEqual(resolvers, (intrinsics_resolver, context.mappings_resolver))
+        self.assertEqual(context.create_resolvers(), resolvers)
+
+    def test_create_resolvers_must_report_invalid_parameters_or_mappings(self):
+        for context in [ResolutionContext(None, MAPPINGS), ResolutionContext({}, None)]:
+            with self.assertRaises(InvalidDocumentException):
+                context.create_resolvers()
@@ -0,0 +1,191 @@
+import json
+from unittest import TestCase
+
+from mock import Mock, patch
+from six import StringIO
+
+from samtranslator.metrics.metrics import CWMetricsPublisher, LocalMetricsPublisher, Metrics, MetricsPublisher
+from samtranslator.model.exceptions import InvalidDocumentException
+from samtranslator.parser.parser import Parser
+from samtranslator.translator.translator import Translator
+
+POLICY_MAP = {"AWSLambdaBasicExecutionRole": "arn:aws:iam::aws:policy/AWSLambdaBasicExecutionRole"}
+TRANSFORM_DIMENSIONS = [{"Name": "Transform", "Value": "Serverless"}]
+
+
+class RecordingMetricsPublisher(MetricsPublisher):
+    def __init__(self):
+        self.published = []
+
+    def publish(self, namespace, metrics):
+        self.published.append((namespace, metrics))
+
+    def get_metrics(self):
+        return {metric["MetricName"]: metric for _, metrics in self.published for metric in metrics}
+
+
+class TestMetrics(TestCase):
+    def setUp(self):
+        self.publisher = RecordingMetricsPublisher()
+        self.metrics = Metrics("Namespace", self.publisher, dimensions=TRANSFORM_DIMENSIONS)
+        self.addCleanup(self.metrics.close)
+
+    def test_must_aggregate_counts_and_latencies(self):
+        self.metrics.record_count("Count")
+        self.metrics.record_count("Count", 2)
+        self.metrics.record_latency("Latency", 10)
+        self.metrics.record_latency("Latency", 30)
+
+        self.metrics.flush()
+
+        self.assertEqual(
+            self.publisher.published,
+            [
+                (
+                    "Namespace",
+                    [
+                        {"MetricName": "Count", "Value": 3, "Unit": "Count", "Dimensions": TRANSFORM_DIMENSIONS},
+                        {
+                            "MetricName": "Latency",
+                            "StatisticValues": {"SampleCount": 2, "Sum": 40, "Minimum": 10, "Maximum": 30},
+                            "Unit": "Milliseconds",
+                            "Dimensions": TRANSFORM_DIMENSIONS,
+                        },
+                    ],
+                )
+            ],
+        )
+
+    def test_must_aggregate_per_dimensions(self):
+        self.metrics.record_count("Error", dimensions=[{"Name": "ErrorType", "Value": "A"}])
+        self.metrics.record_count("Error", dimensions=[{"Name": "ErrorType", "Value": "B"}])
+        self.metrics.record_count("Error", dimensions=[{"Name": "ErrorType", "Value": "A"}])
+
+        self.metrics.flush()
+
+        _, metrics = self.publisher.published[0]
+        self.assertEqual(
+            [(metric["Dimensions"][-1]["Value"], metric["Value"]) for metric in metrics], [("A", 2), ("B", 1)]
+        )
+
+    def test_timer_must_record_the_latency_of_failed_blocks(self):
+        with self.assertRaises(ValueError):
+            with self.metrics.timer("Latency"):
+                raise ValueError()
+
+        self.metrics.flush()
+
+        self.assertEqual(self.publisher.get_metrics()["Latency"]["StatisticValues"]["SampleCount"], 1)
+
+    def test_must_drop_records_when_the_buffer_is_full(self):
+        metrics = Metrics(metrics_publisher=self.publisher, max_buffer_size=2)
+        self.addCleanup(metrics.close)
+        for _ in range(3):
+            metrics.record_count("Count")
+
+        metrics.flush()
+
+        self.assertEqual(metrics.dropped_count, 1)
+        self.assertEqual(self.publisher.get_metrics()["Count"]["Value"], 2)
+
+    def test_flush_must_not_raise_errors_of_the_publisher(self):
+        publisher = Mock()
+        publisher.publish.side_effect = Exception("throttled")
+        metrics = Metrics(metrics_publisher=publisher)
+        metrics.record_count("Count")
+
+        metrics.close()
+
+        publisher.publish.assert_called_once()
+
+    def test_nothing_must_be_published_without_records(self):
+        self.metrics.close()
+
+        self.assertEqual(self.publisher.published, [])
+
+    def test_close_must_stop_the_background_thread(self):
+        self.metrics.record_count("Count")
+        thread = self.metrics._thread
+        self.assertTrue(thread.is_alive())
+
+        self.metrics.close()
+
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(self.publisher.get_metrics()["Count"]["Value"], 1)
+
+
+class TestMetricsPublishers(TestCase):
+    def test_cw_publisher_must_send_batches(self):
+        cloudwatch_client = Mock()
+        metrics = [{"MetricName": "Metric{}".format(index), "Value": index} for index in range(45)]
+
+        CWMetricsPublisher(cloudwatch_client).publish("Namespace", metrics)
+
+        self.assertEqual(
+            [call[1]["MetricData"] for call in cloudwatch_client.put_metric_data.call_args_list],
+            [metrics[:20], metrics[20:40], metrics[40:]],
+        )
+        cloudwatch_client.put_metric_data.assert_called_with(Namespace="Namespace", MetricData=metrics[40:])
+
+    def test_local_publisher_must_write_json_lines(self):
+        stream = StringIO()
+
+        LocalMetricsPublisher(stream=stream).publish("Namespace", [{"MetricName": "A"}, {"MetricName": "B"}])
+
+        self.assertEqual(
+            [json.loads(line) for line in stream.getvalue().splitlines()],
+            [
+                {"Namespace": "Namespace", "Metric": {"MetricName": "A"}},
+                {"Namespace": "Namespace", "Metric": {"MetricName": "B"}},
+            ],
+        )
+
+
+class TestTranslatorMetrics(TestCase):
+    def setUp(self):
+        self.cloudwatch_client = Mock()
+        self.metrics = Metrics(metrics_publisher=CWMetricsPublisher(self.cloudwatch_client))
+        self.translator = Translator(POLICY_MAP, Parser(), metrics=self.metrics)
+
+    def get_metrics(self):
+        self.metrics.close()
+        return {
+            metric["MetricName"]: metric
+            for call in self.cloudwatch_client.put_metric_data.call_args_list
+            for metric in call[1]["MetricData"]
+        }
+
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_translation_must_record_its_latency_and_resources(self):
+        template = {
+            "Resources": {
+                "Function": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {"CodeUri": "s3://bucket/key", "Handler": "index.handler", "Runtime": "python3.8"},
+                }
+            }
+        }
+
+        self.translator.translate(template, {})
+
+        metrics = self.get_metrics()
+        self.assertEqual(metrics["SamResourceCount"]["Value"], 1)
+        self.assertEqual(metrics["GeneratedResourceCount"]["Value"], 2)
+        self.assertEqual(metrics["TransformFailure"]["Value"], 0)
+        self.assertEqual(metrics["InvalidDocument"]["Value"], 0)
+        for name in ["TransformLatency", "ParseLatency", "TranslateResourcesLatency", "PostProcessLatency"]:
+            self.assertEqual(metrics[name]["StatisticValues"]["SampleCount"], 1)
+
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_invalid_template_must_record_its_errors(self):
+        template = {"Resources": {"Function": {"Type": "AWS::Serverless::Function", "Properties": {}}}}
+
+        with self.assertRaises(InvalidDocumentException):
+            self.translator.translate(template, {})
+
+        metrics = self.get_metrics()
+        self.assertEqual(metrics["InvalidDocument"]["Value"], 1)
+        self.assertEqual(metrics["TransformFailure"]["Value"], 0)
+        self.assertEqual(
+            metrics["DocumentError"]["Dimensions"], [{"Name": "ErrorType", "Value": "InvalidResourceException"}]
+        )
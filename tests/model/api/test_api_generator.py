@@ -0,0 +1,101 @@
+from unittest import TestCase
+from mock import Mock, patch
+
+from samtranslator.model.api.api_generator import ApiGenerator
+from samtranslator.swagger.swagger import SwaggerEditor
+
+
+def make_generator(**kwargs):
+    properties = {
+        "logical_id": "RestApiId",
+        "cache_cluster_enabled": None,
+        "cache_cluster_size": None,
+        "variables": None,
+        "depends_on": None,
+        "definition_body": None,
+        "definition_uri": None,
+        "name": None,
+        "stage_name": "Prod",
+        "shared_api_usage_plan": None,
+    }
+    properties.update(kwargs)
+    return ApiGenerator(**properties)
+
+
+def make_definition_body(version_key="swagger", version="2.0"):
+    return {version_key: version, "paths": {"/foo": {"get": {}}}}
+
+
+class TestApiGeneratorEditDefinitionBody(TestCase):
+    def test_stages_must_run_in_the_documented_order(self):
+        generator = make_generator(definition_body=make_definition_body())
+        manager = Mock()
+        for stage in ApiGenerator.DEFINITION_BODY_STAGES:
+            setattr(generator, stage, getattr(manager, stage))
+
+        generator._edit_definition_body()
+
+        self.assertEqual(
+            [name for name, _, _ in manager.mock_calls],
+            ["_add_cors", "_add_auth", "_add_gateway_responses", "_add_binary_media_types", "_add_models"],
+        )
+
+    @patch("samtranslator.model.api.api_generator.SwaggerEditor", wraps=SwaggerEditor)
+    def test_all_stages_must_share_one_editor(self, SwaggerEditorMock):
+        SwaggerEditorMock.is_valid = SwaggerEditor.is_valid
+        SwaggerEditorMock.safe_compare_regex_with_string = SwaggerEditor.safe_compare_regex_with_string
+        SwaggerEditorMock.get_openapi_version_3_regex = SwaggerEditor.get_openapi_version_3_regex
+        definition_body = make_definition_body()
+        generator = make_generator(
+            definition_body=definition_body,
+            cors="'example.com'",
+            auth={"ApiKeyRequired": True},
+            gateway_responses={"DEFAULT_4XX": {"StatusCode": 400}},
+            binary_media=["image/png"],
+            models={"User": {"type": "object", "properties": {"name": {"type": "string"}}}},
+        )
+
+        generator._edit_definition_body()
+
+        SwaggerEditorMock.assert_called_once_with(definition_body)
+        body = generator.definition_body
+        self.assertIn("options", body["paths"]["/foo"])
+        self.assertIn("api_key", body["securityDefinitions"])
+        self.assertIn("DEFAULT_4XX", body["x-amazon-apigateway-gateway-responses"])
+        self.assertEqual(body["x-amazon-apigateway-binary-media-types"], ["image/png"])
+        self.assertIn("user", body["definitions"])
+        self.assertEqual(definition_body, make_definition_body())
+
+    def test_default_authorizer_must_apply_to_the_preflight_methods_added_by_cors(self):
+        generator = make_generator(
+            definition_body=make_definition_body(),
+            cors="'example.com'",
+            auth={"DefaultAuthorizer": "AWS_IAM", "AddDefaultAuthorizerToCorsPreflight": True},
+        )
+
+        generator._edit_definition_body()
+
+        self.assertEqual(generator.definition_body["paths"]["/foo"]["options"]["security"], [{"AWS_IAM": []}])
+
+    def test_openapi_post_processing_must_run_after_auth_and_models(self):
+        generator = make_generator(
+            definition_body=make_definition_body("openapi", "3.0.1"),
+            auth={"ApiKeyRequired": True},
+            models={"User": {"type": "object", "properties": {"name": {"type": "string"}}}},
+        )
+
+        generator._edit_definition_body()
+
+        body = generator.definition_body
+        self.assertNotIn("securityDefinitions", body)
+        self.assertNotIn("definitions", body)
+        self.assertIn("api_key", body["components"]["securitySchemes"])
+        self.assertIn("user", body["components"]["schemas"])
+
+    def test_definition_body_is_untouched_without_stages_to_apply(self):
+        definition_body = make_definition_body()
+        generator = make_generator(definition_body=definition_body)
+
+        generator._edit_definition_body()
+
+        self.assertIs(generator.definition_body, definition_body)
@@ -0,0 +1,82 @@
+from mock import Mock, patch
+from unittest import TestCase
+
+from samtranslator.model.api.definition_collection import ApiDefinitionCollection
+from samtranslator.model.eventsources.push import Api
+from samtranslator.model.exceptions import InvalidEventException
+from samtranslator.model.lambda_ import LambdaFunction
+from samtranslator.swagger.swagger import SwaggerEditor
+
+_X_INTEGRATION = "x-amazon-apigateway-integration"
+
+
+def make_event(logical_id, path, method="get", auth=None):
+    event = Api(logical_id)
+    event.Path = path
+    event.Method = method
+    event.RestApiId = {"Ref": "ServerlessRestApi"}
+    event.Auth = auth
+    return event
+
+
+class TestApiDefinitionCollection(TestCase):
+    def setUp(self):
+        self.api = {
+            "__MANAGE_SWAGGER": True,
+            "StageName": "Prod",
+            "DefinitionBody": SwaggerEditor.gen_skeleton(),
+            "Auth": {"Authorizers": {"MyAuth": {"FunctionArn": {"Ref": "AuthorizerArn"}}}},
+        }
+        self.intrinsics_resolver = Mock()
+        self.intrinsics_resolver.resolve_parameter_refs = Mock(side_effect=lambda value: value)
+        self.collection = ApiDefinitionCollection()
+
+    def translate(self, event):
+        return event.to_cloudformation(
+            function=LambdaFunction("Function"),
+            explicit_api=self.api,
+            intrinsics_resolver=self.intrinsics_resolver,
+            api_definition_collection=self.collection,
+        )
+
+    @patch("boto3.session.Session.region_name", "eu-west-2")
+    def test_must_write_the_definition_once_all_events_are_added(self):
+        original_body = self.api["DefinitionBody"]
+        for index in range(3):
+            self.translate(make_event("Event{}".format(index), "/path{}".format(index), auth={"Authorizer": "MyAuth"}))
+
+        self.assertIs(self.api["DefinitionBody"], original_body)
+        self.collection.write_definitions()
+
+        paths = self.api["DefinitionBody"]["paths"]
+        self.assertEqual(sorted(paths), ["/path0", "/path1", "/path2"])
+        self.assertEqual(paths["/path1"]["get"]["security"], [{"MyAuth": []}])
+        self.intrinsics_resolver.resolve_parameter_refs.assert_called_once_with(self.api["Auth"])
+
+    @patch("boto3.session.Session.region_name", "eu-west-2")
+    def test_invalid_event_must_not_add_its_route(self):
+        with self.assertRaises(InvalidEventException):
+            self.translate(make_event("Event", "/foo", auth={"Authorizer": "Unknown"}))
+
+        self.translate(make_event("Other", "/foo", auth={"Authorizer": "MyAuth"}))
+        self.collection.write_definitions()
+
+        self.assertIn(_X_INTEGRATION, self.api["DefinitionBody"]["paths"]["/foo"]["get"])
+
+    @patch("boto3.session.Session.region_name", "eu-west-2")
+    def test_must_detect_routes_added_by_earlier_events(self):
+        self.translate(make_event("Event", "/foo"))
+
+        with self.assertRaises(InvalidEventException):
+            self.translate(make_event("Other", "/foo"))
+
+    @patch("boto3.session.Session.region_name", "eu-west-2")
+    def test_must_write_the_definition_right_away_without_a_collection(self):
+        make_event("Event", "/foo").to_cloudformation(
+            function=LambdaFunction("Function"), explicit_api=self.api, intrinsics_resolver=self.intrinsics_resolver
+        )
+
+        self.assertIn("/foo", self.api["DefinitionBody"]["paths"])
+
+    def test_api_without_definition_body_has_no_editor(self):
+        self.assertIsNone(self.collection.get_swagger_editor({"StageName": "Prod"}))
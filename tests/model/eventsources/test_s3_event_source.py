@@ -0,0 +1,118 @@
+from mock import Mock
+from unittest import TestCase
+
+from samtranslator.model.eventsources.push import S3
+from samtranslator.model.s3_utils.notification_collection import S3NotificationCollection
+
+
+def make_function(logical_id, resource_attributes=None):
+    function = Mock()
+    function.logical_id = logical_id
+    function.get_runtime_attr = Mock(return_value={"Fn::GetAtt": [logical_id, "Arn"]})
+    function.resource_attributes = resource_attributes or {}
+    function.get_passthrough_resource_attributes = Mock(return_value=resource_attributes or {})
+    return function
+
+
+def make_event(logical_id, events="s3:ObjectCreated:*", prefix=None):
+    event = S3(logical_id)
+    event.Bucket = {"Ref": "Bucket"}
+    event.Events = events
+    if prefix:
+        event.Filter = {"S3Key": {"Rules": [{"Name": "prefix", "Value": prefix}]}}
+    return event
+
+
+class S3EventSource(TestCase):
+    def setUp(self):
+        self.bucket = {"Type": "AWS::S3::Bucket", "DependsOn": "Existing"}
+
+    def test_to_cloudformation_without_collection_returns_the_bucket(self):
+        resources = make_event("FunctionUpload").to_cloudformation(
+            function=make_function("Function"), bucket=self.bucket, bucket_id="Bucket"
+        )
+
+        self.assertEqual([r.resource_type for r in resources], ["AWS::Lambda::Permission", "AWS::S3::Bucket"])
+        self.assertEqual(resources[1].depends_on, ["Existing", "FunctionUploadPermission"])
+        self.assertEqual(
+            resources[1].NotificationConfiguration,
+            {
+                "LambdaConfigurations": [
+                    {"Function": {"Fn::GetAtt": ["Function", "Arn"]}, "Event": "s3:ObjectCreated:*"}
+                ]
+            },
+        )
+
+    def test_collection_writes_the_bucket_once_for_all_functions(self):
+        collection = S3NotificationCollection()
+        for index in range(3):
+            function = make_function("Function{}".format(index))
+            event = make_event("Function{}Upload".format(index), prefix="prefix{}/".format(index))
+            resources = event.to_cloudformation(
+                function=function, bucket=self.bucket, bucket_id="Bucket", s3_notification_collection=collection
+            )
+            self.assertEqual([r.resource_type for r in resources], ["AWS::Lambda::Permission"])
+            # Same event translated twice must not add the notification twice
+            event.to_cloudformation(
+                function=function, bucket=self.bucket, bucket_id="Bucket", s3_notification_collection=collection
+            )
+
+        self.assertNotIn("Properties", self.bucket)
+        buckets = collection.get_bucket_resources()
+
+        self.assertEqual(len(buckets), 1)
+        self.assertEqual(
+            self.bucket["DependsOn"],
+            ["Existing", "Function0UploadPermission", "Function1UploadPermission", "Function2UploadPermission"],
+        )
+        lambda_configurations = self.bucket["Properties"]["NotificationConfiguration"]["LambdaConfigurations"]
+        self.assertEqual(
+            [c["Filter"]["S3Key"]["Rules"][0]["Value"] for c in lambda_configurations],
+            ["prefix0/", "prefix1/", "prefix2/"],
+        )
+
+    def test_existing_configurations_are_kept_and_not_duplicated(self):
+        existing = {"Function": {"Fn::GetAtt": ["Function", "Arn"]}, "Event": "s3:ObjectCreated:*"}
+        self.bucket["Properties"] = {"NotificationConfiguration": {"LambdaConfigurations": [dict(existing)]}}
+        collection = S3NotificationCollection()
+
+        make_event("FunctionUpload", events=["s3:ObjectCreated:*", "s3:ObjectRemoved:*"]).to_cloudformation(
+            function=make_function("Function"),
+            bucket=self.bucket,
+            bucket_id="Bucket",
+            s3_notification_collection=collection,
+        )
+        collection.get_bucket_resources()
+
+        self.assertEqual(
+            self.bucket["Properties"]["NotificationConfiguration"]["LambdaConfigurations"],
+            [existing, {"Function": {"Fn::GetAtt": ["Function", "Arn"]}, "Event": "s3:ObjectRemoved:*"}],
+        )
+
+    def test_conditional_function_depends_on_permission_through_tag(self):
+        function = make_function("Function", {"Condition": "IsProd"})
+
+        make_event("FunctionUpload").to_cloudformation(function=function, bucket=self.bucket, bucket_id="Bucket")
+
+        self.assertEqual(self.bucket["DependsOn"], "Existing")
+        self.assertEqual(
+            self.bucket["Properties"]["Tags"],
+            [
+                {
+                    "Key": "sam:ConditionalDependsOn:FunctionUploadPermission",
+                    "Value": {"Fn::If": ["IsProd", {"Ref": "FunctionUploadPermission"}, "no dependency"]},
+                }
+            ],
+        )
+        self.assertEqual(
+            self.bucket["Properties"]["NotificationConfiguration"]["LambdaConfigurations"],
+            [
+                {
+                    "Fn::If": [
+                        "IsProd",
+                        {"Function": {"Fn::GetAtt": ["Function", "Arn"]}, "Event": "s3:ObjectCreated:*"},
+                        {"Ref": "AWS::NoValue"},
+                    ]
+                }
+            ],
+        )
@@ -0,0 +1,103 @@
+from unittest import TestCase
+
+from samtranslator.model.conditions import ConditionInterner
+
+
+def or_condition(*conditions):
+    return {"Fn::Or": [{"Condition": condition} for condition in conditions]}
+
+
+class TestConditionInterner(TestCase):
+    def setUp(self):
+        self.template = {"Conditions": {"A": {"Fn::Equals": [True, False]}}}
+        self.interner = ConditionInterner(self.template)
+
+    def test_or_condition_must_be_added_once_per_set(self):
+        first = self.interner.make_or_condition(["A", "B"], "First")
+        second = self.interner.make_or_condition(["B", "A", "B"], "Second")
+
+        self.assertEqual(first, "First")
+        self.assertEqual(second, "First")
+        self.assertEqual(self.template["Conditions"]["First"], or_condition("A", "B"))
+        self.assertNotIn("Second", self.template["Conditions"])
+
+    def test_or_condition_of_a_single_condition_must_be_that_condition(self):
+        self.assertEqual(self.interner.make_or_condition(["A", "A"], "Name"), "A")
+        self.assertEqual(list(self.template["Conditions"]), ["A"])
+
+    def test_or_condition_must_reuse_existing_conditions_of_the_template(self):
+        self.template["Conditions"]["Existing"] = or_condition("B", "A")
+        interner = ConditionInterner(self.template)
+
+        self.assertEqual(interner.make_or_condition(["A", "B"], "Name"), "Existing")
+        self.assertEqual(interner.make_or_condition(["A", "B", "C"], "Larger"), "Larger")
+        self.assertEqual(self.template["Conditions"]["Larger"], or_condition("C", "Existing"))
+
+    def test_or_condition_that_must_be_defined_must_copy_existing_conditions(self):
+        self.template["Conditions"]["Existing"] = or_condition("B", "A")
+        interner = ConditionInterner(self.template)
+
+        self.assertEqual(interner.make_or_condition(["A", "B"], "Name", always_define=True), "Name")
+        self.assertEqual(self.template["Conditions"]["Name"], or_condition("B", "A"))
+        # The existing condition is still the one that is reused
+        self.assertEqual(interner.make_or_condition(["A", "B"], "Other"), "Existing")
+
+        self.assertEqual(interner.make_or_condition(["A", "A"], "Single", always_define=True), "Single")
+        self.assertEqual(self.template["Conditions"]["Single"], self.template["Conditions"]["A"])
+
+    def test_large_or_conditions_must_be_chunked_like_make_combined_condition(self):
+        conditions = ["C{:02d}".format(index) for index in range(11)]
+
+        name = self.interner.make_or_condition(conditions, "Name")
+
+        self.assertEqual(name, "Name")
+        self.assertEqual(self.template["Conditions"]["Name1"], or_condition(*conditions[:10]))
+        self.assertEqual(self.template["Conditions"]["Name"], or_condition("C10", "Name1"))
+
+    def test_overlapping_or_conditions_must_share_their_common_conditions(self):
+        first = ["C{:02d}".format(index) for index in range(12)]
+        second = first[:10] + ["D"]
+
+        self.interner.make_or_condition(first, "First")
+        name = self.interner.make_or_condition(second, "Second")
+
+        self.assertEqual(name, "Second")
+        self.assertEqual(self.template["Conditions"]["Second"], or_condition("D", "First1"))
+        self.assertEqual(len(self.template["Conditions"]), 4)
+
+    def test_or_conditions_must_be_equal_regardless_of_nesting(self):
+        self.interner.make_or_condition(["A", "B"], "AB")
+        self.interner.make_or_condition(["AB", "C"], "ABC")
+
+        self.assertEqual(self.interner.make_or_condition(["C", "B", "A"], "Name"), "ABC")
+
+    def test_and_condition_must_be_added_once_per_set(self):
+        first = self.interner.make_and_condition(["A", "B"], "First")
+        second = self.interner.make_and_condition(["B", "A"], "Second")
+
+        self.assertEqual(second, first)
+        self.assertEqual(self.template["Conditions"]["First"], {"Fn::And": [{"Condition": "A"}, {"Condition": "B"}]})
+        self.assertEqual(self.interner.make_and_condition(["A", "A"], "Third"), "A")
+
+    def test_not_condition_must_be_added_once_per_condition(self):
+        first = self.interner.make_not_condition("A", "First")
+        second = self.interner.make_not_condition("A", "Second")
+
+        self.assertEqual(second, first)
+        self.assertEqual(self.template["Conditions"]["First"], {"Fn::Not": [{"Condition": "A"}]})
+
+    def test_conditions_section_must_only_be_added_when_needed(self):
+        template = {}
+        interner = ConditionInterner(template)
+
+        interner.make_or_condition(["A"], "Name")
+        self.assertNotIn("Conditions", template)
+
+        interner.make_not_condition("A", "Name")
+        self.assertEqual(template, {"Conditions": {"Name": {"Fn::Not": [{"Condition": "A"}]}}})
+
+    def test_redefined_condition_must_not_be_reused(self):
+        self.interner.make_or_condition(["A", "B"], "Name")
+        self.interner.make_or_condition(["C", "D"], "Name")
+
+        self.assertEqual(self.interner.make_or_condition(["A", "B"], "Other"), "Other")
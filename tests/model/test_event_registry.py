@@ -0,0 +1,65 @@
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from samtranslator.model import ResourceTypeResolver
+from samtranslator.model.event_registry import EventTypeRegistry, FUNCTION_EVENTS, STATE_MACHINE_EVENTS
+from samtranslator.model.eventsources.push import Schedule
+from samtranslator.model.sqs import SQSQueue
+
+
+class TestEventRegistries(TestCase):
+    @parameterized.expand(
+        [
+            (
+                FUNCTION_EVENTS,
+                [
+                    "samtranslator.model.eventsources.pull",
+                    "samtranslator.model.eventsources.push",
+                    "samtranslator.model.eventsources.cloudwatchlogs",
+                ],
+            ),
+            (STATE_MACHINE_EVENTS, ["samtranslator.model.stepfunctions.events"]),
+        ]
+    )
+    def test_registry_must_list_every_event_source_of_its_modules(self, registry, modules):
+        resolver = ResourceTypeResolver(*modules)
+        resolver.can_resolve({"Type": "Schedule"})
+        # Base classes of the event sources do not have a type
+        event_classes = dict(item for item in resolver.resource_types.items() if item[0] is not None)
+
+        self.assertEqual(registry.event_types, sorted(event_classes))
+        for event_type, event_class in event_classes.items():
+            self.assertIs(registry.resolve_resource_type({"Type": event_type}), event_class)
+
+
+class TestEventTypeRegistry(TestCase):
+    def test_classes_must_be_imported_from_their_path(self):
+        registry = EventTypeRegistry({"Queue": "samtranslator.model.sqs:SQSQueue"})
+
+        self.assertTrue(registry.can_resolve({"Type": "Queue"}))
+        self.assertIs(registry.resolve_resource_type({"Type": "Queue"}), SQSQueue)
+        self.assertIs(registry.resolve_resource_type({"Type": "Queue"}), SQSQueue)
+
+    def test_event_types_must_be_registered_by_class_or_path(self):
+        registry = EventTypeRegistry()
+        registry.register("Timer", Schedule)
+        registry.register("Queue", "samtranslator.model.sqs:SQSQueue")
+
+        self.assertEqual(registry.event_types, ["Queue", "Timer"])
+        self.assertIs(registry.resolve_resource_type({"Type": "Timer"}), Schedule)
+
+        with self.assertRaises(ValueError):
+            registry.register("Queue", "samtranslator.model.sqs.SQSQueue")
+
+    @parameterized.expand([(None,), ("string",), ({},), ({"Type": "Unknown"},)])
+    def test_unknown_events_must_not_be_resolved(self, event_dict):
+        self.assertFalse(FUNCTION_EVENTS.can_resolve(event_dict))
+
+    def test_resolving_an_unknown_event_must_raise_type_error(self):
+        with self.assertRaises(TypeError) as context:
+            FUNCTION_EVENTS.resolve_resource_type({"Type": "Unknown"})
+
+        self.assertEqual(
+            str(context.exception), "Resource dict has missing or invalid value for key Type. Event Type is: Unknown."
+        )
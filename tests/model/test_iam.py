@@ -0,0 +1,79 @@
+from unittest import TestCase
+
+from samtranslator.model.iam import IAMRole
+
+
+def make_policy(name, resource):
+    return {
+        "PolicyName": name,
+        "PolicyDocument": {"Statement": [{"Action": "sqs:SendMessage", "Effect": "Allow", "Resource": resource}]},
+    }
+
+
+class TestIAMRolePolicyAccumulator(TestCase):
+    def setUp(self):
+        self.role = IAMRole("MyRole")
+
+    def test_add_managed_policy_arn_must_skip_duplicates(self):
+        policies = self.role.get_policy_accumulator()
+
+        self.assertTrue(policies.add_managed_policy_arn("arn:1"))
+        self.assertTrue(policies.add_managed_policy_arn({"Ref": "PolicyArn"}))
+        self.assertFalse(policies.add_managed_policy_arn("arn:1"))
+        self.assertFalse(policies.add_managed_policy_arn({"Ref": "PolicyArn"}))
+        self.assertTrue(policies.add_managed_policy_arn("arn:2"))
+
+        self.assertEqual(self.role.ManagedPolicyArns, ["arn:1", {"Ref": "PolicyArn"}, "arn:2"])
+
+    def test_add_policy_must_skip_policies_with_the_same_document(self):
+        policies = self.role.get_policy_accumulator()
+
+        self.assertTrue(policies.add_policy(make_policy("First", "arn:queue1")))
+        self.assertTrue(policies.add_policy(make_policy("Second", "arn:queue2")))
+        self.assertFalse(policies.add_policy(make_policy("First", "arn:queue1")))
+        self.assertFalse(policies.add_policy(make_policy("Renamed", "arn:queue2")))
+
+        self.assertEqual(self.role.Policies, [make_policy("First", "arn:queue1"), make_policy("Second", "arn:queue2")])
+
+    def test_documents_must_match_regardless_of_key_order(self):
+        policies = self.role.get_policy_accumulator()
+        policies.add_policy({"PolicyName": "A", "PolicyDocument": {"Version": "2012-10-17", "Statement": []}})
+
+        self.assertTrue(
+            policies.has_policy({"PolicyName": "B", "PolicyDocument": {"Statement": [], "Version": "2012-10-17"}})
+        )
+        self.assertFalse(
+            policies.has_policy({"PolicyName": "B", "PolicyDocument": {"Statement": [{}], "Version": "2012-10-17"}})
+        )
+
+    def test_append_policy_must_keep_duplicates_and_conditional_policies(self):
+        policies = self.role.get_policy_accumulator()
+        conditional = {"Fn::If": ["Condition", make_policy("First", "arn:queue1"), {"Ref": "AWS::NoValue"}]}
+
+        policies.append_policy(make_policy("First", "arn:queue1"))
+        policies.append_policy(make_policy("First", "arn:queue1"))
+        policies.append_policy(conditional)
+
+        self.assertEqual(len(self.role.Policies), 3)
+        self.assertTrue(policies.has_policy(conditional))
+        self.assertTrue(policies.add_policy(make_policy("Second", "arn:queue2")))
+
+    def test_must_reindex_when_lists_are_changed_outside_of_the_accumulator(self):
+        policies = self.role.get_policy_accumulator()
+        policies.add_managed_policy_arn("arn:1")
+
+        self.role.ManagedPolicyArns = ["arn:2"]
+        self.assertTrue(policies.add_managed_policy_arn("arn:1"))
+
+        self.role.Policies = [make_policy("First", "arn:queue1")]
+        self.assertFalse(policies.add_policy(make_policy("Other", "arn:queue1")))
+
+        self.role.Policies.append(make_policy("Second", "arn:queue2"))
+        self.assertFalse(policies.add_policy(make_policy("Second", "arn:queue2")))
+        self.assertEqual(len(self.role.Policies), 2)
+
+    def test_policies_must_stay_unset_until_a_policy_is_added(self):
+        self.role.get_policy_accumulator().add_managed_policy_arn("arn:1")
+
+        self.assertIsNone(self.role.Policies)
+        self.assertNotIn("Policies", self.role._generate_resource_dict()["Properties"])
@@ -169,6 +169,38 @@ class TestVersionDescription(TestCase):
         self.assertEqual(generateFunctionVersion[0].Description, test_description)
 
 
+class TestFunctionEvents(TestCase):
+    kwargs = {
+        "intrinsics_resolver": IntrinsicsResolver({}),
+        "managed_policy_map": {"foo": "bar"},
+    }
+
+    @patch("boto3.session.Session.region_name", "ap-southeast-1")
+    def test_events_parsed_to_link_resources_must_not_be_parsed_again(self):
+        function = SamFunction("foo")
+        function.Runtime = "foo"
+        function.Handler = "bar"
+        function.CodeUri = "s3://foobar/foo.zip"
+        function.Events = {
+            "Timer": {"Type": "Schedule", "Properties": {"Schedule": "rate(1 minute)"}},
+            "Queue": {"Type": "SQS", "Properties": {"Queue": "arn:aws:sqs:us-east-1:123456789012:queue"}},
+        }
+
+        with patch.object(
+            SamFunction.event_resolver, "resolve_resource_type", wraps=SamFunction.event_resolver.resolve_resource_type
+        ) as resolve:
+            kwargs = function.resources_to_link({})
+            kwargs.update(self.kwargs)
+            cfnResources = function.to_cloudformation(**kwargs)
+
+        self.assertEqual(resolve.call_count, 2)
+        self.assertEqual(
+            sorted(resource.logical_id for resource in cfnResources),
+            ["foo", "fooQueue", "fooRole", "fooTimer", "fooTimerPermission"],
+        )
+        self.assertEqual(function.parsed_events, {})
+
+
 class TestOpenApi(TestCase):
     kwargs = {
         "intrinsics_resolver": IntrinsicsResolver({}),
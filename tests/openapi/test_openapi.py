@@ -367,6 +367,37 @@ class TestOpenApiEditor_add_auth(TestCase):
         self.editor = OpenApiEditor(self.original_openapi)
 
 
+class TestOpenApiEditor_set_default_authorizer(TestCase):
+    def setUp(self):
+        self.editor = OpenApiEditor(
+            {
+                "openapi": "3.0.1",
+                "paths": {
+                    "/foo": {"get": {_X_INTEGRATION: {"a": "b"}}, "options": {_X_INTEGRATION: {"a": "b"}}},
+                    "/bar": {"get": {_X_INTEGRATION: {"a": "b"}, "security": [{"OtherAuth": []}]}},
+                },
+            }
+        )
+
+    def test_must_set_default_authorizer_on_all_paths(self):
+        self.editor.add_lambda_integration("/baz", "ANY", "arn")
+        authorizers = {"MyAuth": {"AuthorizationScopes": ["email"]}}
+
+        self.editor.set_default_authorizer("MyAuth", authorizers, api_authorizers=authorizers)
+
+        paths = self.editor.openapi["paths"]
+        self.assertEqual(paths["/foo"]["get"]["security"], [{"MyAuth": ["email"]}])
+        self.assertNotIn("security", paths["/foo"]["options"])
+        self.assertEqual(paths["/bar"]["get"]["security"], [{"OtherAuth": []}])
+        self.assertEqual(paths["/baz"][_X_ANY_METHOD]["security"], [{"MyAuth": ["email"]}])
+
+    def test_must_fail_when_method_is_not_normalized(self):
+        self.editor.paths["/foo"] = {"any": {_X_INTEGRATION: {"a": "b"}}}
+
+        with self.assertRaises(InvalidDocumentException):
+            self.editor.set_default_authorizer("MyAuth", {"MyAuth": {}}, api_authorizers=None)
+
+
 class TestOpenApiEditor_get_integration_function(TestCase):
     def setUp(self):
 
@@ -562,6 +562,7 @@ class TestImplicitRestApiPlugin_add_api_to_swagger(TestCase):
         template_mock.get.return_value = mock_api
 
         self.plugin._add_api_to_swagger(event_id, properties, template_mock)
+        self.plugin._write_api_definitions(template_mock)
 
         SwaggerEditorMock.is_valid.assert_called_with(original_swagger)
         template_mock.get.assert_called_with("restid")
@@ -569,6 +570,34 @@ class TestImplicitRestApiPlugin_add_api_to_swagger(TestCase):
         template_mock.set.assert_called_with("restid", mock_api)
         self.assertEqual(mock_api.properties["DefinitionBody"], updated_swagger)
 
+    @patch("samtranslator.plugins.api.implicit_rest_api_plugin.SwaggerEditor")
+    def test_must_add_the_paths_of_all_events_in_one_editor(self, SwaggerEditorMock):
+        mock_api = SamResource(
+            {
+                "Type": "AWS::Serverless::Api",
+                "Properties": {"__MANAGE_SWAGGER": True, "DefinitionBody": {"swagger": "2.0"}},
+            }
+        )
+        SwaggerEditorMock.is_valid = Mock(return_value=True)
+        editor_mock = Mock()
+        editor_mock.swagger = "updated swagger"
+        SwaggerEditorMock.return_value = editor_mock
+        self.plugin.editor = SwaggerEditorMock
+        template_mock = Mock()
+        template_mock.get.return_value = mock_api
+
+        for path in ["/a", "/b", "/c"]:
+            properties = {"RestApiId": {"Ref": "restid"}, "Path": path, "Method": "GET"}
+            self.plugin._add_api_to_swagger("id", properties, template_mock)
+
+        template_mock.set.assert_not_called()
+        self.plugin._write_api_definitions(template_mock)
+
+        SwaggerEditorMock.assert_called_once_with({"swagger": "2.0"})
+        editor_mock.add_path.assert_has_calls([call("/a", "GET"), call("/b", "GET"), call("/c", "GET")])
+        template_mock.set.assert_called_once_with("restid", mock_api)
+        self.assertEqual(mock_api.properties["DefinitionBody"], "updated swagger")
+
     @patch("samtranslator.plugins.api.implicit_rest_api_plugin.SwaggerEditor")
     def test_must_work_with_rest_api_id_as_string(self, SwaggerEditorMock):
         event_id = "id"
@@ -600,6 +629,7 @@ class TestImplicitRestApiPlugin_add_api_to_swagger(TestCase):
         template_mock.get.return_value = mock_api
 
         self.plugin._add_api_to_swagger(event_id, properties, template_mock)
+        self.plugin._write_api_definitions(template_mock)
 
         SwaggerEditorMock.is_valid.assert_called_with(original_swagger)
         template_mock.get.assert_called_with("restid")
@@ -5,6 +5,7 @@ from mock import Mock, patch
 from unittest import TestCase
 from parameterized import parameterized, param
 
+from samtranslator.intrinsics.context import ResolutionContext
 from samtranslator.plugins.application.serverless_app_plugin import ServerlessAppPlugin
 from samtranslator.plugins.exceptions import InvalidPluginException
 
@@ -209,14 +210,39 @@ class TestServerlessAppPlugin_on_before_transform_template_translate(TestCase):
         response = self.plugin._sar_service_call(service_call_lambda, logical_id, app_id, semver)
         self.assertEqual(app_id, response["ApplicationId"])
 
+    @patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+    def test_sar_service_calls_must_be_recorded_in_metrics(self):
+        metrics = Mock()
+        self.plugin = ServerlessAppPlugin(metrics=metrics)
+
+        self.plugin._sar_service_call(mock_get_application, "logical_id", "app_id", "1.0.0")
+
+        dimensions = [{"Name": "Operation", "Value": "mock_get_application"}]
+        metrics.record_count.assert_called_once_with("SarCall", dimensions=dimensions)
+        name, latency = metrics.record_latency.call_args[0]
+        self.assertEqual(name, "SarCallLatency")
+        self.assertGreaterEqual(latency, 0)
+
     def test_resolve_intrinsics(self):
         self.plugin = ServerlessAppPlugin(parameters={"AWS::Region": "us-east-1"})
         mappings = {"MapA": {"us-east-1": {"SecondLevelKey1": "value1"}}}
         input = {"Fn::FindInMap": ["MapA", {"Ref": "AWS::Region"}, "SecondLevelKey1"]}
-        intrinsic_resolvers = self.plugin._get_intrinsic_resolvers(mappings)
-        output = self.plugin._resolve_location_value(input, intrinsic_resolvers)
+        resolution_context = self.plugin._get_resolution_context(mappings)
+        output = resolution_context.resolve(input)
+
+        self.assertEqual("value1", output)
+
+    def test_resolve_intrinsics_with_resolution_context(self):
+        mappings = {"MapA": {"us-east-1": {"SecondLevelKey1": "value1"}}}
+        resolution_context = ResolutionContext({"AWS::Region": "us-east-1"}, mappings)
+        self.plugin = ServerlessAppPlugin(resolution_context=resolution_context)
+
+        self.assertIs(self.plugin._get_resolution_context(mappings), resolution_context)
+        location = {"ApplicationId": {"Fn::FindInMap": ["MapA", {"Ref": "AWS::Region"}, "SecondLevelKey1"]}}
+        output = self.plugin._replace_value(location, "ApplicationId", resolution_context)
 
         self.assertEqual("value1", output)
+        self.assertEqual({"ApplicationId": "value1"}, location)
 
 
 class ApplicationResource(object):
@@ -899,6 +899,56 @@ class TestSwaggerEditor_add_auth(TestCase):
         self.assertEqual(expected, self.editor.swagger["paths"][path][method]["security"])
 
 
+class TestSwaggerEditor_set_default_auth(TestCase):
+    def setUp(self):
+        self.editor = SwaggerEditor(
+            {
+                "swagger": "2.0",
+                "paths": {
+                    "/foo": {
+                        "get": {_X_INTEGRATION: {"a": "b"}},
+                        "options": {_X_INTEGRATION: {"a": "b"}},
+                        "parameters": [],
+                    },
+                    "/bar": {"get": {_X_INTEGRATION: {"a": "b"}, "security": [{"api_key_false": []}]}},
+                },
+            }
+        )
+
+    def test_must_set_default_authorizer_on_all_paths(self):
+        self.editor.set_default_authorizer("MyAuth", {"MyAuth": {}}, add_default_auth_to_preflight=False)
+
+        paths = self.editor.swagger["paths"]
+        self.assertEqual(paths["/foo"]["get"]["security"], [{"MyAuth": []}])
+        self.assertNotIn("security", paths["/foo"]["options"])
+        self.assertEqual(paths["/bar"]["get"]["security"], [{"api_key_false": []}, {"MyAuth": []}])
+
+    def test_must_set_default_apikey_required_on_all_paths(self):
+        self.editor.set_default_apikey_required()
+
+        paths = self.editor.swagger["paths"]
+        self.assertEqual(paths["/foo"]["get"]["security"], [{"api_key": []}])
+        self.assertEqual(paths["/foo"]["options"]["security"], [{"api_key": []}])
+        self.assertEqual(paths["/bar"]["get"]["security"], [])
+
+    def test_must_include_paths_added_after_the_route_table_was_built(self):
+        self.editor.set_default_apikey_required()
+        self.editor.add_lambda_integration("/baz", "ANY", "arn")
+        self.editor.add_lambda_integration("/bar", "post", "arn")
+
+        self.editor.set_default_authorizer("MyAuth", {"MyAuth": {}})
+
+        paths = self.editor.swagger["paths"]
+        self.assertEqual(paths["/baz"][_X_ANY_METHOD]["security"], [{"MyAuth": []}])
+        self.assertEqual(paths["/bar"]["post"]["security"], [{"MyAuth": []}])
+
+    def test_must_fail_when_path_is_not_a_dictionary(self):
+        self.editor.paths["/invalid"] = ["get"]
+
+        with self.assertRaises(InvalidDocumentException):
+            self.editor.set_default_apikey_required()
+
+
 class TestSwaggerEditor_add_request_parameter_to_method(TestCase):
     def setUp(self):
         self.original_swagger = {
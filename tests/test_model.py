@@ -150,6 +150,44 @@ class TestResourceAttributes(TestCase):
         self.assertEqual(r.get_resource_attribute("UpdatePolicy"), "update")
 
 
+class TestResourceSlots(TestCase):
+    def test_properties_and_keywords_must_be_stored_in_slots(self):
+        resource = DummyResource("id")
+        resource.RequiredProperty = True
+
+        self.assertFalse(hasattr(resource, "__dict__"))
+        self.assertIsNone(resource.OptionalProperty)
+        self.assertEqual(
+            resource.to_dict(), {"id": {"Type": "AWS::Dummy::Resource", "Properties": {"RequiredProperty": True}}}
+        )
+
+    def test_subclasses_must_get_slots_for_the_properties_and_keywords_they_add(self):
+        class ChildResource(DummyResource):
+            property_types = dict(DummyResource.property_types, ChildProperty=PropertyType(False, valid_if_true))
+            _keywords = DummyResource._keywords + ["child_keyword"]
+            child_keyword = "default"
+
+        resource = ChildResource("id")
+        resource.ChildProperty = True
+
+        self.assertFalse(hasattr(resource, "__dict__"))
+        self.assertEqual(ChildResource.__slots__, ("child_keyword", "ChildProperty"))
+        self.assertEqual(resource.child_keyword, "default")
+        self.assertTrue(resource.ChildProperty)
+        with self.assertRaises(InvalidResourceException):
+            resource.UnknownProperty = True
+
+    def test_private_property_names_must_not_be_mangled(self):
+        class PrivateResource(Resource):
+            resource_type = "AWS::Dummy::Resource"
+            property_types = {"__PRIVATE": PropertyType(False, valid_if_true)}
+
+        resource = PrivateResource("id")
+        setattr(resource, "__PRIVATE", True)
+
+        self.assertTrue(getattr(resource, "__PRIVATE"))
+
+
 class TestResourceRuntimeAttributes(TestCase):
     def test_resource_must_override_runtime_attributes(self):
         class NewResource(Resource):
@@ -326,6 +364,13 @@ class TestResourceTypeResolver(TestCase):
 
         self.assertFalse(resolver.can_resolve({"Type": "AWS::Lambda::Function"}))
 
+    def test_must_import_modules_given_by_name_on_first_use(self):
+        resolver = ResourceTypeResolver("samtranslator.model.sqs")
+
+        self.assertEqual(resolver.resource_types, {})
+        self.assertTrue(resolver.can_resolve({"Type": "AWS::SQS::Queue"}))
+        self.assertEqual(resolver.resolve_resource_type({"Type": "AWS::SQS::Queue"}).__name__, "SQSQueue")
+
 
 class TestSamPluginsInResource(TestCase):
     def test_must_act_on_plugins_before_resource_creation(self):
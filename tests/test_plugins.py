@@ -285,6 +285,49 @@ class TestSamPluginsAct(TestCase):
         parent_mock.assert_has_calls([call.plugin1_hook(), call.plugin2_hook()])
 
 
+class TestSamPluginsDispatch(TestCase):
+    def setUp(self):
+        self.calls = []
+        calls = self.calls
+
+        class ResourcePlugin(BasePlugin):
+            def on_before_transform_resource(self, logical_id, resource_type, resource_properties):
+                calls.append((self.name, logical_id))
+
+        class FunctionOnlyPlugin(ResourcePlugin):
+            resource_types = {"AWS::Serverless::Function"}
+
+        self.resource_plugin_class = ResourcePlugin
+        self.function_only_plugin_class = FunctionOnlyPlugin
+
+    def test_act_must_skip_plugins_that_do_not_override_hook(self):
+        noop_plugin = BasePlugin("noop")
+        sam_plugins = SamPlugins([noop_plugin, self.resource_plugin_class("resource")])
+
+        with patch.object(BasePlugin, "on_before_transform_resource") as noop_hook:
+            sam_plugins.act(LifeCycleEvents.before_transform_resource, "Table", "AWS::Serverless::SimpleTable", {})
+            noop_hook.assert_not_called()
+
+        self.assertEqual(self.calls, [("resource", "Table")])
+
+    def test_act_must_only_call_plugins_supporting_the_resource_type(self):
+        sam_plugins = SamPlugins([self.function_only_plugin_class("function_only"), self.resource_plugin_class("all")])
+
+        sam_plugins.act(LifeCycleEvents.before_transform_resource, "Table", "AWS::Serverless::SimpleTable", {})
+        sam_plugins.act(LifeCycleEvents.before_transform_resource, "Func", "AWS::Serverless::Function", {})
+
+        self.assertEqual(self.calls, [("all", "Table"), ("function_only", "Func"), ("all", "Func")])
+
+    def test_register_must_reset_dispatch(self):
+        sam_plugins = SamPlugins([self.resource_plugin_class("first")])
+        sam_plugins.act(LifeCycleEvents.before_transform_resource, "Func", "AWS::Serverless::Function", {})
+
+        sam_plugins.register(self.resource_plugin_class("second"))
+        sam_plugins.act(LifeCycleEvents.before_transform_resource, "Func", "AWS::Serverless::Function", {})
+
+        self.assertEqual(self.calls, [("first", "Func"), ("first", "Func"), ("second", "Func")])
+
+
 class TestBasePlugin(TestCase):
     def test_initialization_should_set_name(self):
 
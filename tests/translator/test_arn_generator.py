@@ -1,4 +1,6 @@
 from unittest import TestCase
+
+import boto3
 from parameterized import parameterized
 from mock import Mock, patch
 
@@ -22,6 +24,24 @@ class TestArnGenerator(TestCase):
         with self.assertRaises(NoRegionFound):
             ArnGenerator.get_partition_name(None)
 
+    @patch("boto3.session.Session.region_name", "us-gov-west-1")
+    def test_default_boto_session_must_be_created_once(self):
+        ArnGenerator._default_boto_session = None
+
+        with patch("boto3.session.Session", wraps=boto3.session.Session) as session_class:
+            partitions = [ArnGenerator.get_partition_name(), ArnGenerator.get_partition_name()]
+
+        self.assertEqual(partitions, ["aws-us-gov", "aws-us-gov"])
+        session_class.assert_called_once_with()
+
+    def test_default_boto_session_must_be_shared(self):
+        ArnGenerator._default_boto_session = None
+
+        session = ArnGenerator.get_default_boto_session()
+
+        self.assertIsInstance(session, boto3.session.Session)
+        self.assertIs(ArnGenerator.get_default_boto_session(), session)
+
     def test_get_partition_name_from_boto_session(self):
         boto_session_mock = Mock()
         boto_session_mock.region_name = "us-east-1"
@@ -0,0 +1,170 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from mock import MagicMock, patch
+
+from samtranslator.intrinsics.context import ResolutionContext
+from samtranslator.translator.async_transform import act_async, transform_async
+from samtranslator.translator.transform import transform
+from samtranslator.plugins import BasePlugin, LifeCycleEvents, SamPlugins
+from samtranslator.plugins.application.async_serverless_app_plugin import AsyncServerlessAppPlugin
+from tests.translator.helpers import get_template_parameter_values
+
+
+class SlowSarClient(object):
+    """Stub SAR client that takes a while to answer and records how many calls were in flight at once"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def create_cloud_formation_template(self, ApplicationId=None, SemanticVersion=None):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return {
+            "ApplicationId": ApplicationId,
+            "SemanticVersion": SemanticVersion,
+            "Status": "ACTIVE",
+            "TemplateId": "id-xx-xx",
+            "TemplateUrl": "https://awsserverlessrepo-changesets-xxx.s3.amazonaws.com/" + ApplicationId,
+        }
+
+
+def make_template(application_count):
+    resources = {
+        "MyFunction": {
+            "Type": "AWS::Serverless::Function",
+            "Properties": {"CodeUri": "s3://bucket/key", "Handler": "index.handler", "Runtime": "python3.8"},
+        }
+    }
+    for i in range(application_count):
+        resources["App{}".format(i)] = {
+            "Type": "AWS::Serverless::Application",
+            "Properties": {"Location": {"ApplicationId": "app-{}".format(i), "SemanticVersion": "1.0.0"}},
+        }
+    return {"Transform": "AWS::Serverless-2016-10-31", "Resources": resources}
+
+
+def make_policy_loader():
+    policy_loader = MagicMock()
+    policy_loader.load.return_value = {
+        "AWSLambdaBasicExecutionRole": "arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole"
+    }
+    return policy_loader
+
+
+@patch("boto3.session.Session.region_name", "us-east-1")
+class TestTransformAsync(TestCase):
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.executor = ThreadPoolExecutor(max_workers=8)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        self.loop.close()
+
+    def _run(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_output_matches_synchronous_transform(self):
+        parameter_values = get_template_parameter_values()
+        expected = transform(make_template(0), parameter_values, make_policy_loader())
+
+        actual = self._run(
+            transform_async(make_template(0), parameter_values, make_policy_loader(), executor=self.executor)
+        )
+
+        self.assertEqual(actual, expected)
+
+    def test_plugins_and_translation_share_the_resolution_context(self):
+        with patch.object(
+            ResolutionContext, "from_template", wraps=ResolutionContext.from_template
+        ) as from_template_mock:
+            self._run(
+                transform_async(
+                    make_template(0), get_template_parameter_values(), make_policy_loader(), executor=self.executor
+                )
+            )
+
+        from_template_mock.assert_called_once()
+
+    def test_sar_calls_are_concurrent_and_bounded(self):
+        sar_client = SlowSarClient()
+        service_call_limit = asyncio.Semaphore(3)
+        plugin = AsyncServerlessAppPlugin(service_call_limit, executor=self.executor, sar_client=sar_client)
+
+        output = self._run(
+            transform_async(
+                make_template(6),
+                get_template_parameter_values(),
+                make_policy_loader(),
+                plugins=[plugin],
+                executor=self.executor,
+                service_call_limit=service_call_limit,
+            )
+        )
+
+        # Every application was fetched exactly once, before the synchronous translation ran
+        self.assertEqual(sar_client.calls, 6)
+        self.assertEqual(sar_client.max_in_flight, 3)
+        self.assertEqual(
+            output["Resources"]["App4"]["Properties"]["TemplateURL"],
+            "https://awsserverlessrepo-changesets-xxx.s3.amazonaws.com/app-4",
+        )
+
+    def test_slow_sar_call_does_not_block_event_loop(self):
+        sar_client = SlowSarClient(delay=0.3)
+        plugin = AsyncServerlessAppPlugin(asyncio.Semaphore(1), executor=self.executor, sar_client=sar_client)
+        ticks = []
+
+        async def ticker():
+            while sar_client.calls == 0 or sar_client.in_flight:
+                ticks.append(time.time())
+                await asyncio.sleep(0.01)
+
+        async def run_both():
+            translation = transform_async(
+                make_template(1),
+                get_template_parameter_values(),
+                make_policy_loader(),
+                plugins=[plugin],
+                executor=self.executor,
+            )
+            await asyncio.gather(translation, ticker())
+
+        self._run(run_both())
+        self.assertGreater(len(ticks), 5)
+
+
+class TestActAsync(TestCase):
+    def test_awaits_async_hooks_in_registration_order(self):
+        calls = []
+
+        class AsyncPlugin(BasePlugin):
+            async def on_before_transform_template_async(self, template):
+                await asyncio.sleep(0)
+                calls.append((self.name, template))
+
+        plugins = SamPlugins([AsyncPlugin("first"), BasePlugin("sync_only"), AsyncPlugin("second")])
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(act_async(plugins, LifeCycleEvents.before_transform_template, "template"))
+        finally:
+            loop.close()
+
+        self.assertEqual(calls, [("first", "template"), ("second", "template")])
+
+    def test_get_async_hooks_must_validate_event(self):
+        with self.assertRaises(ValueError):
+            SamPlugins().get_async_hooks("before_transform_template")
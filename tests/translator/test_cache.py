@@ -0,0 +1,322 @@
+import copy
+import datetime
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from mock import Mock, patch
+
+from samtranslator.feature_toggle.feature_toggle import (
+    FeatureToggle,
+    FeatureToggleDefaultConfigProvider,
+    FeatureToggleLocalConfigProvider,
+)
+from samtranslator.model.exceptions import InvalidDocumentException
+from samtranslator.parser.parser import Parser
+from samtranslator.translator.cache import (
+    CachedTranslation,
+    DiskCacheBackend,
+    MemoryCacheBackend,
+    TranslationCache,
+    TranslationCacheKey,
+)
+from samtranslator.translator.translator import Translator
+from samtranslator.yaml_helper import yaml_parse
+
+POLICY_MAP = {"AWSLambdaBasicExecutionRole": "arn:aws:iam::aws:policy/AWSLambdaBasicExecutionRole"}
+
+
+def make_template(handler="index.handler"):
+    return {
+        "Transform": "AWS::Serverless-2016-10-31",
+        "Parameters": {"Stage": {"Type": "String", "Default": "dev"}},
+        "Resources": {
+            "Function": {
+                "Type": "AWS::Serverless::Function",
+                "Properties": {"CodeUri": "s3://bucket/key", "Handler": handler, "Runtime": "python3.8"},
+            }
+        },
+    }
+
+
+def make_translation(template):
+    return CachedTranslation(template, {}, {}, {})
+
+
+def make_application_template():
+    template = make_template()
+    template["Resources"]["App"] = {
+        "Type": "AWS::Serverless::Application",
+        "Properties": {"Location": "https://bucket.s3.amazonaws.com/template.yaml"},
+    }
+    return template
+
+
+class TestTranslatorWithCache(TestCase):
+    def setUp(self):
+        self.cache = TranslationCache()
+        self.translator = Translator(POLICY_MAP, Parser(), cache=self.cache)
+
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_must_translate_identical_templates_once(self):
+        first = self.translator.translate(make_template(), {})
+
+        with patch("samtranslator.translator.translator.prepare_plugins") as prepare_plugins_mock:
+            second = self.translator.translate(make_template(), {})
+
+        prepare_plugins_mock.assert_not_called()
+        self.assertEqual(first, second)
+
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_hits_must_preserve_types(self):
+        template = make_template()
+        template["Mappings"] = {"Map": {"Key": {"Int": 1, "Float": 1.0, "Bool": True, "String": "1"}}}
+
+        first = self.translator.translate(copy.deepcopy(template), {})
+        second = self.translator.translate(copy.deepcopy(template), {})
+
+        self.assertEqual(len(self.cache.backend), 1)
+        self.assertEqual(
+            [type(value) for _, value in sorted(second["Mappings"]["Map"]["Key"].items())], [bool, float, int, str]
+        )
+        self.assertEqual(first, second)
+
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_keys_that_are_not_strings_must_not_share_entries_with_strings(self):
+        templates = []
+        for map_key in [1, "1", True, "true"]:
+            template = make_template()
+            template["Mappings"] = {"Map": {map_key: {"Key": "value"}}}
+            templates.append(template)
+
+        outputs = [self.translator.translate(copy.deepcopy(template), {}) for template in templates]
+
+        self.assertEqual([list(output["Mappings"]["Map"]) for output in outputs], [[1], ["1"], [True], ["true"]])
+        self.assertEqual(len(self.cache.backend), 2)
+
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_hits_must_restore_the_state_of_the_translator(self):
+        template = make_template()
+        template["Resources"]["Function"]["Properties"]["FunctionName"] = "name"
+        template["Resources"]["Function"]["Properties"]["Events"] = {
+            "Get": {"Type": "Api", "Properties": {"RestApiId": {"Ref": "Api"}, "Path": "/", "Method": "get"}}
+        }
+        template["Resources"]["Api"] = {"Type": "AWS::Serverless::Api", "Properties": {"StageName": "prod"}}
+
+        self.translator.translate(copy.deepcopy(template), {})
+        states = [(self.translator.function_names, self.translator.resource_sources)]
+        self.translator.translate(copy.deepcopy(template), {})
+        states.append((self.translator.function_names, self.translator.resource_sources))
+
+        self.assertEqual(states[0][0], {"Api": "name"})
+        self.assertEqual(states[0], states[1])
+        self.assertIs(self.translator.redeploy_restapi_parameters["function_names"], self.translator.function_names)
+
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_hits_must_return_isolated_copies(self):
+        self.translator.translate(make_template(), {})
+
+        first = self.translator.translate(make_template(), {})
+        first["Resources"].clear()
+        second = self.translator.translate(make_template(), {})
+
+        self.assertIn("Function", second["Resources"])
+
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_different_templates_or_parameters_must_not_share_entries(self):
+        self.translator.translate(make_template(), {})
+        self.translator.translate(make_template(handler="other.handler"), {})
+        self.translator.translate(make_template(), {"Stage": "prod"})
+        # Same effective parameter values as the first translation
+        self.translator.translate(make_template(), {"Stage": "dev"})
+
+        self.assertEqual(len(self.cache.backend), 3)
+
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_must_not_cache_failed_translations_or_validations(self):
+        template = make_template()
+        del template["Resources"]["Function"]["Properties"]["CodeUri"]
+        with self.assertRaises(InvalidDocumentException):
+            self.translator.translate(template, {})
+
+        Translator(POLICY_MAP, Parser(), validate_only=True, cache=self.cache).translate(make_template(), {})
+
+        self.assertEqual(len(self.cache.backend), 0)
+
+
+class TestCachedTranslationsOfTheCorpus(TestCase):
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_hits_must_be_equal_to_misses(self):
+        input_folder = os.path.join(os.path.dirname(__file__), "input")
+        translator = Translator(POLICY_MAP, Parser(), cache=TranslationCache(MemoryCacheBackend(max_entries=1)))
+        translated = 0
+        for name in sorted(os.listdir(input_folder)):
+            if name.startswith("error_") or not name.endswith(".yaml"):
+                continue
+            with open(os.path.join(input_folder, name)) as f:
+                template = yaml_parse(f)
+            translations = []
+            for _ in range(2):
+                try:
+                    template_copy = copy.deepcopy(template)
+                    output = translator.translate(template_copy, {})
+                except Exception:
+                    # Such as templates with applications, which need the Serverless Application Repository
+                    break
+                translations.append(
+                    (
+                        output,
+                        translator.function_names,
+                        translator.redeploy_restapi_parameters,
+                        translator.resource_sources,
+                        template_copy,
+                    )
+                )
+            else:
+                self.assertEqual(translations[0], translations[1], name)
+                self.assertEqual(translations[0][-1], template, name)
+                translated += 1
+        self.assertGreater(translated, 200)
+
+
+class TestTranslationCacheKey(TestCase):
+    def setUp(self):
+        self.cache = TranslationCache()
+        self.feature_toggle = FeatureToggle(FeatureToggleDefaultConfigProvider())
+
+    def get_key(self, template=None, parameter_values=None, feature_toggle=None, policy_map=None):
+        return self.cache.get_key(
+            template if template is not None else make_template(),
+            parameter_values if parameter_values is not None else {"AWS::Region": "us-east-1"},
+            feature_toggle or self.feature_toggle,
+            policy_map if policy_map is not None else POLICY_MAP,
+        )
+
+    def test_key_must_not_depend_on_the_order_of_keys(self):
+        template = make_template()
+        reordered = dict(reversed(list(template.items())))
+
+        self.assertEqual(self.get_key(template), self.get_key(reordered))
+
+    def test_key_must_change_with_the_configuration(self):
+        config_file = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
+        self.addCleanup(os.remove, config_file.name)
+        config_file.write('{"feature": {"beta": {"default": {"enabled": true}}}}')
+        config_file.close()
+
+        keys = [
+            self.get_key(),
+            self.get_key(parameter_values={"AWS::Region": "eu-west-1"}),
+            self.get_key(feature_toggle=FeatureToggle(FeatureToggleLocalConfigProvider(config_file.name))),
+            self.get_key(policy_map={}),
+        ]
+
+        self.assertEqual(len(set(key.digest for key in keys)), 4)
+        minimized_key = self.cache.get_key(
+            make_template(), {"AWS::Region": "us-east-1"}, self.feature_toggle, POLICY_MAP, minimize_output=True
+        )
+        self.assertNotEqual(minimized_key.digest, keys[0].digest)
+        with patch("samtranslator.translator.cache.__version__", "0.0.0"):
+            self.assertNotEqual(self.get_key().digest, keys[0].digest)
+
+    def test_feature_toggle_version_must_be_used_when_the_provider_has_one(self):
+        provider = Mock(config_version="1", config={})
+        first = self.get_key(feature_toggle=FeatureToggle(provider))
+        provider.config_version = "2"
+
+        self.assertNotEqual(self.get_key(feature_toggle=FeatureToggle(provider)), first)
+
+    def test_templates_with_applications_must_not_be_cached_without_ttl(self):
+        self.assertIsNone(self.get_key(make_application_template()))
+
+    def test_templates_with_applications_must_expire_after_ttl(self):
+        self.cache = TranslationCache(application_ttl=60)
+        key = self.get_key(make_application_template())
+        self.assertEqual(key.ttl, 60)
+
+        with patch("samtranslator.translator.cache.time.time", return_value=1000):
+            self.cache.put(key, make_translation({"Resources": {}}))
+        with patch("samtranslator.translator.cache.time.time", return_value=1059):
+            self.assertEqual(self.cache.get(key).template, {"Resources": {}})
+        with patch("samtranslator.translator.cache.time.time", return_value=1060):
+            self.assertIsNone(self.cache.get(key))
+
+        self.assertEqual(len(self.cache.backend), 0)
+
+    def test_template_that_cannot_be_encoded_must_not_be_cached(self):
+        template = make_template()
+        template["Resources"][1] = {}
+
+        self.assertIsNone(self.get_key(template))
+
+    def test_template_with_keys_that_are_not_strings_must_not_be_cached(self):
+        template = make_template()
+        template["Mappings"] = {"Map": {"Key": {1: "value"}}}
+
+        self.assertIsNone(self.get_key(template))
+
+    def test_template_with_values_that_are_not_json_must_not_be_cached(self):
+        template = make_template()
+        template["Metadata"] = {"Date": datetime.date(2012, 10, 17)}
+
+        self.assertIsNone(self.get_key(template))
+
+
+class TestMemoryCacheBackend(TestCase):
+    def test_must_evict_the_least_recently_used_entry(self):
+        backend = MemoryCacheBackend(max_entries=2)
+        backend.set("a", "1")
+        backend.set("b", "2")
+        backend.get("a")
+
+        backend.set("c", "3")
+
+        self.assertEqual(backend.get("a"), "1")
+        self.assertIsNone(backend.get("b"))
+        self.assertEqual(backend.get("c"), "3")
+
+    def test_must_reject_an_empty_cache(self):
+        with self.assertRaises(ValueError):
+            MemoryCacheBackend(max_entries=0)
+
+
+class TestDiskCacheBackend(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_must_share_entries_between_instances(self):
+        cache = TranslationCache(DiskCacheBackend(self.directory))
+        key = TranslationCacheKey("digest", None)
+        cache.put(key, make_translation({"Resources": {"A": {"Type": "AWS::SNS::Topic"}}}))
+
+        other = TranslationCache(DiskCacheBackend(self.directory))
+
+        self.assertEqual(other.get(key).template, {"Resources": {"A": {"Type": "AWS::SNS::Topic"}}})
+        self.assertIsNone(other.get(TranslationCacheKey("other", None)))
+
+    def test_must_evict_the_least_recently_used_entries_beyond_the_maximum_size(self):
+        backend = DiskCacheBackend(os.path.join(self.directory, "cache"), max_size=250)
+        for index, key in enumerate(["a", "b"]):
+            backend.set(key, "x" * 100)
+            os.utime(backend._get_path(key), (index, index))
+        backend.get("a")
+
+        backend.set("c", "x" * 100)
+
+        self.assertEqual(sorted(os.listdir(backend.directory)), ["a.json", "c.json"])
+
+    def test_must_not_store_entries_that_json_does_not_preserve(self):
+        backend = DiskCacheBackend(self.directory)
+        backend.set("a", {"Mappings": {"M": {1: {"Key": "value"}}}})
+
+        self.assertIsNone(backend.get("a"))
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_failed_writes_must_not_leave_temporary_files(self):
+        backend = DiskCacheBackend(self.directory)
+        with patch("samtranslator.translator.cache.replace_file", side_effect=OSError("Disk is full")):
+            backend.set("a", {"Resources": {}})
+
+        self.assertEqual(os.listdir(self.directory), [])
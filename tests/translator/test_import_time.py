@@ -0,0 +1,45 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+# Modules that importing samtranslator.translator.transform must not load, since they are loaded on first use. Also
+# checked by bin/import_time.py, along with the import time budget.
+LAZY_MODULES = [
+    "boto3",
+    "botocore",
+    "jsonschema",
+    "samtranslator.model.sam_resources",
+    "samtranslator.model.eventsources",
+    "samtranslator.model.api.api_generator",
+    "samtranslator.model.api.http_api_generator",
+    "samtranslator.model.stepfunctions",
+]
+
+
+def imported_modules(statement):
+    output = subprocess.check_output(
+        [sys.executable, "-c", statement + "; import sys; print('\\n'.join(sorted(sys.modules)))"]
+    )
+    return set(output.decode("utf-8").split())
+
+
+class TestLazyImports(TestCase):
+    def test_transform_import_does_not_load_lazy_modules(self):
+        imported = imported_modules("import samtranslator.translator.transform")
+
+        self.assertIn("samtranslator.translator.translator", imported)
+        eager = [name for name in LAZY_MODULES if name in imported]
+        self.assertEqual(eager, [])
+
+    def test_resolving_a_function_loads_sam_resources_and_event_sources_on_demand(self):
+        imported = imported_modules(
+            "from samtranslator.model import ResourceTypeResolver; "
+            "from samtranslator.model.sam_resources import SamFunction; "
+            "assert ResourceTypeResolver('samtranslator.model.sam_resources')"
+            ".resolve_resource_type({'Type': 'AWS::Serverless::Function'}) is SamFunction; "
+            "assert SamFunction.event_resolver.resolve_resource_type({'Type': 'S3'}).__name__ == 'S3'"
+        )
+
+        self.assertIn("samtranslator.model.eventsources.push", imported)
+        self.assertNotIn("samtranslator.model.api.api_generator", imported)
+        self.assertNotIn("boto3", imported)
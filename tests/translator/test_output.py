@@ -0,0 +1,126 @@
+import hashlib
+import json
+from io import StringIO
+from unittest import TestCase
+
+from mock import Mock
+
+from parameterized import parameterized
+
+from samtranslator.translator import output
+from samtranslator.translator.output import DigestWriter, write_json, write_yaml
+from samtranslator.yaml_helper import yaml_parse
+
+TEMPLATE = {
+    "AWSTemplateFormatVersion": "2010-09-09",
+    "Conditions": {"IsProd": {"Fn::Equals": [{"Ref": "Stage"}, "prod"]}},
+    "Resources": {
+        "Function": {
+            "Type": "AWS::Lambda::Function",
+            "Condition": "IsProd",
+            "Properties": {
+                "Handler": "index.handler",
+                "Role": {"Fn::GetAtt": ["FunctionRole", "Arn"]},
+                "Environment": {"Variables": {"TABLE": {"Fn::Sub": "${AWS::StackName}-table"}}},
+                "Tags": [],
+                "Layers": [{"Fn::If": ["IsProd", {"Ref": "Layer"}, {"Ref": "AWS::NoValue"}]}],
+            },
+        },
+        "Empty": {},
+    },
+    "Outputs": {"Arn": {"Value": {"Fn::GetAtt": ["Function", "Arn"]}}},
+    "Metadata": {},
+    "Count": 3,
+}
+
+
+def sha256(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class TestWriteJson(TestCase):
+    @parameterized.expand(
+        [
+            (True, lambda template: json.dumps(template, indent=2, separators=(",", ": "))),
+            (False, lambda template: json.dumps(template, separators=(",", ":"))),
+        ]
+    )
+    def test_must_write_the_same_document_as_json_dumps(self, pretty, dumps):
+        stream = StringIO()
+
+        digest = write_json(TEMPLATE, stream, pretty=pretty)
+
+        self.assertEqual(stream.getvalue(), dumps(TEMPLATE))
+        self.assertEqual(digest, sha256(stream.getvalue()))
+
+    @parameterized.expand([({},), ([],), ({"Resources": {"A": {"Type": "X"}}, 1: "non string key"},)])
+    def test_must_write_documents_that_are_not_streamed(self, template):
+        stream = StringIO()
+
+        write_json(template, stream)
+
+        self.assertEqual(json.loads(stream.getvalue()), json.loads(json.dumps(template)))
+
+    def test_must_write_in_chunks(self):
+        stream = Mock(wraps=StringIO())
+        template = {"Resources": {"Resource{}".format(i): {"Type": "AWS::SNS::Topic"} for i in range(5000)}}
+
+        digest = write_json(template, stream)
+
+        self.assertGreater(stream.write.call_count, 1)
+        self.assertEqual(json.loads(stream.getvalue()), template)
+        self.assertEqual(digest, sha256(stream.getvalue()))
+
+
+class TestWriteYaml(TestCase):
+    def test_must_write_intrinsics_in_short_form(self):
+        stream = StringIO()
+
+        digest = write_yaml(TEMPLATE, stream)
+
+        document = stream.getvalue()
+        self.assertIn("Role: !GetAtt 'FunctionRole.Arn'", document)
+        self.assertIn("Condition: IsProd", document)
+        self.assertIn("!Equals", document)
+        self.assertIn("!If", document)
+        self.assertIn("!Ref 'AWS::NoValue'", document)
+        self.assertNotIn("Fn::", document)
+        self.assertEqual(yaml_parse(document), TEMPLATE)
+        self.assertEqual(digest, sha256(document))
+
+    @parameterized.expand(
+        [
+            ({"Condition": {"StringEquals": {"aws:username": "me"}}},),
+            ({"Fn::GetAtt": "Function.Arn"},),
+            ({"Fn::GetAtt": ["Nested.Stack", "Outputs.Arn"]},),
+            ({"Ref": {"Fn::Sub": "Name"}},),
+            ({"Fn::": "value"},),
+        ]
+    )
+    def test_must_keep_the_long_form_where_the_short_form_would_not_parse_back(self, value):
+        stream = StringIO()
+
+        write_yaml({"Value": value}, stream)
+
+        self.assertEqual(yaml_parse(stream.getvalue()), {"Value": value})
+
+
+class TestDigestWriter(TestCase):
+    def test_must_buffer_small_writes(self):
+        stream = Mock(wraps=StringIO())
+        writer = DigestWriter(stream)
+
+        writer.write("a")
+        writer.write("b")
+        stream.write.assert_not_called()
+
+        self.assertEqual(writer.hexdigest(), sha256("ab"))
+        self.assertEqual(stream.getvalue(), "ab")
+
+    def test_must_write_when_the_buffer_is_full(self):
+        stream = StringIO()
+        writer = DigestWriter(stream)
+
+        writer.write("a" * output.WRITE_BUFFER_SIZE)
+
+        self.assertEqual(len(stream.getvalue()), output.WRITE_BUFFER_SIZE)
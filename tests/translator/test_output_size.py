@@ -0,0 +1,179 @@
+import copy
+import json
+from unittest import TestCase
+
+from mock import patch
+
+from samtranslator.parser.parser import Parser
+from samtranslator.translator.output_size import analyze_template_size, minimize_template
+from samtranslator.translator.translator import Translator
+
+POLICY_MAP = {"AWSLambdaBasicExecutionRole": "arn:aws:iam::aws:policy/AWSLambdaBasicExecutionRole"}
+
+SAM_TEMPLATE = {
+    "Resources": {
+        "Function": {
+            "Type": "AWS::Serverless::Function",
+            "Properties": {
+                "CodeUri": "s3://bucket/key",
+                "Handler": "index.handler",
+                "Runtime": "python3.8",
+                "Events": {
+                    "Get": {"Type": "Api", "Properties": {"Path": "/items", "Method": "get"}},
+                    "Post": {"Type": "Api", "Properties": {"Path": "/items", "Method": "post"}},
+                    "HttpGet": {"Type": "HttpApi", "Properties": {"Path": "/items", "Method": "get"}},
+                    "HttpPost": {"Type": "HttpApi", "Properties": {"Path": "/items", "Method": "post"}},
+                },
+            },
+        },
+        "StateMachine": {
+            "Type": "AWS::Serverless::StateMachine",
+            "Properties": {
+                "Role": "arn:aws:iam::123456789012:role/role",
+                "Definition": {"StartAt": "Pass", "States": {"Pass": {"Type": "Pass", "End": True}}},
+            },
+        },
+        "Topic": {"Type": "AWS::SNS::Topic"},
+    }
+}
+
+
+def get_permissions(template):
+    return dict(
+        (logical_id, resource)
+        for logical_id, resource in template["Resources"].items()
+        if resource["Type"] == "AWS::Lambda::Permission"
+    )
+
+
+def make_api_permission(function, api, method):
+    return {
+        "Type": "AWS::Lambda::Permission",
+        "Properties": {
+            "Action": "lambda:InvokeFunction",
+            "FunctionName": {"Ref": function},
+            "Principal": "apigateway.amazonaws.com",
+            "SourceArn": {
+                "Fn::Sub": [
+                    "arn:${AWS::Partition}:execute-api:${AWS::Region}:${AWS::AccountId}:${__ApiId__}/${__Stage__}/"
+                    + method
+                    + "/items",
+                    {"__ApiId__": {"Ref": api}, "__Stage__": "*"},
+                ]
+            },
+        },
+    }
+
+
+class TestTranslateWithMinimizedOutput(TestCase):
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_minimized_template_must_be_smaller_and_equivalent(self):
+        template = Translator(POLICY_MAP, Parser()).translate(copy.deepcopy(SAM_TEMPLATE), {})
+        translator = Translator(POLICY_MAP, Parser(), minimize_output=True)
+        minimized = translator.translate(copy.deepcopy(SAM_TEMPLATE), {})
+
+        self.assertLess(analyze_template_size(minimized).total_bytes, analyze_template_size(template).total_bytes)
+        self.assertEqual(
+            json.loads(minimized["Resources"]["StateMachine"]["Properties"]["DefinitionString"]),
+            SAM_TEMPLATE["Resources"]["StateMachine"]["Properties"]["Definition"],
+        )
+        permissions = get_permissions(minimized)
+        self.assertEqual(len(get_permissions(template)), 4)
+        self.assertEqual(
+            sorted(
+                permission["Properties"]["SourceArn"]["Fn::Sub"][1]["__ApiId__"]["Ref"]
+                for permission in permissions.values()
+            ),
+            ["ServerlessHttpApi", "ServerlessRestApi"],
+        )
+        for permission in permissions.values():
+            self.assertTrue(permission["Properties"]["SourceArn"]["Fn::Sub"][0].endswith(":${__ApiId__}/*"))
+            self.assertEqual(set(permission["Properties"]["SourceArn"]["Fn::Sub"][1]), {"__ApiId__"})
+
+
+class TestMinimizeTemplate(TestCase):
+    def test_permissions_of_different_functions_apis_or_conditions_must_not_be_merged(self):
+        template = {
+            "Resources": {
+                "A": make_api_permission("Function", "Api", "GET"),
+                "B": make_api_permission("Other", "Api", "GET"),
+                "C": make_api_permission("Function", "OtherApi", "GET"),
+                "D": dict(make_api_permission("Function", "Api", "POST"), Condition="Condition"),
+            }
+        }
+        expected = copy.deepcopy(template)
+
+        self.assertEqual(minimize_template(template), expected)
+
+    def test_referenced_permissions_must_be_kept(self):
+        template = {
+            "Resources": {
+                "A": make_api_permission("Function", "Api", "GET"),
+                "B": make_api_permission("Function", "Api", "POST"),
+                "C": make_api_permission("Function", "Api", "PUT"),
+                "Bucket": {"Type": "AWS::S3::Bucket", "DependsOn": ["B"]},
+            }
+        }
+
+        minimize_template(template)
+
+        self.assertEqual(sorted(template["Resources"]), ["A", "B", "Bucket"])
+
+    def test_definition_strings_that_are_not_joined_json_must_be_kept(self):
+        definition_strings = [
+            "{}",
+            {"Fn::Join": ["\n", ["{", {"Ref": "Value"}, "}"]]},
+            {"Fn::Join": ["", ["{", "}"]]},
+            {"Fn::Join": ["\n", ["not", "json"]]},
+        ]
+        template = {
+            "Resources": dict(
+                (
+                    "StateMachine{}".format(index),
+                    {"Type": "AWS::StepFunctions::StateMachine", "Properties": {"DefinitionString": definition}},
+                )
+                for index, definition in enumerate(definition_strings)
+            )
+        }
+        expected = copy.deepcopy(template)
+
+        self.assertEqual(minimize_template(template), expected)
+
+
+class TestAnalyzeTemplateSize(TestCase):
+    def test_sizes_must_add_up_to_the_compact_encoding(self):
+        template = {
+            "AWSTemplateFormatVersion": "2010-09-09",
+            "Resources": {
+                "A": make_api_permission("Function", "Api", "GET"),
+                "B": make_api_permission("Function", "Api", "POST"),
+                "Topic": {"Type": "AWS::SNS::Topic", "Properties": {"DisplayName": "été"}},
+            },
+        }
+
+        report = analyze_template_size(template, {"A": "Function", "B": "Function"})
+
+        encoded = json.dumps(template, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        self.assertEqual(report.total_bytes, len(encoded))
+        self.assertEqual(list(report.section_bytes), ["Resources", "AWSTemplateFormatVersion"])
+        self.assertEqual(list(report.resource_type_sizes), ["AWS::Lambda::Permission", "AWS::SNS::Topic"])
+        self.assertEqual(report.source_sizes["Function"].count, 2)
+        self.assertEqual(report.source_sizes["Topic"].count, 1)
+        self.assertEqual(
+            sum(entry.bytes for entry in report.source_sizes.values()) + len('"Resources":{}') + 2,
+            report.section_bytes["Resources"],
+        )
+        self.assertIn("AWS::Lambda::Permission", report.format())
+        self.assertEqual(report.to_dict()["Sources"]["Function"]["Count"], 2)
+
+    @patch("boto3.session.Session.region_name", "us-east-1")
+    def test_translator_must_record_the_sources_of_the_resources(self):
+        translator = Translator(POLICY_MAP, Parser())
+        template = translator.translate(copy.deepcopy(SAM_TEMPLATE), {})
+
+        report = analyze_template_size(template, translator.resource_sources)
+
+        self.assertEqual(translator.resource_sources["FunctionRole"], "Function")
+        self.assertEqual(translator.resource_sources["FunctionGetPermissionProd"], "Function")
+        self.assertEqual(report.source_sizes["Function"].count, 6)
+        self.assertEqual(report.source_sizes["Topic"].count, 1)
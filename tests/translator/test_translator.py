@@ -6,8 +6,10 @@ import sys
 from functools import reduce, cmp_to_key
 
 from samtranslator.translator.translator import Translator, prepare_plugins, make_policy_template_for_function_plugin
+from samtranslator.metrics.metrics import CWMetricsPublisher, Metrics
 from samtranslator.parser.parser import Parser
-from samtranslator.model.exceptions import InvalidDocumentException, InvalidResourceException
+from samtranslator.plugins.application.serverless_app_plugin import ServerlessAppPlugin
+from samtranslator.model.exceptions import ErrorCollector, InvalidDocumentException, InvalidResourceException
 from samtranslator.model import Resource
 from samtranslator.model.sam_resources import SamSimpleTable
 from samtranslator.public.plugins import BasePlugin
@@ -21,7 +23,7 @@ import pytest
 import yaml
 from unittest import TestCase
 from samtranslator.translator.transform import transform
-from mock import Mock, MagicMock, patch
+from mock import ANY, Mock, MagicMock, patch
 
 BASE_PATH = os.path.dirname(__file__)
 INPUT_FOLDER = BASE_PATH + "/input"
@@ -272,6 +274,7 @@ class TestTranslatorEndToEnd(TestCase):
                 "implicit_api_with_auth_and_conditions_max",
                 "implicit_api_with_many_conditions",
                 "implicit_and_explicit_api_with_conditions",
+                "implicit_api_with_conditional_methods_on_one_path",
                 "inline_precedence",
                 "api_with_cors_and_conditions_no_definitionbody",
                 "api_with_auth_and_conditions_all_max",
@@ -759,23 +762,64 @@ def test_transform_unhandled_failure_empty_managed_policy_map():
 def assert_metric_call(mock, transform, transform_failure=0, invalid_document=0):
     metric_dimensions = [{"Name": "Transform", "Value": transform}]
 
-    mock.put_metric_data.assert_called_once_with(
-        Namespace="ServerlessTransform",
-        MetricData=[
-            {
-                "MetricName": "TransformFailure",
-                "Value": transform_failure,
-                "Unit": "Count",
-                "Dimensions": metric_dimensions,
-            },
-            {
-                "MetricName": "InvalidDocument",
-                "Value": invalid_document,
-                "Unit": "Count",
-                "Dimensions": metric_dimensions,
-            },
-        ],
+    mock.put_metric_data.assert_called_once_with(Namespace="ServerlessTransform", MetricData=ANY)
+    metric_data = mock.put_metric_data.call_args[1]["MetricData"]
+    # Latencies and resource counts are published along with them
+    assert {
+        "MetricName": "TransformFailure",
+        "Value": transform_failure,
+        "Unit": "Count",
+        "Dimensions": metric_dimensions,
+    } in metric_data
+    assert {
+        "MetricName": "InvalidDocument",
+        "Value": invalid_document,
+        "Unit": "Count",
+        "Dimensions": metric_dimensions,
+    } in metric_data
+
+
+def make_translator_with_metrics(cloudwatch_client):
+    metrics = Metrics(
+        metrics_publisher=CWMetricsPublisher(cloudwatch_client),
+        dimensions=[{"Name": "Transform", "Value": "ServerlessTransform"}],
     )
+    return Translator({}, Parser(), metrics=metrics), metrics
+
+
+@patch("boto3.session.Session.region_name", "ap-southeast-1")
+def test_translate_must_publish_transform_metrics():
+    cloudwatch_client = Mock()
+    translator, metrics = make_translator_with_metrics(cloudwatch_client)
+
+    translator.translate({"Resources": {"Table": {"Type": "AWS::Serverless::SimpleTable"}}}, {})
+    metrics.close()
+
+    assert_metric_call(cloudwatch_client, "ServerlessTransform")
+
+
+@patch("boto3.session.Session.region_name", "ap-southeast-1")
+def test_translate_must_publish_invalid_document_metrics():
+    cloudwatch_client = Mock()
+    translator, metrics = make_translator_with_metrics(cloudwatch_client)
+
+    with pytest.raises(InvalidDocumentException):
+        translator.translate({"Resources": {"Function": {"Type": "AWS::Serverless::Function", "Properties": {}}}}, {})
+    metrics.close()
+
+    assert_metric_call(cloudwatch_client, "ServerlessTransform", invalid_document=1)
+
+
+@patch("boto3.session.Session.region_name", "ap-southeast-1")
+def test_translate_must_publish_transform_failure_metrics():
+    cloudwatch_client = Mock()
+    translator, metrics = make_translator_with_metrics(cloudwatch_client)
+
+    with patch.object(Parser, "parse", side_effect=RuntimeError("Unexpected")), pytest.raises(RuntimeError):
+        translator.translate({"Resources": {"Table": {"Type": "AWS::Serverless::SimpleTable"}}}, {})
+    metrics.close()
+
+    assert_metric_call(cloudwatch_client, "ServerlessTransform", transform_failure=1)
 
 
 @patch("boto3.session.Session.region_name", "ap-southeast-1")
@@ -968,6 +1012,120 @@ class TestTemplateValidation(TestCase):
             translator.translate(template, {})
 
 
+class TestTranslatorErrorBudget(TestCase):
+    def _transform(self, testcase, max_errors):
+        manifest = yaml_parse(open(os.path.join(INPUT_FOLDER, testcase + ".yaml"), "r"))
+        with self.assertRaises(InvalidDocumentException) as e:
+            transform(manifest, {}, MagicMock(), max_errors=max_errors)
+        return e.exception.causes
+
+    @parameterized.expand(
+        [
+            ("error_multiple_resource_errors", None, 5),
+            ("error_multiple_resource_errors", 1, 1),
+            ("error_multiple_resource_errors", 3, 3),
+            ("error_multiple_resource_errors", 10, 5),
+            # Errors of the implicit API plugin
+            ("error_function_invalid_api_event", None, 5),
+            ("error_function_invalid_api_event", 1, 1),
+        ]
+    )
+    @patch("boto3.session.Session.region_name", "ap-southeast-1")
+    @patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+    def test_must_stop_after_max_errors(self, testcase, max_errors, expected_number_of_errors):
+        causes = self._transform(testcase, max_errors)
+
+        self.assertEqual(len(causes), expected_number_of_errors)
+
+    @parameterized.expand([(None, 1), (1, 0)])
+    @patch("boto3.session.Session.region_name", "ap-southeast-1")
+    @patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+    def test_must_not_call_sar_after_an_error_when_stopping_early(self, max_errors, expected_sar_calls):
+        manifest = {
+            "Resources": {
+                "Function": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {
+                        "CodeUri": "http://not-an-s3-uri",
+                        "Handler": "index.handler",
+                        "Runtime": "python3.8",
+                    },
+                },
+                "Application": {
+                    "Type": "AWS::Serverless::Application",
+                    "Properties": {"Location": {"ApplicationId": "app", "SemanticVersion": "1.0.0"}},
+                },
+            }
+        }
+
+        def fetch_application(plugin, app_id, semver, key, logical_id):
+            plugin._applications[key] = "https://template-url"
+
+        with patch.object(
+            ServerlessAppPlugin, "_fetch_application", autospec=True, side_effect=fetch_application
+        ) as fetch_mock:
+            with self.assertRaises(InvalidDocumentException):
+                transform(manifest, {}, MagicMock(), max_errors=max_errors)
+
+        self.assertEqual(fetch_mock.call_count, expected_sar_calls)
+
+    def test_max_errors_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            ErrorCollector(0)
+
+
+class TestTranslatorValidateOnly(TestCase):
+    @patch("boto3.session.Session.region_name", "ap-southeast-1")
+    @patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+    def test_must_validate_without_building_the_template(self):
+        manifest = yaml_parse(
+            open(os.path.join(INPUT_FOLDER, "function_with_deployment_preference_all_parameters.yaml"))
+        )
+        manifest["Resources"]["Application"] = {
+            "Type": "AWS::Serverless::Application",
+            "Properties": {"Location": {"ApplicationId": "app", "SemanticVersion": "1.0.0"}},
+        }
+        translator = Translator(None, Parser(), validate_only=True)
+
+        with patch("boto3.client") as client_mock, patch.object(Resource, "to_dict") as to_dict_mock:
+            result = translator.translate(manifest, {})
+
+        self.assertIsNone(result)
+        client_mock.assert_not_called()
+        to_dict_mock.assert_not_called()
+        self.assertIn("Application", manifest["Resources"])
+
+    @parameterized.expand(
+        [("error_multiple_resource_errors",), ("error_function_invalid_api_event",), ("error_invalid_getatt",)]
+    )
+    @patch("boto3.session.Session.region_name", "ap-southeast-1")
+    @patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+    def test_must_report_the_errors_of_a_full_translation(self, testcase):
+        manifest = yaml_parse(open(os.path.join(INPUT_FOLDER, testcase + ".yaml"), "r"))
+        expected = json.load(open(os.path.join(OUTPUT_FOLDER, testcase + ".json"), "r"))
+
+        with pytest.raises(InvalidDocumentException) as e:
+            Translator(None, Parser(), validate_only=True).translate(manifest, {})
+
+        self.assertEqual(get_exception_error_message(e), expected.get("errorMessage"))
+
+    @patch("boto3.session.Session.region_name", "ap-southeast-1")
+    @patch("botocore.client.ClientEndpointBridge._check_default_region", mock_get_region)
+    def test_must_detect_invalid_properties_of_generated_resources(self):
+        manifest = {
+            "Resources": {
+                "Function": {
+                    "Type": "AWS::Serverless::Function",
+                    "Properties": {"CodeUri": "s3://bucket/key", "Handler": "index.handler", "Runtime": "python3.8"},
+                }
+            }
+        }
+
+        with patch.object(Resource, "validate_properties", side_effect=InvalidResourceException("Function", "Bad")):
+            with self.assertRaises(InvalidDocumentException):
+                Translator(None, Parser(), validate_only=True).translate(manifest, {})
+
+
 class TestPluginsUsage(TestCase):
     # Tests if plugins are properly injected into the translator
 
@@ -1047,7 +1205,12 @@ class TestPluginsUsage(TestCase):
             "MyTable", manifest["Resources"]["MyTable"], sam_plugins=sam_plugins_object_mock
         )
         prepare_plugins_mock.assert_called_once_with(
-            initial_plugins, {"AWS::Region": "ap-southeast-1", "AWS::Partition": "aws"}
+            initial_plugins,
+            {"AWS::Region": "ap-southeast-1", "AWS::Partition": "aws"},
+            max_errors=None,
+            validate_only=False,
+            metrics=None,
+            resolution_context=ANY,
         )
 
 